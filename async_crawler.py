@@ -0,0 +1,209 @@
+import asyncio
+import contextlib
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import Executor
+from crawler import SummaryCrawler, DetailCrawler, DEFAULT_PAGE_DISCOVERY
+from http_session import DEFAULT_TIMEOUT, RequestCounter
+from scheduler import RequestScheduler
+from cache import ResponseCache, RecordIndex
+from parsers import DEFAULT_PARSER, DEFAULT_SITE
+from metrics import RunMetrics
+from run_control import RunControl, CrawlCancelled
+
+try:
+    import aiohttp
+except ImportError:  # async 백엔드를 쓰지 않으면 aiohttp는 필요 없습니다.
+    aiohttp = None
+
+# 하나의 이벤트 루프에서 동시에 처리할 상세 요청 상한
+MAX_ASYNC_IN_FLIGHT = 256
+
+AsyncResponse = namedtuple("AsyncResponse", ["status_code", "headers", "text"])
+
+async def run_blocking(func, *args):
+    """
+    SQLite 캐시/색인 조회와 기록, 저널 fsync, 파싱처럼 오래 걸릴 수 있는 동기 작업을
+    기본 스레드 풀에서 실행하여 이벤트 루프(다른 요청의 송수신)를 막지 않습니다.
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+async def run_parser_async(crawler, parse, html: str):
+    """
+    BaseCrawler.run_parser의 asyncio 버전입니다. 파서 프로세스가 없으면 스레드 풀에서 파싱하여 이벤트 루프를 막지 않습니다.
+    """
+    started = time.perf_counter()
+    try:
+        if crawler.parse_pool is None:
+            return await run_blocking(parse, html)
+        return await asyncio.wrap_future(crawler.parse_pool.submit(parse, html))
+    finally:
+        crawler.metrics.add("parse", time.perf_counter() - started)
+
+class AsyncHttpClient:
+    """
+    asyncio 백엔드용 HTTP 클라이언트:
+      - 전용 스레드의 이벤트 루프 하나에서 aiohttp 세션을 운용합니다.
+      - submit()은 코루틴을 루프에 넘기고 concurrent.futures.Future를 돌려주므로,
+        동기 코드에서도 스레드를 요청마다 만들지 않고 결과를 기다릴 수 있습니다.
+      - stats()는 PooledSession과 같은 형식의 통계를 반환합니다.
+    """
+    def __init__(self, max_in_flight: int = 100, keep_alive: bool = True,
+                 timeout: float = DEFAULT_TIMEOUT):
+        if aiohttp is None:
+            raise ImportError("async 백엔드를 사용하려면 aiohttp 패키지가 필요합니다. (pip install aiohttp)")
+        self.max_in_flight = max(1, min(max_in_flight, MAX_ASYNC_IN_FLIGHT))
+        # RequestScheduler가 재시도할 네트워크 오류
+        self.retry_exceptions = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._counter = RequestCounter()
+        self._new_connections = 0
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="kapt-async-loop", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._open(), self._loop).result()
+
+    async def _open(self) -> None:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_created)
+        connector = aiohttp.TCPConnector(limit=self.max_in_flight, force_close=not self.keep_alive)
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        self._session = aiohttp.ClientSession(connector=connector,
+                                              timeout=aiohttp.ClientTimeout(total=self.timeout),
+                                              trace_configs=[trace_config])
+
+    async def _on_connection_created(self, session, context, params) -> None:
+        with self._lock:
+            self._new_connections += 1
+
+    def submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    async def get(self, url: str, params: dict = None, encoding: str = None) -> AsyncResponse:
+        """
+        GET 요청 후 상태 코드, 헤더, 본문을 반환합니다.
+        """
+        async with self._semaphore:
+            started = time.perf_counter()
+            try:
+                async with self._session.get(url, params=params) as response:
+                    body = await response.read()
+                    result = AsyncResponse(response.status, response.headers,
+                                           body.decode(encoding or response.get_encoding(), errors="replace"))
+            except Exception:
+                self._counter.record(started, error=True)
+                raise
+            self._counter.record(started, size=len(body))
+        return result
+
+    def stats(self) -> dict:
+        stats = self._counter.snapshot()
+        with self._lock:
+            stats["new_connections"] = self._new_connections
+        stats["reused_connections"] = max(0, stats["requests"] - stats["new_connections"])
+        return stats
+
+    async def _shutdown(self) -> None:
+        pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        await self._session.close()
+
+    def close(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+class AsyncSummaryCrawler(SummaryCrawler):
+    """
+    asyncio 백엔드의 목록 크롤러:
+      - 페이지 요청을 AsyncHttpClient의 이벤트 루프에서 처리하고,
+        파싱은 SummaryCrawler와 같은 파서(및 파서 프로세스 풀)를 사용합니다.
+    """
+    def __init__(self, base_url: str, page_type_index: int = 0, client: AsyncHttpClient = None,
+                 scheduler: RequestScheduler = None, parser: str = DEFAULT_PARSER, parse_pool: Executor = None,
+                 page_discovery: str = DEFAULT_PAGE_DISCOVERY, metrics: RunMetrics = None,
+                 control: RunControl = None, site: str = DEFAULT_SITE):
+        super().__init__(base_url, page_type_index=page_type_index, session=client, scheduler=scheduler,
+                         parser=parser, parse_pool=parse_pool, page_discovery=page_discovery, metrics=metrics,
+                         control=control, site=site)
+        self.client = client
+
+    async def fetch_page_async(self, url: str, params: dict = None) -> str:
+        await self.control.checkpoint_async()
+        try:
+            response = await self.metrics.request_async(
+                lambda send: self.scheduler.execute_async(send, url, self.client.retry_exceptions, self.control),
+                lambda: self.client.get(url, params=params, encoding="utf-8"))
+        except CrawlCancelled:
+            raise
+        except Exception:
+            return None
+        if response.status_code != 200:
+            return None
+        return response.text
+
+    def fetch_page(self, url: str, params: dict = None) -> str:
+        return self.client.submit(self.fetch_page_async(url, params)).result()
+
+    async def load_page_async(self, user_input_url: str, page_no: int) -> tuple:
+        base_url, params = self.page_request(user_input_url, page_no)
+        html = await self.fetch_page_async(base_url, params)
+        return await run_parser_async(self, self.parser.parse_listing, html) if html else None
+
+    def _page_executor(self, workers: int):
+        return contextlib.nullcontext(self.client)
+
+    def _submit_page(self, executor, user_input_url: str, page_no: int):
+        return executor.submit(self.load_page_async(user_input_url, page_no))
+
+class AsyncDetailCrawler(DetailCrawler):
+    """
+    asyncio 백엔드의 상세정보 크롤러:
+      - 상세 페이지를 이벤트 루프에서 받아오고, 파싱은 DetailCrawler와 같은 파서(및 파서 프로세스 풀)를 사용합니다.
+      - 응답 캐시/레코드 색인(SQLite) 조회와 기록은 run_blocking으로 스레드 풀에서 처리합니다.
+    """
+    max_concurrency = MAX_ASYNC_IN_FLIGHT
+
+    def __init__(self, page_type_index: int = 0, client: AsyncHttpClient = None,
+                 scheduler: RequestScheduler = None, cache: ResponseCache = None, parser: str = DEFAULT_PARSER,
+                 parse_pool: Executor = None, columns: list = None, record_index: RecordIndex = None,
+                 metrics: RunMetrics = None, control: RunControl = None):
+        super().__init__(page_type_index=page_type_index, session=client, scheduler=scheduler, cache=cache,
+                         parser=parser, parse_pool=parse_pool, columns=columns, record_index=record_index,
+                         metrics=metrics, control=control)
+        self.client = client
+
+    async def crawl_detail_page_async(self, url: str) -> dict:
+        record = await run_blocking(self._indexed_record, url) if self.record_index else None
+        if record is not None:
+            return record
+        html = await run_blocking(self._cached_html, url) if self.cache else None
+        if html is None:
+            await self.control.checkpoint_async()
+            try:
+                response = await self.metrics.request_async(
+                    lambda send: self.scheduler.execute_async(send, url, self.client.retry_exceptions,
+                                                              self.control),
+                    lambda: self.client.get(url))
+            except CrawlCancelled:
+                raise
+            except Exception as e:
+                raise Exception(f"상세 페이지 로드 실패: {e}")
+            if response.status_code != 200:
+                raise Exception(f"상세 페이지 로드 실패: HTTP {response.status_code}")
+            html = response.text
+            if self.cache:
+                await run_blocking(self._store_html, url, html)
+        data = await run_parser_async(self, self.parser.parse_detail, html)
+        if self.record_index:
+            await run_blocking(self._index_record, url, data)
+        return data
+
+    def crawl_detail_page(self, url: str) -> dict:
+        return self.client.submit(self.crawl_detail_page_async(url)).result()
@@ -0,0 +1,332 @@
+import os
+import json
+import time
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+from http_session import PooledSession, SessionView, format_stats
+from scheduler import RequestScheduler, DEFAULT_RATE_LIMIT, DEFAULT_MAX_RETRIES
+from cache import (ResponseCache, ResponseCacheView, RecordIndex, RecordIndexView, DEFAULT_CACHE_PATH,
+                   DEFAULT_TTL_DAYS, DEFAULT_MAX_MB)
+from worker import CrawlerWorker, SharedResources
+from metrics import RunMetrics, start_metrics_server
+from progress import format_progress, LOG_PROGRESS_INTERVAL
+from run_control import RunControl
+from utils import read_json_with_encoding
+
+DEFAULT_PARALLEL_JOBS = 3
+# 모든 작업을 합친 동시 요청 상한
+DEFAULT_CONNECTION_BUDGET = 16
+# 데몬이 대기열 폴더를 다시 확인하는 간격(초)
+DEFAULT_POLL_SECONDS = 5.0
+
+BatchJobResult = namedtuple("BatchJobResult", ["name", "ok", "result", "elapsed"])
+
+def list_job_files(folder_path: str) -> list:
+    """
+    폴더 안의 JSON 설정 파일 경로를 이름순으로 반환합니다.
+    """
+    return sorted(os.path.join(folder_path, f) for f in os.listdir(folder_path) if f.endswith('.json'))
+
+def format_batch_summary(results: list, elapsed: float) -> list:
+    """
+    작업별 결과 요약표를 로그 줄 목록으로 만듭니다.
+    """
+    lines = ["=== 작업 요약 ===", "상태 | 소요 시간 | 설정 파일 | 결과"]
+    for r in results:
+        lines.append(f"{'완료' if r.ok else '실패'} | {r.elapsed:8.1f}초 | {r.name} | {r.result}")
+    ok_count = sum(1 for r in results if r.ok)
+    lines.append(f"총 {len(results)}개 작업 (완료 {ok_count}개, 실패 {len(results) - ok_count}개), "
+                 f"전체 소요 시간 {elapsed:.1f}초")
+    return lines
+
+class BatchRunner:
+    """
+    여러 JSON 설정 작업을 동시에 실행하는 일괄 실행기:
+      - 최대 parallel_jobs개의 CrawlerWorker를 동시에 실행합니다.
+      - 모든 작업이 연결 풀, 요청 스케줄러, 응답 캐시, 레코드 색인을 공유하므로 작업 수와 관계없이
+        전체 동시 요청은 connection_budget, 호스트별 초당 요청은 rate_limit(기본 DEFAULT_RATE_LIMIT)을 넘지 않습니다.
+        (작업별 rate_limit, max_retries, cache_max_mb 설정 대신 일괄 실행 설정을 사용합니다.)
+      - 작업 로그 앞에 [설정 파일 이름]을 붙이고, 끝나면 작업별 결과 요약표를 출력합니다.
+      - 작업별 진행 상황을 LOG_PROGRESS_INTERVAL초마다 로그로 출력합니다.
+      - metrics_port가 0이 아니면 실행 중인 작업별 지표와 진행 상황, 전체 연결 통계를
+        http://127.0.0.1:<metrics_port>/metrics 로 보여 줍니다.
+      - 모든 작업이 control(RunControl)을 공유합니다. cancel()하면 실행 중인 작업은 지금까지의 결과를 저장하고 멈추며,
+        아직 시작하지 않은 작업은 실행하지 않습니다. (모두 ok=False, 결과 "취소됨")
+    """
+    def __init__(self, job_files: list, log_callback=None, parallel_jobs: int = DEFAULT_PARALLEL_JOBS,
+                 connection_budget: int = DEFAULT_CONNECTION_BUDGET, rate_limit: float = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES, metrics_port: int = 0, control: RunControl = None):
+        self.job_files = list(job_files)
+        self.log_callback = log_callback
+        self.parallel_jobs = max(1, parallel_jobs)
+        self.connection_budget = max(1, connection_budget)
+        # 호스트별 요청 상한은 동시 작업 수와 관계없이 한 작업을 실행할 때와 같습니다. (명시적으로 줄 때만 높아집니다)
+        self.rate_limit = rate_limit if rate_limit is not None else DEFAULT_RATE_LIMIT
+        self.max_retries = max_retries
+        self.metrics_port = metrics_port
+        self.control = control if control is not None else RunControl()
+        self.session = None
+        self.scheduler = None
+        self.response_cache = None
+        self.record_index = None
+        self._log_lock = threading.Lock()
+        self._metrics_server = None
+        # 실행 중인 작업 이름 -> CrawlerWorker
+        self._active_jobs = {}
+        self._completed_jobs = 0
+
+    def _log(self, msg: str, level: str = "info") -> None:
+        if self.log_callback:
+            with self._log_lock:
+                self.log_callback(msg, level)
+
+    def open(self) -> None:
+        """
+        작업들이 공유할 연결 풀, 요청 스케줄러, 응답 캐시, 레코드 색인을 만듭니다.
+        """
+        self.session = PooledSession(pool_size=self.connection_budget)
+        self.scheduler = RequestScheduler(rate_limit=self.rate_limit, max_retries=self.max_retries,
+                                          max_concurrency=self.connection_budget, log_callback=self._log)
+        self.response_cache = ResponseCache(DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_MB * 1024 * 1024)
+        self.record_index = self._make_record_index()
+        self._metrics_server = start_metrics_server(self.metrics_port, self.metrics_snapshot, self._log)
+
+    def _make_record_index(self) -> RecordIndex:
+        # 이번 일괄 실행에서 이미 수집한 상세 레코드는 신선도 기간과 관계없이 재사용합니다.
+        return RecordIndex(batch_started=time.time())
+
+    def close(self) -> None:
+        self._log(f"전체 연결 통계: {format_stats(self.session.stats())}, "
+                  f"재시도 {self.scheduler.stats()['retries']}회")
+        if self._metrics_server:
+            self._metrics_server.stop()
+            self._metrics_server = None
+        self.session.close()
+        self.response_cache.close()
+        self.record_index.close()
+
+    def cancel(self) -> None:
+        self.control.cancel()
+
+    def _job_cache(self, settings: dict) -> ResponseCacheView:
+        """
+        작업이 쓸 공유 응답 캐시를 반환합니다. 작업이 다른 cache_path를 쓰면 None(작업이 직접 엽니다)을 반환합니다.
+        """
+        if settings.get("cache_path", DEFAULT_CACHE_PATH) != self.response_cache.path:
+            return None
+        return ResponseCacheView(self.response_cache,
+                                 ttl_seconds=settings.get("cache_ttl_days", DEFAULT_TTL_DAYS) * 86400)
+
+    def metrics_snapshot(self) -> dict:
+        """
+        실행 중인 작업별 지표와 공유 연결 풀/스케줄러 통계를 반환합니다. (지표 엔드포인트 응답)
+        """
+        with self._log_lock:
+            active = dict(self._active_jobs)
+            completed = self._completed_jobs
+        return {"jobs": {name: worker.live_snapshot() for name, worker in active.items()},
+                "completed_jobs": completed,
+                "connections": self.session.stats(),
+                "scheduler": self.scheduler.stats()}
+
+    def run(self) -> list:
+        """
+        모든 작업을 실행하고 설정 파일 순서대로 BatchJobResult 목록을 반환합니다.
+        """
+        if not self.job_files:
+            self._log("실행할 JSON 설정 파일이 없습니다.")
+            return []
+        self._log(f"작업 {len(self.job_files)}개 실행: 동시 작업 {self.parallel_jobs}개, "
+                  f"전체 동시 요청 한도 {self.connection_budget}")
+        started = time.perf_counter()
+        self.open()
+        try:
+            with ThreadPoolExecutor(max_workers=self.parallel_jobs, thread_name_prefix="kapt-job") as executor:
+                results = list(executor.map(self.run_job, self.job_files))
+        finally:
+            self.close()
+        for line in format_batch_summary(results, time.perf_counter() - started):
+            self._log(line)
+        return results
+
+    def run_job(self, json_file: str, name: str = None) -> BatchJobResult:
+        """
+        설정 파일 하나를 공유 자원으로 실행합니다. 실패해도 예외 대신 ok=False인 결과를 반환합니다.
+        """
+        name = name or os.path.basename(json_file)
+
+        def job_log(msg: str, level: str = "info") -> None:
+            self._log(f"[{name}] {msg}", level)
+
+        def job_progress(update) -> None:
+            job_log(format_progress(update))
+
+        if self.control.cancelled:
+            return BatchJobResult(name, False, "취소됨", 0.0)
+        started = time.perf_counter()
+        try:
+            settings = read_json_with_encoding(json_file)
+        except Exception as e:
+            job_log(f"설정 파일 읽기 실패: {e}", "error")
+            return BatchJobResult(name, False, f"설정 파일 읽기 실패: {e}", 0.0)
+        job_log("작업 시작")
+        try:
+            shared = SharedResources(session=SessionView(self.session), scheduler=self.scheduler,
+                                     cache=self._job_cache(settings), record_index=RecordIndexView(self.record_index),
+                                     metrics=RunMetrics())
+            worker = CrawlerWorker.from_settings(settings, log_callback=job_log, shared=shared,
+                                                 progress_callback=job_progress,
+                                                 progress_interval=LOG_PROGRESS_INTERVAL, control=self.control)
+            with self._log_lock:
+                self._active_jobs[name] = worker
+            result = worker.run()
+        except Exception as e:
+            job_log(f"크롤링 실패: {e}", "error")
+            return BatchJobResult(name, False, str(e), time.perf_counter() - started)
+        finally:
+            with self._log_lock:
+                self._active_jobs.pop(name, None)
+                self._completed_jobs += 1
+        if worker.cancelled:
+            job_log(f"크롤링 취소: {result}")
+            return BatchJobResult(name, False, result, time.perf_counter() - started)
+        job_log(f"크롤링 완료: 결과 파일 -> {result}")
+        return BatchJobResult(name, True, result, time.perf_counter() - started)
+
+class JobQueueDaemon(BatchRunner):
+    """
+    대기열 폴더를 감시하며 들어오는 설정 파일을 계속 실행하는 상주 실행기 (Qt 없이 동작):
+      - queue_dir에 넣은 *.json 파일을 들어온 순서대로, 최대 parallel_jobs개씩 동시에 실행합니다.
+      - 실행을 시작하면 running/, 끝나면 done/ 또는 failed/ 폴더로 설정 파일을 옮기고,
+        status/<작업 ID>.json에 상태, 시작/종료 시각, 결과 파일 또는 오류를 기록합니다.
+      - 연결 풀, 요청 스케줄러, 레코드 색인은 데몬이 떠 있는 동안 모든 작업이 공유합니다.
+        (레코드 재사용은 각 설정의 신선도 기간을 따릅니다.)
+      - stop()을 호출하면 새 작업을 꺼내지 않고, 실행 중인 작업이 끝나는 대로 종료합니다.
+        cancel()은 새 작업을 꺼내지 않는 것에 더해 실행 중인 작업도 지금까지의 결과를 저장하고 멈춥니다.
+      - once=True이면 대기열이 빌 때까지만 실행하고 종료합니다.
+      - 한 대기열 폴더에는 데몬 하나만 실행합니다.
+    """
+    def __init__(self, queue_dir: str, log_callback=None, parallel_jobs: int = DEFAULT_PARALLEL_JOBS,
+                 connection_budget: int = DEFAULT_CONNECTION_BUDGET, rate_limit: float = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES, poll_seconds: float = DEFAULT_POLL_SECONDS,
+                 once: bool = False, metrics_port: int = 0):
+        super().__init__([], log_callback=log_callback, parallel_jobs=parallel_jobs,
+                         connection_budget=connection_budget, rate_limit=rate_limit, max_retries=max_retries,
+                         metrics_port=metrics_port)
+        self.queue_dir = queue_dir
+        self.poll_seconds = poll_seconds
+        self.once = once
+        self._stop = threading.Event()
+        for folder in ("running", "done", "failed", "status"):
+            os.makedirs(os.path.join(queue_dir, folder), exist_ok=True)
+
+    def _make_record_index(self) -> RecordIndex:
+        return RecordIndex()
+
+    @property
+    def stopping(self) -> bool:
+        return self._stop.is_set()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def cancel(self) -> None:
+        self.stop()
+        super().cancel()
+
+    def _queued_jobs(self) -> list:
+        jobs = []
+        for path in list_job_files(self.queue_dir):
+            try:
+                jobs.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+        return [path for _, path in sorted(jobs)]
+
+    def _claim(self, path: str) -> tuple:
+        """
+        대기 중인 설정 파일을 running/으로 옮기고 (작업 ID, 옮긴 경로)를 반환합니다.
+        그 사이 파일이 사라졌으면 None을 반환합니다.
+        """
+        stem = os.path.splitext(os.path.basename(path))[0]
+        job_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{stem}"
+        running_path = os.path.join(self.queue_dir, "running", job_id + ".json")
+        counter = 1
+        while os.path.exists(running_path):
+            running_path = os.path.join(self.queue_dir, "running", f"{job_id}_{counter}.json")
+            counter += 1
+        try:
+            os.replace(path, running_path)
+        except OSError:
+            return None
+        return os.path.splitext(os.path.basename(running_path))[0], running_path
+
+    def _write_status(self, job_id: str, **status) -> None:
+        path = os.path.join(self.queue_dir, "status", job_id + ".json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"job_id": job_id, **status}, f, ensure_ascii=False, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def _finish_file(self, job_id: str, path: str, state: str) -> None:
+        os.replace(path, os.path.join(self.queue_dir, state, job_id + ".json"))
+
+    def _recover_interrupted(self) -> None:
+        """
+        이전 데몬이 실행 도중 종료되어 running/에 남은 작업을 실패로 정리합니다.
+        """
+        for path in list_job_files(os.path.join(self.queue_dir, "running")):
+            job_id = os.path.splitext(os.path.basename(path))[0]
+            self._finish_file(job_id, path, "failed")
+            self._write_status(job_id, state="failed", error="이전 데몬이 작업 도중 종료되어 완료되지 않았습니다.")
+            self._log(f"[{job_id}] 이전 실행에서 완료되지 않은 작업을 실패로 옮겼습니다.", "error")
+
+    def _run_claimed(self, job_id: str, path: str) -> BatchJobResult:
+        started_at = datetime.now().isoformat(timespec="seconds")
+        self._write_status(job_id, state="running", started_at=started_at)
+        result = self.run_job(path, name=job_id)
+        state = "done" if result.ok else "failed"
+        self._finish_file(job_id, path, state)
+        status = {"state": state, "started_at": started_at,
+                  "finished_at": datetime.now().isoformat(timespec="seconds"),
+                  "elapsed_seconds": round(result.elapsed, 1)}
+        status["result" if result.ok else "error"] = result.result
+        self._write_status(job_id, **status)
+        return result
+
+    def run(self) -> list:
+        """
+        stop()이 호출되거나(once=True이면 대기열이 빌 때까지) 대기열의 작업을 실행하고,
+        실행한 작업의 BatchJobResult 목록을 반환합니다.
+        """
+        self._log(f"작업 대기열 감시 시작: {self.queue_dir} (동시 작업 {self.parallel_jobs}개, "
+                  f"전체 동시 요청 한도 {self.connection_budget})")
+        self._recover_interrupted()
+        started = time.perf_counter()
+        results = []
+        running = set()
+        self.open()
+        try:
+            with ThreadPoolExecutor(max_workers=self.parallel_jobs, thread_name_prefix="kapt-job") as executor:
+                while True:
+                    finished = {future for future in running if future.done()}
+                    results.extend(future.result() for future in finished)
+                    running -= finished
+                    queued = [] if self._stop.is_set() else self._queued_jobs()
+                    for path in queued[:self.parallel_jobs - len(running)]:
+                        claimed = self._claim(path)
+                        if claimed:
+                            running.add(executor.submit(self._run_claimed, *claimed))
+                    if not running and (self._stop.is_set() or (self.once and not queued)):
+                        break
+                    if running:
+                        wait(running, timeout=self.poll_seconds, return_when=FIRST_COMPLETED)
+                    else:
+                        self._stop.wait(self.poll_seconds)
+        finally:
+            self.close()
+        for line in format_batch_summary(results, time.perf_counter() - started):
+            self._log(line)
+        self._log("작업 대기열 감시 종료")
+        return results
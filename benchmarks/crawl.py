@@ -0,0 +1,219 @@
+"""
+크롤링 처리량 벤치마크:
+  - mock_server의 로컬 K-apt 서버를 띄우고, CrawlerWorker 모드(1: 목록+상세, 2: 목록, 3: 결과 파일 -> 상세)를
+    모드마다 새 파이썬 프로세스에서 실행합니다. 모드 3은 모드 2의 결과 파일을 입력으로 씁니다.
+  - 캐시와 레코드 색인은 끄고 실행하므로 매번 모든 페이지를 실제로 요청합니다.
+  - 모드별로 소요 시간, 페이지/초(목록+상세 정상 응답), 행/초(결과 파일의 행 수), 응답 시간 p50/p95,
+    최대 RSS를 출력합니다. (최대 RSS는 resource 모듈이 없는 Windows에서는 표시하지 않습니다.)
+  - --save로 결과를 JSON으로 저장하고, --baseline으로 저장해 둔 결과와 비교합니다.
+    행/초가 기준보다 --tolerance 비율 이상 떨어진 모드가 있으면 종료 코드 1로 실패합니다.
+    저장한 JSON에는 모드별 단계 시간(네트워크, 대기, 파싱, 입력 읽기, 파일 기록)도 들어갑니다.
+
+사용법: python benchmarks/crawl.py [--modes 1,2,3] [--pages 10] [--rows 10] [--latency 0.05]
+        [--error-rate 0.05] [--concurrency 4] [--backend asyncio] [--save base.json] [--baseline base.json]
+"""
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from mock_server import MockKaptServer, LISTING_PATHS, DETAIL_PATHS
+
+# 페이지 유형별 목록 경로 (CrawlerWorker._make_auto_url과 같은 순서)
+LISTING_URLS = ["/bid/privateContractList.do", "/bid/bidList.do?type=3", "/bid/bidList.do"]
+MODE_NAMES = {1: "목록+상세", 2: "목록", 3: "파일->상세"}
+
+CHILD_CODE = """
+import json, os, sys, time
+sys.path.insert(0, {repo!r})
+from worker import CrawlerWorker
+from output_formats import read_rows
+try:
+    import resource
+except ImportError:
+    resource = None
+settings = json.loads(sys.stdin.read())
+log = (lambda msg, level="info": print(msg, file=sys.stderr)) if {verbose!r} else None
+worker = CrawlerWorker.from_settings(settings, log_callback=log)
+started = time.perf_counter()
+output = worker.run()
+elapsed = time.perf_counter() - started
+peak_rss_mb = None
+if resource is not None:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss_mb = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+rows = len(read_rows(output)[0]) if os.path.exists(output) else 0
+print(json.dumps({{"output": os.path.abspath(output) if os.path.exists(output) else None, "elapsed": elapsed,
+                  "rows": rows, "peak_rss_mb": peak_rss_mb, "stats": worker.connection_stats,
+                  "stages": worker.run_report["stages"]}}))
+"""
+
+def run_child(settings: dict, workdir: str, verbose: bool) -> dict:
+    """
+    새 프로세스에서 settings로 CrawlerWorker를 실행하고 그 결과(JSON)를 반환합니다.
+    """
+    code = CHILD_CODE.format(repo=REPO_ROOT, verbose=verbose)
+    completed = subprocess.run([sys.executable, "-c", code], cwd=workdir, input=json.dumps(settings),
+                               stdout=subprocess.PIPE, stderr=None if verbose else subprocess.PIPE, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"모드 {settings['mode']} 실행 실패:\n{completed.stderr or ''}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def _served(before: dict, after: dict, paths: tuple) -> int:
+    names = [path.rsplit("/", 1)[-1] for path in paths]
+    return sum(after.get(name, 0) - before.get(name, 0) for name in names)
+
+def measure_mode(server: MockKaptServer, settings: dict, workdir: str, verbose: bool) -> dict:
+    """
+    한 모드를 실행하고 서버 응답 수와 함께 처리량 지표를 계산합니다.
+    """
+    before = server.stats()
+    child = run_child(settings, workdir, verbose)
+    after = server.stats()
+    elapsed = child["elapsed"]
+    listing_pages = _served(before, after, LISTING_PATHS)
+    detail_pages = _served(before, after, DETAIL_PATHS)
+    stats = child["stats"] or {}
+    return {
+        "mode": settings["mode"],
+        "output": child["output"],
+        "elapsed": elapsed,
+        "listing_pages": listing_pages,
+        "detail_pages": detail_pages,
+        "errors": after.get("errors", 0) - before.get("errors", 0),
+        "rows": child["rows"],
+        "pages_per_sec": (listing_pages + detail_pages) / elapsed if elapsed else 0.0,
+        "rows_per_sec": child["rows"] / elapsed if elapsed else 0.0,
+        "p50_ms": stats.get("p50_latency", 0.0) * 1000,
+        "p95_ms": stats.get("p95_latency", 0.0) * 1000,
+        "peak_rss_mb": child["peak_rss_mb"],
+        "stages": child["stages"],
+    }
+
+def format_results(results: list) -> list:
+    lines = ["모드 | 소요 시간 | 목록/상세 페이지 | 503 | 행 | 페이지/초 | 행/초 | p50 | p95 | 최대 RSS"]
+    for r in results:
+        rss = f"{r['peak_rss_mb']:.0f}MB" if r["peak_rss_mb"] is not None else "-"
+        lines.append(f"{r['mode']} ({MODE_NAMES[r['mode']]}) | {r['elapsed']:.2f}초 | "
+                     f"{r['listing_pages']}/{r['detail_pages']} | {r['errors']} | {r['rows']} | "
+                     f"{r['pages_per_sec']:.1f} | {r['rows_per_sec']:.1f} | "
+                     f"{r['p50_ms']:.0f}ms | {r['p95_ms']:.0f}ms | {rss}")
+    return lines
+
+def compare_with_baseline(results: list, baseline: dict, config: dict, tolerance: float) -> bool:
+    """
+    기준 결과와 모드별 행/초, 페이지/초를 비교해 출력합니다. 행/초가 tolerance 비율 이상 떨어지면 False를 반환합니다.
+    """
+    if baseline.get("config") != config:
+        print("주의: 기준 결과와 벤치마크 설정이 다릅니다. 비교 결과를 그대로 믿기 어렵습니다.")
+    base_by_mode = {r["mode"]: r for r in baseline.get("results", [])}
+    ok = True
+    print("=== 기준 결과와 비교 ===")
+    for r in results:
+        base = base_by_mode.get(r["mode"])
+        if not base or not base["rows_per_sec"]:
+            print(f"모드 {r['mode']}: 기준 결과 없음")
+            continue
+        change = r["rows_per_sec"] / base["rows_per_sec"] - 1
+        pages_change = (r["pages_per_sec"] / base["pages_per_sec"] - 1) if base["pages_per_sec"] else 0.0
+        regressed = change < -tolerance
+        ok = ok and not regressed
+        print(f"[{'실패' if regressed else '통과'}] 모드 {r['mode']}: 행/초 {base['rows_per_sec']:.1f} -> "
+              f"{r['rows_per_sec']:.1f} ({change:+.1%}), 페이지/초 {pages_change:+.1%}")
+    return ok
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="로컬 K-apt 서버로 크롤링 처리량을 측정합니다.")
+    parser.add_argument("--modes", default="1,2,3", help="실행할 모드 (쉼표로 구분)")
+    parser.add_argument("--page-type", type=int, default=0, choices=(0, 1, 2),
+                        help="페이지 유형 (0: 수의계약, 1: 입찰공고 type=3, 2: 입찰공고)")
+    parser.add_argument("--pages", type=int, default=10, help="목록 페이지 수")
+    parser.add_argument("--rows", type=int, default=10, help="페이지당 행 수")
+    parser.add_argument("--count", type=int, default=0, help="수집할 행 수 (0이면 전체)")
+    parser.add_argument("--latency", type=float, default=0.05, help="서버 응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="서버 응답 지연 편차(±초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="서버가 HTTP 503으로 응답할 확률")
+    parser.add_argument("--no-last-link", action="store_true", help="페이지 목록에서 마지막 페이지 링크를 뺍니다.")
+    parser.add_argument("--seed", type=int, default=1, help="지연/오류 난수 시드")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--backend", default="thread", choices=("thread", "asyncio"))
+    parser.add_argument("--parser", default="lxml", choices=("lxml", "bs4"))
+    parser.add_argument("--page-discovery", default="pagination", choices=("pagination", "probe"))
+    parser.add_argument("--output-format", default="xlsx", choices=("xlsx", "parquet", "csv.gz", "jsonl"))
+    parser.add_argument("--rate-limit", type=float, default=0, help="호스트별 초당 요청 수 (0이면 제한 없음)")
+    parser.add_argument("--save", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON 파일")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용하는 행/초 하락 비율")
+    parser.add_argument("--verbose", action="store_true", help="크롤러 로그를 표준 오류로 출력합니다.")
+    args = parser.parse_args()
+
+    from parsers import detail_schema
+    modes = [int(m) for m in args.modes.split(",") if m.strip()]
+    if any(m not in MODE_NAMES for m in modes):
+        parser.error("--modes는 1, 2, 3 중에서 고르세요.")
+    config = {key: getattr(args, key) for key in
+              ("page_type", "pages", "rows", "count", "latency", "jitter", "error_rate", "no_last_link", "seed",
+               "concurrency", "backend", "parser", "page_discovery", "output_format", "rate_limit")}
+
+    server = MockKaptServer(pages=args.pages, rows=args.rows, latency=args.latency, jitter=args.jitter,
+                            error_rate=args.error_rate, last_link=not args.no_last_link, seed=args.seed)
+    base_settings = {
+        "url": server.url + LISTING_URLS[args.page_type],
+        # 상세정보 링크도 로컬 서버로 보냅니다.
+        "site": server.url,
+        "page_type_index": args.page_type,
+        "extraction_count": args.count or args.pages * args.rows,
+        # 상세 페이지 파싱까지 측정하도록 모든 상세 컬럼을 고릅니다.
+        "selected_detail_columns": detail_schema(args.page_type).fields,
+        "concurrency": args.concurrency,
+        "backend": args.backend,
+        "parser": args.parser,
+        "page_discovery": args.page_discovery,
+        "output_format": args.output_format,
+        "rate_limit": args.rate_limit,
+        "use_cache": False,
+        "use_record_index": False,
+        "metrics_report": False,
+    }
+    print(f"로컬 서버: {server.url} (목록 {args.pages}쪽 x {args.rows}행, 지연 {args.latency}초"
+          f"±{args.jitter}, 오류율 {args.error_rate})")
+    results = []
+    with server, tempfile.TemporaryDirectory() as workdir:
+        summary_file = None
+        for mode in modes:
+            settings = dict(base_settings, mode=mode)
+            if mode == 3:
+                if summary_file is None:
+                    # 모드 3의 입력 파일을 준비합니다. (측정 결과에는 넣지 않습니다.)
+                    summary_file = run_child(dict(base_settings, mode=2), workdir, args.verbose)["output"]
+                settings["selected_excel_path"] = summary_file
+            try:
+                result = measure_mode(server, settings, workdir, args.verbose)
+            except RuntimeError as e:
+                print(e)
+                return 1
+            if mode == 2:
+                summary_file = result["output"]
+            results.append(result)
+    for line in format_results(results):
+        print(line)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"config": config, "results": [dict(r, output=None) for r in results]}, f,
+                      ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.save}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if not compare_with_baseline(results, baseline, config, args.tolerance):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""
+벤치마크용 로컬 K-apt 서버:
+  - fixtures/에 기록해 둔 privateContractList.do, bidList.do, privateContractDetail.do, bidDetail.do
+    페이지를 템플릿으로 삼아, 번호마다 값이 다른 목록/상세 페이지를 응답합니다.
+  - 목록은 pages쪽 x rows행이며, 마지막 페이지 뒤는 "조회된 데이터가 없습니다" 행만 있는 빈 목록입니다.
+  - 요청마다 latency(±jitter)초 지연하고, error_rate 확률로 HTTP 503을 응답합니다.
+  - last_link=False이면 페이지 목록에서 "마지막" 링크를 빼서 실제 사이트처럼 처음 10쪽만 보이게 합니다.
+  - /__stats는 경로별 응답 수를 JSON으로 반환합니다.
+
+사용법: python benchmarks/mock_server.py [--port 8765] [--pages 10] [--rows 10] [--latency 0.05]
+        [--jitter 0.02] [--error-rate 0.1] [--no-last-link]
+"""
+import os
+import json
+import time
+import random
+import argparse
+import threading
+from string import Template
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+# 실제 사이트와 같이 한 번에 보여 주는 페이지 링크 수
+PAGE_LINKS_PER_BLOCK = 10
+LISTING_PATHS = ("/bid/privateContractList.do", "/bid/bidList.do")
+DETAIL_PATHS = ("/bid/privateContractDetail.do", "/bid/bidDetail.do")
+
+def _load_fixture(name: str) -> Template:
+    with open(os.path.join(FIXTURE_DIR, name), encoding="utf-8") as f:
+        return Template(f.read())
+
+class MockKaptServer:
+    """
+    백그라운드 스레드에서 실행하는 로컬 K-apt 서버 (with 문으로 사용하면 블록을 벗어날 때 종료합니다)
+    """
+    def __init__(self, pages: int = 10, rows: int = 10, latency: float = 0.05, jitter: float = 0.0,
+                 error_rate: float = 0.0, last_link: bool = True, host: str = "127.0.0.1", port: int = 0,
+                 seed: int = None):
+        self.pages = max(1, pages)
+        self.rows = max(1, rows)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.last_link = last_link
+        self.templates = {name: _load_fixture(name + ".html") for name in
+                          ("private_contract_list", "private_contract_row", "private_contract_detail",
+                           "bid_list", "bid_row", "bid_detail", "empty_row", "pagination")}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._counts = {}
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockKaptServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """
+        현재 스레드에서 서버를 실행합니다. (KeyboardInterrupt로 종료)
+        """
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def stats(self) -> dict:
+        """
+        지금까지의 응답 수를 반환합니다: {"경로": 정상 응답 수, ..., "errors": 503 응답 수}
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+    def _delay(self) -> bool:
+        with self._lock:
+            delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+            failed = self._random.random() < self.error_rate
+        time.sleep(max(0.0, delay))
+        return failed
+
+    # --- 페이지 생성 ---
+
+    def _pagination(self, page_no: int) -> str:
+        block_start = (page_no - 1) // PAGE_LINKS_PER_BLOCK * PAGE_LINKS_PER_BLOCK + 1
+        block_end = min(self.pages, block_start + PAGE_LINKS_PER_BLOCK - 1)
+        links = "\n".join(f'      <a class="page{" on" if p == page_no else ""}" href="javascript:goList({p})">{p}</a>'
+                          for p in range(block_start, block_end + 1))
+        last = f'      <a class="last" href="javascript:goList({self.pages})">마지막</a>' if self.last_link else ""
+        return self.templates["pagination"].substitute(prev=max(1, block_start - 1),
+                                                       next=min(self.pages, block_end + 1), links=links, last=last)
+
+    def _private_contract_values(self, n: int) -> dict:
+        return {"id": f"P{n:07d}", "no": n, "apt": f"한빛{n}단지아파트", "company": f"(주)대한관리{n % 37}",
+                "title": f"{n}동 승강기 유지보수 용역", "date": f"2025-{n % 12 + 1:02d}-{n % 28 + 1:02d}",
+                "amount": f"{1000000 + n * 1370:,}", "period": "2025-01-01 ~ 2025-12-31"}
+
+    def _bid_values(self, n: int) -> dict:
+        return {"id": f"B{n:07d}", "no": n, "kind": "일반" if n % 5 else "긴급", "method": "적격심사" if n % 2 else "최저낙찰",
+                "title": f"{n}동 외벽 재도장 공사", "deadline": f"2025-{n % 12 + 1:02d}-{n % 28 + 1:02d}",
+                "state": "진행중" if n % 3 else "마감", "apt": f"푸른숲{n}단지", "date": f"2025-{n % 12 + 1:02d}-01"}
+
+    def _listing(self, path: str, query: dict) -> str:
+        page_no = int(query.get("pageNo", ["1"])[0] or 1)
+        private = path == LISTING_PATHS[0]
+        row_template = self.templates["private_contract_row" if private else "bid_row"]
+        total = self.pages * self.rows
+        if page_no <= self.pages:
+            first = total - (page_no - 1) * self.rows
+            values = self._private_contract_values if private else self._bid_values
+            rows = "".join(row_template.substitute(values(n)) for n in range(first, first - self.rows, -1))
+        else:
+            rows = self.templates["empty_row"].substitute(colspan=7 if private else 8)
+        page = self.templates["private_contract_list" if private else "bid_list"]
+        return page.substitute(page=page_no, type=query.get("type", [""])[0], total=total, rows=rows,
+                               pagination=self._pagination(page_no))
+
+    def _detail(self, path: str, query: dict) -> str:
+        private = path == DETAIL_PATHS[0]
+        detail_id = query.get("pcNum" if private else "bidNum", [""])[0]
+        if not detail_id[1:].isdigit():
+            return None
+        n = int(detail_id[1:])
+        common = {"manager": f"(주)우리주택관리{n % 53}", "address": f"서울특별시 강남구 테헤란로 {n}",
+                  "phone": f"02-555-{n % 10000:04d}", "fax": f"02-556-{n % 10000:04d}", "buildings": n % 20 + 1,
+                  "households": (n % 20 + 1) * 84, "ceo": f"김대표{n % 97}", "company_phone": f"031-700-{n % 10000:04d}",
+                  "business_no": f"{n % 1000:03d}-81-{n % 100000:05d}", "company_address": f"경기도 성남시 분당구 {n}번길",
+                  "registered": "2025-01-02"}
+        if private:
+            values = self._private_contract_values(n)
+            return self.templates["private_contract_detail"].substitute(
+                common, **values, category="용역", reason="공동주택 관리규약에 따른 기존 사업자와의 재계약")
+        values = self._bid_values(n)
+        return self.templates["bid_detail"].substitute(
+            common, id=values["id"], apt=values["apt"], title=values["title"], kind=values["kind"],
+            method=values["method"], deadline=values["deadline"], category="공사", briefing="2025-01-10 14:00",
+            deposit=f"{n * 10000:,}", content=f"{values['title']} 입찰 공고입니다. 참가 자격은 공고문을 참조하십시오.",
+            company=f"(주)새빛건설{n % 41}", contract_date=values["date"], amount=f"{n * 250000:,}")
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # keep-alive 연결에서 헤더와 본문을 따로 보내면 Nagle/지연 ACK로 요청마다 약 40ms가 더해집니다.
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, body: str, content_type: str = "text/html; charset=UTF-8") -> None:
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                if parsed.path == "/__stats":
+                    self._send(200, json.dumps(server.stats()), "application/json")
+                    return
+                if server._delay():
+                    server._count("errors")
+                    self._send(503, "Service Unavailable", "text/plain")
+                    return
+                query = parse_qs(parsed.query)
+                body = None
+                if parsed.path in LISTING_PATHS:
+                    body = server._listing(parsed.path, query)
+                elif parsed.path in DETAIL_PATHS:
+                    body = server._detail(parsed.path, query)
+                if body is None:
+                    self._send(404, "Not Found", "text/plain")
+                    return
+                server._count(parsed.path.rsplit("/", 1)[-1])
+                self._send(200, body)
+
+        return Handler
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="벤치마크용 로컬 K-apt 서버를 실행합니다.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765, help="0이면 빈 포트를 고릅니다.")
+    parser.add_argument("--pages", type=int, default=10, help="목록 페이지 수")
+    parser.add_argument("--rows", type=int, default=10, help="페이지당 행 수")
+    parser.add_argument("--latency", type=float, default=0.05, help="응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="응답 지연 편차(±초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 503으로 응답할 확률 (0~1)")
+    parser.add_argument("--no-last-link", action="store_true", help="페이지 목록에서 마지막 페이지 링크를 뺍니다.")
+    args = parser.parse_args()
+
+    server = MockKaptServer(pages=args.pages, rows=args.rows, latency=args.latency, jitter=args.jitter,
+                            error_rate=args.error_rate, last_link=not args.no_last_link,
+                            host=args.host, port=args.port)
+    print(f"{server.url} 에서 실행 중 (종료: Ctrl+C)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+시작 시간 벤치마크:
+  - 진입 경로(CLI 설정 파일 실행, batch/daemon, 도움말)마다 새 파이썬 프로세스를 띄워
+    프로세스 전체 시간과 모듈을 불러오는 시간을 잽니다.
+  - 그 경로에서 미리 불러오면 안 되는 무거운 모듈(PyQt5, pandas, openpyxl, pyarrow, bs4, aiohttp)이
+    로드되었거나, 프로세스 시간 중앙값이 --budget-ms를 넘으면 종료 코드 1로 실패합니다.
+
+사용법: python benchmarks/startup.py [--repeat 5] [--budget-ms 1000]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 진입 경로 이름, 그 경로가 시작할 때 실행하는 import 문
+ENTRY_POINTS = [
+    ("CLI 설정 파일 실행", "import main; from worker import CrawlerWorker"),
+    ("batch/daemon", "import main; import batch"),
+    ("도움말", "import main"),
+]
+HEAVY_MODULES = ("PyQt5", "pandas", "openpyxl", "pyarrow", "bs4", "aiohttp")
+
+CHILD_CODE = """
+import json, sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"import_seconds": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+def measure(statement: str) -> dict:
+    """
+    새 프로세스에서 statement를 실행하고 (프로세스 시간, import 시간, 로드된 무거운 모듈)을 반환합니다.
+    """
+    code = CHILD_CODE.format(statement=statement, heavy=HEAVY_MODULES)
+    started = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True,
+                            check=True).stdout
+    process_seconds = time.perf_counter() - started
+    result = json.loads(output.strip().splitlines()[-1])
+    result["process_seconds"] = process_seconds
+    return result
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="진입 경로별 시작 시간을 측정합니다.")
+    parser.add_argument("--repeat", type=int, default=5, help="경로마다 반복 측정 횟수 (중앙값 사용)")
+    parser.add_argument("--budget-ms", type=float, default=1000.0, help="프로세스 시간 중앙값 상한(밀리초)")
+    args = parser.parse_args()
+
+    baseline = statistics.median(measure("pass")["process_seconds"] for _ in range(args.repeat))
+    print(f"파이썬 인터프리터 시작: {baseline * 1000:.0f}ms")
+    failed = False
+    for name, statement in ENTRY_POINTS:
+        runs = [measure(statement) for _ in range(args.repeat)]
+        process_ms = statistics.median(r["process_seconds"] for r in runs) * 1000
+        import_ms = statistics.median(r["import_seconds"] for r in runs) * 1000
+        heavy = sorted({m for r in runs for m in r["heavy"]})
+        status = "통과"
+        if heavy or process_ms > args.budget_ms:
+            status = "실패"
+            failed = True
+        print(f"[{status}] {name}: 프로세스 {process_ms:.0f}ms, import {import_ms:.0f}ms"
+              + (f", 불필요하게 로드된 모듈: {', '.join(heavy)}" if heavy else ""))
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+import os
+import json
+import sqlite3
+import threading
+import time
+
+DEFAULT_CACHE_PATH = os.path.join("cache", "detail_cache.sqlite3")
+DEFAULT_TTL_DAYS = 7
+DEFAULT_MAX_MB = 500
+# 적중 시 갱신할 마지막 사용 시각은 모아 두었다가 이 건수나 시간(초)마다 한 번에 기록합니다.
+ACCESS_FLUSH_ROWS = 100
+ACCESS_FLUSH_SECONDS = 5.0
+
+class ResponseCache:
+    """
+    상세 페이지 HTML을 디스크(SQLite)에 보관하는 캐시:
+      - (종류, 상세 ID) 단위로 저장합니다. 예: ("pcNum", "12345"), ("bidNum", "67890")
+      - ttl_seconds가 지난 항목은 없는 것으로 취급합니다.
+      - 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 지웁니다.
+      - 적중할 때마다 쓰기(commit)를 하지 않도록 마지막 사용 시각은 메모리에 모아 두었다가
+        ACCESS_FLUSH_ROWS건/ACCESS_FLUSH_SECONDS초마다, 그리고 put()(크기 정리 전)과 close()에서 한 번에 기록합니다.
+    """
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_seconds: float = DEFAULT_TTL_DAYS * 86400,
+                 max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " kind TEXT NOT NULL, detail_id TEXT NOT NULL, html TEXT NOT NULL, size INTEGER NOT NULL,"
+            " fetched_at REAL NOT NULL, last_access REAL NOT NULL, PRIMARY KEY (kind, detail_id))")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses (last_access)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self._pending_access = {}
+        self._last_flush = time.monotonic()
+
+    def get(self, kind: str, detail_id: str, ttl_seconds: float = None) -> str:
+        """
+        저장된 HTML을 반환합니다. ttl_seconds를 주면 캐시 기본값 대신 그 유효 기간을 적용합니다.
+        """
+        now = time.time()
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            row = self._conn.execute("SELECT html, fetched_at FROM responses WHERE kind = ? AND detail_id = ?",
+                                     (kind, detail_id)).fetchone()
+            if row is None or now - row[1] > ttl:
+                self.misses += 1
+                return None
+            self._pending_access[(kind, detail_id)] = now
+            if (len(self._pending_access) >= ACCESS_FLUSH_ROWS
+                    or time.monotonic() - self._last_flush >= ACCESS_FLUSH_SECONDS):
+                self._flush_access()
+                self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def _flush_access(self) -> None:
+        # 모아 둔 마지막 사용 시각을 기록합니다. (잠금을 잡은 상태에서 호출하며, commit은 호출한 쪽에서 합니다)
+        if self._pending_access:
+            self._conn.executemany("UPDATE responses SET last_access = ? WHERE kind = ? AND detail_id = ?",
+                                   [(at, kind, detail_id) for (kind, detail_id), at in self._pending_access.items()])
+            self._pending_access = {}
+        self._last_flush = time.monotonic()
+
+    def put(self, kind: str, detail_id: str, html: str) -> None:
+        now = time.time()
+        size = len(html.encode("utf-8"))
+        with self._lock:
+            self._flush_access()
+            old = self._conn.execute("SELECT size FROM responses WHERE kind = ? AND detail_id = ?",
+                                     (kind, detail_id)).fetchone()
+            self._conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                               (kind, detail_id, html, size, now, now))
+            self._total_bytes += size - (old[0] if old else 0)
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute("SELECT kind, detail_id, size FROM responses "
+                                      "ORDER BY last_access LIMIT 100").fetchall()
+            if not rows:
+                self._total_bytes = 0
+                return
+            for kind, detail_id, size in rows:
+                self._conn.execute("DELETE FROM responses WHERE kind = ? AND detail_id = ?", (kind, detail_id))
+                self._total_bytes -= size
+                if self._total_bytes <= self.max_bytes:
+                    return
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "bytes": self._total_bytes}
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_access()
+            self._conn.commit()
+            self._conn.close()
+
+class ResponseCacheView:
+    """
+    여러 작업이 동시에 공유하는 ResponseCache를 한 작업 전용으로 감쌉니다:
+      - 하나의 캐시(연결, 전체 크기 집계)를 공유하므로 동시에 실행해도 크기 상한(max_bytes)이 지켜집니다.
+      - 유효 기간은 작업 설정(ttl_seconds)을 따르고, 적중/미적중 건수는 이 작업 것만 따로 집계합니다.
+    """
+    def __init__(self, cache: ResponseCache, ttl_seconds: float = None):
+        self.cache = cache
+        self.path = cache.path
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, detail_id: str) -> str:
+        html = self.cache.get(kind, detail_id, ttl_seconds=self.ttl_seconds)
+        with self._lock:
+            if html is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return html
+
+    def put(self, kind: str, detail_id: str, html: str) -> None:
+        self.cache.put(kind, detail_id, html)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+DEFAULT_RECORD_INDEX_PATH = os.path.join("cache", "detail_records.sqlite3")
+DEFAULT_RECORD_FRESH_HOURS = 24
+# 신선도 기간은 작업마다 다를 수 있으므로, 이보다 오래된 레코드만 정리합니다.
+RECORD_RETENTION_DAYS = 30
+
+class RecordIndex:
+    """
+    상세 ID별 파싱 결과(레코드) 색인:
+      - (종류, 상세 ID) -> 레코드(JSON)와 수집 시각을 SQLite에 저장하며, 여러 작업과 실행이 함께 사용합니다.
+      - fresh_seconds 안에 수집했거나 batch_started(폴더 일괄 실행 시작 시각) 이후에 수집한 레코드는
+        상세 페이지를 다시 요청하지 않고 재사용합니다.
+      - 작업마다 추출하는 컬럼이 다르므로, 필요한 컬럼을 모두 가진 레코드만 재사용하고
+        새로 받은 컬럼은 기존 레코드에 합칩니다.
+    """
+    def __init__(self, path: str = DEFAULT_RECORD_INDEX_PATH,
+                 fresh_seconds: float = DEFAULT_RECORD_FRESH_HOURS * 3600, batch_started: float = None):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.path = path
+        self.fresh_seconds = fresh_seconds
+        self.batch_started = batch_started
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS records ("
+            " kind TEXT NOT NULL, detail_id TEXT NOT NULL, record TEXT NOT NULL, fetched_at REAL NOT NULL,"
+            " PRIMARY KEY (kind, detail_id))")
+        retention = max(self.fresh_seconds, RECORD_RETENTION_DAYS * 86400)
+        self._conn.execute("DELETE FROM records WHERE fetched_at < ?", (time.time() - retention,))
+        self._conn.commit()
+
+    def _oldest_usable(self, now: float) -> float:
+        oldest = now - self.fresh_seconds
+        if self.batch_started is not None:
+            oldest = min(oldest, self.batch_started)
+        return oldest
+
+    def _load(self, kind: str, detail_id: str, now: float) -> dict:
+        row = self._conn.execute("SELECT record, fetched_at FROM records WHERE kind = ? AND detail_id = ?",
+                                 (kind, detail_id)).fetchone()
+        if row is None or row[1] < self._oldest_usable(now):
+            return None
+        return {"record": json.loads(row[0]), "fetched_at": row[1]}
+
+    def get(self, kind: str, detail_id: str, columns: list) -> dict:
+        """
+        재사용할 수 있고 columns를 모두 가진 레코드가 있으면 그 컬럼만 담아 반환합니다. 없으면 None을 반환합니다.
+        """
+        with self._lock:
+            entry = self._load(kind, detail_id, time.time())
+            if entry is None or any(col not in entry["record"] for col in columns):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return {col: entry["record"][col] for col in columns}
+
+    def put(self, kind: str, detail_id: str, record: dict) -> None:
+        now = time.time()
+        with self._lock:
+            entry = self._load(kind, detail_id, now)
+            fetched_at = now
+            if entry is not None:
+                # 합친 레코드는 가장 오래된 컬럼의 수집 시각을 따릅니다.
+                record = {**entry["record"], **record}
+                fetched_at = entry["fetched_at"]
+            self._conn.execute("INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?)",
+                               (kind, detail_id, json.dumps(record, ensure_ascii=False), fetched_at))
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+class RecordIndexView:
+    """
+    여러 작업이 동시에 공유하는 RecordIndex를 한 작업 전용으로 감쌉니다:
+      - 조회/저장은 공유 색인으로 보내고, 재사용/새로 수집 건수는 이 작업 것만 따로 집계합니다.
+    """
+    def __init__(self, index: RecordIndex):
+        self.index = index
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, detail_id: str, columns: list) -> dict:
+        record = self.index.get(kind, detail_id, columns)
+        with self._lock:
+            if record is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return record
+
+    def put(self, kind: str, detail_id: str, record: dict) -> None:
+        self.index.put(kind, detail_id, record)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
@@ -0,0 +1,81 @@
+import os
+import json
+import hashlib
+import threading
+
+DEFAULT_CHECKPOINT_DIR = os.path.join("cache", "checkpoints")
+DEFAULT_CHECKPOINT_EVERY = 20
+
+def checkpoint_path(identity: dict, folder: str = DEFAULT_CHECKPOINT_DIR) -> str:
+    """
+    작업 설정(모드, URL/엑셀 경로, 페이지 유형, 선택 컬럼 등)이 같으면 같은 저널 경로를 반환합니다.
+    """
+    digest = hashlib.sha1(json.dumps(identity, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+    return os.path.join(folder, f"{digest[:16]}.jsonl")
+
+class DetailJournal:
+    """
+    상세정보 크롤링 체크포인트 저널:
+      - 완료된 상세 항목(키, 파싱 결과)을 JSONL 파일에 한 줄씩 추가합니다.
+      - every건마다 디스크에 강제로 기록(fsync)하여, 중단되더라도 그 지점부터 이어서 실행할 수 있습니다.
+      - resume=False이면 기존 저널을 지우고 새로 시작합니다. (resume이면 잘린 마지막 줄을 지우고 이어 씁니다)
+    """
+    def __init__(self, path: str, resume: bool = False, every: int = DEFAULT_CHECKPOINT_EVERY):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.path = path
+        self.every = max(1, every)
+        self._lock = threading.Lock()
+        self._done = {}
+        self._unsynced = 0
+        if resume and os.path.exists(path):
+            complete = 0
+            with open(path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # 중단 시점에 잘린 마지막 줄
+                    complete += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self._done[entry["key"]] = entry["data"]
+            # 잘린 줄 뒤에 이어 쓰면 다음 항목까지 깨지므로, 마지막 완전한 줄까지만 남깁니다.
+            if complete < os.path.getsize(path):
+                os.truncate(path, complete)
+        self._file = open(path, "a" if resume else "w", encoding="utf-8")
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def get(self, key: str) -> dict:
+        with self._lock:
+            return self._done.get(key)
+
+    def record(self, key: str, data: dict) -> None:
+        with self._lock:
+            self._done[key] = data
+            self._file.write(json.dumps({"key": key, "data": data}, ensure_ascii=False) + "\n")
+            self._unsynced += 1
+            if self._unsynced >= self.every:
+                self._sync()
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._sync()
+                self._file.close()
+
+    def discard(self) -> None:
+        """
+        작업이 끝까지 완료되면 저널을 삭제합니다.
+        """
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
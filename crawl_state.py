@@ -0,0 +1,74 @@
+import os
+import json
+import tempfile
+import threading
+from datetime import datetime
+from urllib.parse import urlparse, parse_qs, urlencode
+
+DEFAULT_STATE_PATH = os.path.join("cache", "crawl_state.json")
+# 검색 조건과 무관한 쿼리 파라미터 (페이지 번호, 타임스탬프)
+IGNORED_PARAMS = {"pageNo", "dTime"}
+# 페이지 유형/검색 조건별로 기억할 최근 항목 수
+MAX_SEEN_IDS = 50
+
+def state_key(page_type_index: int, url: str, mode: int) -> str:
+    """
+    실행 모드, 페이지 유형, URL의 검색 조건으로 상태 키를 만듭니다. pageNo, dTime은 무시합니다.
+    모드마다 결과물이 다르므로(목록만 / 목록 + 상세) 한 모드의 기록이 다른 모드의 수집을 멈추지 않도록 키를 나눕니다.
+    """
+    parsed = urlparse(url)
+    query = {k: v for k, v in parse_qs(parsed.query, keep_blank_values=True).items() if k not in IGNORED_PARAMS}
+    return f"{mode}|{page_type_index}|{parsed.path}?{urlencode(sorted(query.items()), doseq=True)}"
+
+# 같은 프로세스에서 동시에 끝난 작업(batch/daemon)들이 상태 파일을 번갈아 덮어쓰지 않도록 모든 CrawlState가 공유합니다.
+_state_lock = threading.Lock()
+
+class CrawlState:
+    """
+    증분 크롤링용 수집 기록(high-water mark):
+      - 상태 키별로 가장 최근에 수집한 항목 ID들을 JSON 파일에 저장합니다.
+      - 다음 실행에서는 이 ID를 만나는 순간 페이지 탐색을 멈춥니다.
+      - update()는 잠금을 잡은 채 파일을 다시 읽어 합친 뒤 저장하므로, 동시에 끝난 작업의 기록도 잃지 않습니다.
+    """
+    def __init__(self, path: str = DEFAULT_STATE_PATH):
+        self.path = path
+        with _state_lock:
+            self._data = self._load()
+
+    def _load(self) -> dict:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def seen_ids(self, key: str) -> set:
+        with _state_lock:
+            return set(self._data.get(key, {}).get("seen_ids", []))
+
+    def update(self, key: str, new_ids: list) -> None:
+        """
+        새로 수집한 항목 ID(최신순, row_id 값)를 기존 기록 앞에 추가하고 파일에 저장합니다.
+        """
+        with _state_lock:
+            self._data = self._load()
+            entry = self._data.get(key, {})
+            ids = list(new_ids) + entry.get("seen_ids", [])
+            unique_ids = list(dict.fromkeys(i for i in ids if i))[:MAX_SEEN_IDS]
+            self._data[key] = {"seen_ids": unique_ids, "updated_at": datetime.now().isoformat(timespec="seconds")}
+            folder = os.path.dirname(self.path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            # 임시 파일은 작업마다 따로 만들어, 다른 작업이 옮기는 중인 파일을 건드리지 않게 합니다.
+            fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(self.path) + ".", suffix=".tmp",
+                                            dir=folder or ".")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._data, f, ensure_ascii=False, indent=4)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
@@ -1,276 +1,426 @@
-import re
-import requests
-from bs4 import BeautifulSoup
+import math
+from collections import deque
+from typing import TYPE_CHECKING
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from urllib.parse import urlparse, parse_qs
+from http_session import PooledSession
+from scheduler import RequestScheduler
+from cache import ResponseCache, RecordIndex
+from parsers import DEFAULT_PARSER, DEFAULT_SITE, make_parser, make_soup
+from metrics import RunMetrics
+from progress import ProgressTracker
+from run_control import RunControl, CrawlCancelled
+
+if TYPE_CHECKING:
+    # 타입 표기용입니다. 실행 중에는 기존 호환용 get_soup을 부를 때만 parsers.make_soup에서 불러옵니다.
+    from bs4 import BeautifulSoup
+
+# 사이트 부하를 고려한 목록/상세 페이지 동시 요청 상한
+MAX_PAGE_WORKERS = 8
+MAX_DETAIL_WORKERS = 16
+
+# 마지막 페이지 확인 방식:
+#   - pagination: 첫 페이지의 "마지막" 링크(없으면 보이는 페이지 번호 중 최댓값)를 그대로 사용
+#   - probe: pageNo를 지수적으로 늘려 빈 페이지를 찾은 뒤 이분 탐색으로 정확한 마지막 페이지를 확인
+PAGE_DISCOVERY_MODES = ("pagination", "probe")
+DEFAULT_PAGE_DISCOVERY = "pagination"
+
+class _ProbeFailed(Exception):
+    pass
+
+def parse_detail_id(url: str) -> tuple:
+    """
+    상세정보 링크에서 (종류, 상세 ID)를 추출합니다. 예: ("pcNum", "12345")
+    """
+    query = parse_qs(urlparse(url).query)
+    for kind in ("pcNum", "bidNum"):
+        value = query.get(kind, [""])[0]
+        if value:
+            return kind, value
+    return None
+
+def row_id(row: dict) -> str:
+    """
+    목록 행의 식별자: 상세 ID(pcNum/bidNum)가 있으면 그것을, 없으면 순번을 사용합니다.
+    """
+    key = parse_detail_id(row.get("상세정보링크") or "")
+    return key[1] if key else str(row.get("순번", ""))
 
 class BaseCrawler:
     """
     기본 크롤러 클래스:
-      - URL 요청 및 BeautifulSoup 객체 생성을 담당합니다.
+      - URL 요청을 담당합니다. HTML 해석은 parsers 모듈의 파서가 맡습니다.
+      - session을 넘기면 여러 크롤러가 같은 연결 풀을 공유합니다.
+      - 모든 요청은 scheduler(속도 제한, 백오프 재시도, 동시 요청 한도)를 거칩니다.
+      - parse_pool(ProcessPoolExecutor)을 넘기면 파싱을 별도 프로세스에서 처리합니다.
+      - 요청 시도별 응답 시간, 재시도, 대기 시간과 파싱 시간을 metrics(RunMetrics)에 기록합니다.
+      - 요청을 보내기 전마다 control(RunControl)을 확인하여, 일시정지 중이면 기다리고 취소되면 CrawlCancelled를 발생시킵니다.
     """
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, session: PooledSession = None, scheduler: RequestScheduler = None,
+                 parse_pool: Executor = None, metrics: RunMetrics = None, control: RunControl = None):
         self.base_url = base_url
+        self.session = session if session is not None else PooledSession()
+        self.scheduler = scheduler if scheduler is not None else RequestScheduler()
+        self.parse_pool = parse_pool
+        self.metrics = metrics if metrics is not None else RunMetrics()
+        self.control = control if control is not None else RunControl()
+
+    def run_parser(self, parse, html: str):
+        """
+        parse(html)을 실행합니다. parse_pool이 있으면 파서 프로세스에 HTML을 넘기고 결과(dict/list)를 기다립니다.
+        """
+        with self.metrics.stage("parse"):
+            if self.parse_pool is None:
+                return parse(html)
+            return self.parse_pool.submit(parse, html).result()
+
+    def request(self, url: str, params: dict = None):
+        self.control.checkpoint()
+        return self.metrics.request(
+            lambda send: self.scheduler.execute(send, url, self.session.retry_exceptions, self.control),
+            lambda: self.session.get(url, params=params))
 
     def fetch_page(self, url: str, params: dict = None) -> str:
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.request(url, params)
             response.encoding = 'utf-8'
             if response.status_code != 200:
                 return None
             return response.text
+        except CrawlCancelled:
+            raise
         except Exception:
             return None
 
-    def get_soup(self, url: str, params: dict = None) -> BeautifulSoup:
+    def get_soup(self, url: str, params: dict = None) -> "BeautifulSoup":
+        """
+        기존 호환용: 페이지를 받아 BeautifulSoup 객체로 반환합니다. 로드에 실패하면 None을 반환합니다.
+        """
         html = self.fetch_page(url, params)
-        if html:
-            return BeautifulSoup(html, "lxml")
-        return None
+        return make_soup(html) if html else None
 
 class SummaryCrawler(BaseCrawler):
     """
     목록 데이터 크롤러:
       - 지정된 URL에서 페이지별 데이터를 수집합니다.
+      - parser: "lxml"(기본, 빠른 파서) 또는 "bs4"(기존 BeautifulSoup 파서)
+      - page_discovery: 마지막 페이지 확인 방식 ("pagination" 또는 "probe", PAGE_DISCOVERY_MODES 참고)
+      - site: 상세정보 링크를 만들 사이트 (기본 DEFAULT_SITE, 로컬 서버로 측정하는 벤치마크만 바꿉니다)
     """
-    def __init__(self, base_url: str, page_type_index: int = 0):
-        super().__init__(base_url)
+    max_concurrency = MAX_PAGE_WORKERS
+
+    def __init__(self, base_url: str, page_type_index: int = 0, session: PooledSession = None,
+                 scheduler: RequestScheduler = None, parser: str = DEFAULT_PARSER, parse_pool: Executor = None,
+                 page_discovery: str = DEFAULT_PAGE_DISCOVERY, metrics: RunMetrics = None,
+                 control: RunControl = None, site: str = DEFAULT_SITE):
+        super().__init__(base_url, session=session, scheduler=scheduler, parse_pool=parse_pool, metrics=metrics,
+                         control=control)
+        if page_discovery not in PAGE_DISCOVERY_MODES:
+            raise ValueError(f"지원되지 않는 페이지 수 확인 방식: {page_discovery}")
         self.page_type_index = page_type_index
+        self.parser = make_parser(parser, page_type_index, site=site)
+        self.page_discovery = page_discovery
 
-    def get_soup_by_page(self, user_input_url: str, page_no: int) -> BeautifulSoup:
+    def page_request(self, user_input_url: str, page_no: int) -> tuple:
+        """
+        사용자 URL의 검색 조건을 유지한 채 pageNo만 바꾼 (요청 URL, 파라미터)를 반환합니다.
+        """
         parsed_url = urlparse(user_input_url)
         base_url = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}"
         query_dict = parse_qs(parsed_url.query)
         query_dict["pageNo"] = [str(page_no)]
         params = {key: (value[0] if len(value)==1 else value) for key, value in query_dict.items()}
+        return base_url, params
+
+    # 기존 호환용 BeautifulSoup 메서드: 목록 수집은 load_page/parse_listing을 쓰며, 해석은 파서에 맡깁니다.
+    def get_soup_by_page(self, user_input_url: str, page_no: int) -> "BeautifulSoup":
+        base_url, params = self.page_request(user_input_url, page_no)
         return self.get_soup(base_url, params)
 
-    def get_last_page_number(self, soup: BeautifulSoup) -> int:
-        pagination_div = soup.find("div", class_="pagination")
-        if not pagination_div:
-            return 1
-
-        last_link = pagination_div.find("a", class_="last")
-        if last_link and last_link.get("href"):
-            match = re.search(r"goList\((\d+)\)", last_link["href"])
-            if match:
-                return int(match.group(1))
-
-        page_links = pagination_div.find_all("a", class_="page")
-        page_numbers = []
-        for link in page_links:
-            href_val = link.get("href", "")
-            match = re.search(r"goList\((\d+)\)", href_val)
-            if match:
-                page_numbers.append(int(match.group(1)))
-        return max(page_numbers) if page_numbers else 1
-
-    def parse_bid_table(self, soup: BeautifulSoup) -> list:
-        data_list = []
-        if self.page_type_index == 0:
-            table = soup.find("table", {"class": "contTbl txtC"})
-        else:
-            table = soup.find("table", id="tblBidList")
-        if not table:
-            return data_list
-
-        tbody = table.find("tbody")
-        if not tbody:
-            return data_list
-
-        rows = tbody.find_all("tr")
-        for row in rows:
-            tds = row.find_all("td")
-            if self.page_type_index == 0:
-                if len(tds) < 7:
-                    continue
-                seq = tds[0].get_text(strip=True)
-                apt_name = tds[1].get_text(strip=True)
-                contract_company = tds[2].get_text(strip=True)
-                contract_name = tds[3].get_text(strip=True)
-                contract_date = tds[4].get_text(strip=True)
-                contract_amount = tds[5].get_text(strip=True)
-                contract_period = tds[6].get_text(strip=True)
-                detail_link = ""
-                onclick_attr = tds[0].get("onclick", "")
-                match = re.search(r"goView\('(.+?)'\)", onclick_attr)
-                detail_id = match.group(1) if match else ""
-                if detail_id:
-                    detail_link = f"https://www.k-apt.go.kr/bid/privateContractDetail.do?pcNum={detail_id}"
-                data_list.append({
-                    "순번": seq,
-                    "단지명": apt_name,
-                    "계약업체": contract_company,
-                    "계약명": contract_name,
-                    "계약일": contract_date,
-                    "계약금액": contract_amount,
-                    "계약기간": contract_period,
-                    "상세정보링크": detail_link
-                })
-            else:
-                if len(tds) < 8:
-                    continue
-                seq = tds[0].get_text(strip=True)
-                bid_type = tds[1].get_text(strip=True)
-                award_method = tds[2].get_text(strip=True)
-                bid_title = tds[3].get_text(strip=True)
-                bid_deadline = tds[4].get_text(strip=True)
-                status = tds[5].get_text(strip=True)
-                apt_name = tds[6].get_text(strip=True)
-                reg_date = tds[7].get_text(strip=True)
-                onclick_attr = tds[0].get("onclick", "")
-                match = re.search(r"goView\('(.+?)'\)", onclick_attr)
-                detail_id = match.group(1) if match else ""
-                detail_link = f"https://www.k-apt.go.kr/bid/bidDetail.do?bidNum={detail_id}"
-                data_list.append({
-                    "순번": seq,
-                    "종류": bid_type,
-                    "낙찰방법": award_method,
-                    "입찰공고명": bid_title,
-                    "입찰마감일": bid_deadline,
-                    "상태": status,
-                    "단지명": apt_name,
-                    "공고일": reg_date,
-                    "상세정보링크": detail_link
-                })
-        return data_list
-
-    def crawl_all_pages(self, user_input_url: str, log_callback=None, max_items: int = 50) -> list:
-        def _log(msg: str) -> None:
+    def get_last_page_number(self, soup: "BeautifulSoup") -> int:
+        return self.parser.get_last_page_number(soup)
+
+    def parse_bid_table(self, soup: "BeautifulSoup") -> list:
+        return self.parser.parse_bid_table(soup)
+
+    def load_page(self, user_input_url: str, page_no: int) -> tuple:
+        """
+        한 페이지를 받아 (마지막 페이지 번호, 행 목록)을 반환합니다. 로드에 실패하면 None을 반환합니다.
+        """
+        base_url, params = self.page_request(user_input_url, page_no)
+        html = self.fetch_page(base_url, params)
+        return self.parse_listing(html) if html else None
+
+    def parse_listing(self, html: str) -> tuple:
+        return self.run_parser(self.parser.parse_listing, html)
+
+    def probe_last_page(self, user_input_url: str, hint: int, limit: int) -> tuple:
+        """
+        목록 표에 행이 없는 첫 페이지를 찾아 마지막 페이지를 확인하고 (마지막 페이지, {페이지: 행 목록})을 반환합니다.
+          - hint(페이지네이션의 마지막 페이지)부터 확인하므로 hint가 맞으면 요청 두 번으로 끝납니다.
+          - hint가 틀리면 pageNo를 지수적으로 늘려 빈 페이지를 찾은 뒤 이분 탐색합니다.
+          - limit 페이지까지 행이 있으면 더 탐색하지 않고 max(hint, limit)을 반환합니다.
+          - 탐색 중 받은 페이지의 행도 함께 반환하여 목록 수집 때 다시 요청하지 않게 합니다.
+          - 페이지 로드에 실패하면 (None, 받은 페이지)를 반환합니다.
+        """
+        known_pages = {}
+
+        def has_rows(page_no: int) -> bool:
+            loaded = self.load_page(user_input_url, page_no=page_no)
+            if not loaded:
+                raise _ProbeFailed(page_no)
+            known_pages[page_no] = loaded[1]
+            return bool(loaded[1])
+
+        lo, hi = 1, None  # lo: 행이 있는 페이지, hi: 빈 페이지
+        try:
+            guess = min(max(hint, 1), limit)
+            if guess > 1:
+                if has_rows(guess):
+                    lo = guess
+                else:
+                    hi = guess
+            step = 1
+            while hi is None:
+                if lo >= limit:
+                    return max(hint, lo), known_pages
+                page = min(lo + step, limit)
+                if has_rows(page):
+                    lo = page
+                    step *= 2
+                else:
+                    hi = page
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if has_rows(mid):
+                    lo = mid
+                else:
+                    hi = mid
+        except _ProbeFailed:
+            return None, known_pages
+        return lo, known_pages
+
+    def crawl_all_pages(self, user_input_url: str, log_callback=None, max_items: int = 50,
+                        max_workers: int = 1, stop_ids: set = None, progress: ProgressTracker = None) -> list:
+        """
+        1페이지부터 마지막 페이지까지 목록 데이터를 수집하여 리스트로 반환합니다.
+        """
+        return list(self.iter_rows(user_input_url, log_callback=log_callback, max_items=max_items,
+                                   max_workers=max_workers, stop_ids=stop_ids, progress=progress))
+
+    def iter_rows(self, user_input_url: str, log_callback=None, max_items: int = 50,
+                  max_workers: int = 1, stop_ids: set = None, progress: ProgressTracker = None):
+        """
+        목록 데이터를 페이지 순서대로 한 행씩 내보내는 제너레이터입니다.
+        max_workers가 1보다 크면 페이지를 동시에 요청하되, 결과는 페이지 순서대로 내보냅니다.
+        stop_ids가 주어지면(증분 모드) 그 안의 ID를 가진 행을 만나는 즉시 수집을 멈춥니다.
+        이때는 이미 수집한 행이 어느 페이지부터 나오는지 모르므로 페이지를 한 장씩 차례로 요청합니다.
+        progress(ProgressTracker)를 넘기면 "listing" 단계의 진행 상황을 보고합니다.
+        전체 건수는 마지막 페이지 x 첫 페이지 행 수(추출 건수 이하)로 추정합니다.
+        """
+        def _log(msg: str, level: str = "info") -> None:
             if log_callback:
-                log_callback(msg)
+                log_callback(msg, level)
 
-        first_page_soup = self.get_soup_by_page(user_input_url, page_no=1)
-        if not first_page_soup:
-            _log("첫 페이지 로드 실패")
-            return []
-        last_page = self.get_last_page_number(first_page_soup)
+        first_page = self.load_page(user_input_url, page_no=1)
+        if not first_page:
+            _log("첫 페이지 로드 실패", "error")
+            return
+        last_page, first_page_data = first_page
+        known_pages = {}
+        if self.page_discovery == "probe" and first_page_data:
+            rows_per_page = len(first_page_data)
+            # 수집할 건수를 채우는 데 필요한 페이지까지만 탐색합니다.
+            limit = 1 + math.ceil(max(0, max_items - rows_per_page) / rows_per_page)
+            probed, known_pages = self.probe_last_page(user_input_url, last_page, limit)
+            if probed is None:
+                _log(f"마지막 페이지 탐색 실패. 페이지네이션 값({last_page})을 사용합니다.")
+            else:
+                if probed >= limit:
+                    _log(f"수집에 필요한 {limit}페이지까지 목록이 있음을 확인했습니다.")
+                elif probed != last_page:
+                    _log(f"탐색한 마지막 페이지({probed})가 페이지네이션 값({last_page})과 다릅니다.")
+                last_page = probed
         _log(f"확인된 마지막 페이지: {last_page}")
+        _log(f"1/{last_page} 페이지 처리 중...")
+        if progress:
+            progress.start("listing", total=min(max_items, last_page * len(first_page_data)))
+        count = 0
+        reached_seen = False
+        workers = max(1, min(max_workers, self.max_concurrency))
+        if stop_ids and workers > 1:
+            # 새 항목은 보통 앞쪽 몇 페이지뿐이므로, 동시 요청으로 미리 받은 뒤쪽 페이지는 버려지게 됩니다.
+            _log("증분 모드: 이전 수집 항목에 도달하면 바로 멈추도록 목록 페이지를 차례로 요청합니다.")
+            workers = 1
+        if workers > 1 and last_page > 1:
+            _log(f"목록 페이지 동시 요청 수: {workers}")
+        pages = self._iter_page_rows(user_input_url, first_page_data, last_page, workers,
+                                     lambda: max_items - count, _log, known_pages)
+        try:
+            for page_rows in pages:
+                self.control.checkpoint()
+                page_rows, reached_seen = self._take_until_seen(page_rows, stop_ids)
+                page_rows = page_rows[:max_items - count]
+                count += len(page_rows)
+                if progress:
+                    progress.advance("listing", len(page_rows))
+                yield from page_rows
+                if reached_seen or count >= max_items:
+                    break
+        finally:
+            pages.close()
+        if progress:
+            # 추정한 전체 건수를 실제 수집한 건수로 바로잡습니다.
+            progress.set_total("listing", count)
+        if reached_seen:
+            _log("이전 실행에서 수집한 항목에 도달하여 페이지 탐색을 멈춥니다.")
+        _log(f"총 {count}개의 데이터 수집 완료")
+
+    @staticmethod
+    def _take_until_seen(page_rows: list, stop_ids: set) -> tuple:
+        """
+        stop_ids에 있는 행을 만나면 그 앞까지만 잘라 (행 목록, True)를 반환합니다.
+        """
+        if stop_ids:
+            for idx, row in enumerate(page_rows):
+                if row_id(row) in stop_ids:
+                    return page_rows[:idx], True
+        return page_rows, False
+
+    def _iter_page_rows(self, user_input_url: str, first_page_data: list, last_page: int, workers: int,
+                        remaining, _log, known_pages: dict = None):
+        """
+        첫 페이지부터 페이지 단위 행 목록을 순서대로 내보냅니다.
+        동시 요청 시에는 첫 페이지의 행 수와 remaining()으로 필요한 페이지만 요청하며,
+        실패하거나 행 수가 적은 페이지가 있으면 그만큼 더 요청합니다.
+        known_pages({페이지: 행 목록}, 마지막 페이지 탐색 중 받은 페이지)에 있는 페이지는 다시 요청하지 않습니다.
+        """
+        known_pages = known_pages or {}
+        yield first_page_data
+        if workers == 1:
+            for page in range(2, last_page + 1):
+                _log(f"{page}/{last_page} 페이지 처리 중...")
+                if page in known_pages:
+                    yield known_pages[page]
+                    continue
+                loaded = self.load_page(user_input_url, page_no=page)
+                if not loaded:
+                    _log(f"{page} 페이지 로드 실패. 넘어갑니다.", "error")
+                    continue
+                yield loaded[1]
+            return
+
+        rows_per_page = len(first_page_data)
+
+        def _pages_needed() -> int:
+            return math.ceil(remaining() / rows_per_page) if rows_per_page else last_page
+
+        pending = deque()
+        next_page = 2
+        planned_last = min(last_page, 1 + _pages_needed())
+        with self._page_executor(workers) as executor:
+            try:
+                while pending or next_page <= planned_last:
+                    while next_page <= planned_last and len(pending) < workers:
+                        if next_page in known_pages:
+                            future = Future()
+                            future.set_result((last_page, known_pages[next_page]))
+                        else:
+                            future = self._submit_page(executor, user_input_url, next_page)
+                        pending.append((next_page, future))
+                        next_page += 1
+                    page, future = pending.popleft()
+                    _log(f"{page}/{last_page} 페이지 처리 중...")
+                    loaded = future.result()
+                    if not loaded:
+                        _log(f"{page} 페이지 로드 실패. 넘어갑니다.", "error")
+                    else:
+                        yield loaded[1]
+                    queued = len(pending) + max(0, planned_last - next_page + 1)
+                    if queued < _pages_needed():
+                        planned_last = min(last_page, page + _pages_needed())
+            finally:
+                # 소비자가 중간에 멈추면 아직 시작하지 않은 페이지 요청을 취소합니다.
+                for _, rest in pending:
+                    rest.cancel()
 
-        all_data = []
-        for page in range(1, last_page + 1):
-            _log(f"{page}/{last_page} 페이지 처리 중...")
-            page_soup = self.get_soup_by_page(user_input_url, page_no=page)
-            if not page_soup:
-                _log(f"{page} 페이지 로드 실패. 넘어갑니다.")
-                continue
-            page_data = self.parse_bid_table(page_soup)
-            all_data.extend(page_data)
-            if len(all_data) >= max_items:
-                all_data = all_data[:max_items]
-                break
-        _log(f"총 {len(all_data)}개의 데이터 수집 완료")
-        return all_data
+    def _page_executor(self, workers: int):
+        return ThreadPoolExecutor(max_workers=workers)
+
+    def _submit_page(self, executor, user_input_url: str, page_no: int):
+        """
+        한 페이지 요청을 제출하고 load_page 결과를 담을 Future를 반환합니다.
+        """
+        return executor.submit(self.load_page, user_input_url, page_no)
 
 class DetailCrawler(BaseCrawler):
     """
     상세정보 크롤러:
       - 상세페이지에서 추가 정보를 수집합니다.
+      - cache가 있으면 네트워크 요청 전에 먼저 확인하고, 받아온 HTML을 저장합니다.
+      - parser: "lxml"(기본, 빠른 파서) 또는 "bs4"(기존 BeautifulSoup 파서)
+      - columns: 추출할 결과 컬럼 (None이면 상세 페이지의 모든 항목)
+      - record_index가 있으면 이미 파싱한 레코드를 먼저 찾아 쓰고, 새로 파싱한 레코드를 저장합니다.
     """
-    def __init__(self, page_type_index: int = 0):
+    max_concurrency = MAX_DETAIL_WORKERS
+
+    def __init__(self, page_type_index: int = 0, session: PooledSession = None,
+                 scheduler: RequestScheduler = None, cache: ResponseCache = None, parser: str = DEFAULT_PARSER,
+                 parse_pool: Executor = None, columns: list = None, record_index: RecordIndex = None,
+                 metrics: RunMetrics = None, control: RunControl = None):
         self.page_type_index = page_type_index
-        super().__init__(base_url="")  # base_url 미사용
+        self.cache = cache
+        self.record_index = record_index
+        self.parser = make_parser(parser, page_type_index, columns)
+        super().__init__(base_url="", session=session, scheduler=scheduler,
+                         parse_pool=parse_pool, metrics=metrics, control=control)  # base_url 미사용
+
+    @property
+    def summary_only(self) -> bool:
+        """
+        추출할 컬럼을 모두 목록 행에서 얻을 수 있으면 True입니다. (상세 페이지 요청 불필요)
+        """
+        return self.parser.schema.summary_only
+
+    def detail_from_summary(self, row: dict) -> dict:
+        return self.parser.schema.from_summary(row)
+
+    def _indexed_record(self, url: str) -> dict:
+        key = parse_detail_id(url) if self.record_index else None
+        return self.record_index.get(*key, self.parser.schema.fields) if key else None
+
+    def _index_record(self, url: str, data: dict) -> None:
+        key = parse_detail_id(url) if self.record_index else None
+        if key:
+            self.record_index.put(*key, data)
+
+    def _cached_html(self, url: str) -> str:
+        key = parse_detail_id(url) if self.cache else None
+        return self.cache.get(*key) if key else None
+
+    def _store_html(self, url: str, html: str) -> None:
+        key = parse_detail_id(url) if self.cache else None
+        if key:
+            self.cache.put(*key, html)
 
     def crawl_detail_page(self, url: str) -> dict:
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-        except Exception as e:
-            raise Exception(f"상세 페이지 로드 실패: {e}")
-        soup = BeautifulSoup(response.text, "lxml")
-        if self.page_type_index == 0:
-            data = {
-                '주택관리업자': '', '아파트명': '', '관리사무소 주소': '', '전화번호': '', '팩스번호': '',
-                '동수': '', '세대수': '', '계약번호': '', '계약명': '', '계약업체명': '',
-                '업체대표자명': '', '업체전화번호': '', '사업자등록번호': '', '업체주소': '',
-                '계약(예정)일': '', '계약금액': '', '계약기간': '', '등록일': '', '분류': '',
-                '수의계약 체결사유': ''
-            }
-            mapping = {
-                "주택관리업자": "주택관리업자",
-                "아파트명": "아파트명",
-                "단지명": "아파트명",
-                "관리사무소 주소": "관리사무소 주소",
-                "전화번호": "전화번호",
-                "팩스번호": "팩스번호",
-                "동수": "동수",
-                "세대수": "세대수",
-                "계약번호": "계약번호",
-                "계약명": "계약명",
-                "계약업체명": "계약업체명",
-                "업체대표자명": "업체대표자명",
-                "업체전화번호": "업체전화번호",
-                "사업자등록번호": "사업자등록번호",
-                "업체주소": "업체주소",
-                "계약(예정)일": "계약(예정)일",
-                "계약금액": "계약금액",
-                "계약기간": "계약기간",
-                "등록일": "등록일",
-                "분 류": "분류",
-                "분류": "분류",
-                "수의계약 체결사유": "수의계약 체결사유"
-            }
-            table_common = soup.find("table", class_="contTbl txtC")
-            if table_common:
-                tbody = table_common.find("tbody")
-                if tbody:
-                    row = tbody.find("tr")
-                    if row:
-                        cells = row.find_all("td")
-                        if len(cells) >= 7:
-                            data['주택관리업자'] = cells[0].get_text(strip=True)
-                            data['아파트명'] = cells[1].get_text(strip=True)
-                            data['관리사무소 주소'] = cells[2].get_text(strip=True)
-                            data['전화번호'] = cells[3].get_text(strip=True)
-                            data['팩스번호'] = cells[4].get_text(strip=True)
-                            data['동수'] = cells[5].get_text(strip=True)
-                            data['세대수'] = cells[6].get_text(strip=True)
-            table_contract = None
-            tables = soup.find_all("table", class_="contTbl")
-            for t in tables:
-                if "txtC" not in t.get("class", []):
-                    table_contract = t
-                    break
-            if table_contract:
-                tbody = table_contract.find("tbody")
-                if tbody:
-                    rows = tbody.find_all("tr")
-                    for row in rows:
-                        cells = row.find_all(["th", "td"])
-                        if len(cells) < 2:
-                            continue
-                        for i in range(0, len(cells) - 1, 2):
-                            key_text = re.sub(r'\s+', ' ', cells[i].get_text(strip=True))
-                            val_text = cells[i+1].get_text(strip=True)
-                            if key_text in mapping:
-                                data[mapping[key_text]] = val_text
-            return data
-        else:
-            data = {
-                '주택관리업자': '', '단지명': '', '관리사무소 주소': '', '전화번호': '', '팩스번호': '',
-                '동수': '', '세대수': '', '입찰번호': '', '입찰방법': '', '입찰서 제출 마감일': '',
-                '입찰제목': '', '긴급입찰여부': '', '입찰종류': '', '낙찰방법': '', '입찰분류': '',
-                '신용평가등급확인서 제출여부': '', '현장설명': '', '관리(공사용역) 실적증명서 제출여부': '',
-                '현장설명일시': '', '현장설명장소': '', '서류제출마감일': '', '입찰보증금': '',
-                '지급조건': '', '내용': '', '계약번호': '', '계약명': '', '계약업체명': '',
-                '업체대표자명': '', '업체전화번호': '', '사업자등록번호': '', '업체주소': '',
-                '계약(예정)일': '', '계약기간': '', '계약금액': '', '등록일': '', '분류': '',
-                '수의계약 체결사유': ''
-            }
-            tables = soup.find_all("table", class_="contTbl")
-            for table in tables:
-                tbody = table.find("tbody")
-                if not tbody:
-                    continue
-                rows = tbody.find_all("tr")
-                for row in rows:
-                    cells = row.find_all(["th", "td"])
-                    if len(cells) < 2:
-                        continue
-                    for i in range(0, len(cells) - 1, 2):
-                        key_text = cells[i].get_text(strip=True)
-                        val_text = cells[i+1].get_text(strip=True)
-                        if key_text == '파일첨부':
-                            continue
-                        if key_text in data:
-                            data[key_text] = val_text
-            return data
+        record = self._indexed_record(url)
+        if record is not None:
+            return record
+        html = self._cached_html(url)
+        if html is None:
+            try:
+                response = self.request(url)
+                response.raise_for_status()
+            except CrawlCancelled:
+                raise
+            except Exception as e:
+                raise Exception(f"상세 페이지 로드 실패: {e}")
+            html = response.text
+            self._store_html(url, html)
+        data = self.parse_detail_html(html)
+        self._index_record(url, data)
+        return data
+
+    def parse_detail_html(self, html: str) -> dict:
+        return self.run_parser(self.parser.parse_detail, html)
@@ -0,0 +1,105 @@
+import json
+import sys
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+
+# 쌓인 로그 이벤트를 sink로 넘기는 간격(밀리초)
+DEFAULT_FLUSH_MS = 200
+# 로그 수준: 오류 메시지는 남기는 쪽에서 level="error"를 넘깁니다.
+LOG_LEVELS = ("info", "error")
+
+LogEvent = namedtuple("LogEvent", ["time", "level", "message"])
+
+def format_time(event: LogEvent) -> str:
+    return datetime.fromtimestamp(event.time).strftime("%Y-%m-%d %H:%M:%S")
+
+def event_record(event: LogEvent) -> dict:
+    """
+    JSONL 로그 파일에 기록하는 이벤트 형식: {"time": ISO 시각(밀리초), "level": "info"/"error", "message": ...}
+    """
+    return {"time": datetime.fromtimestamp(event.time).isoformat(timespec="milliseconds"),
+            "level": event.level, "message": event.message}
+
+class EventLog:
+    """
+    구조화된 로그 이벤트 스트림:
+      - emit(msg, level)은 이벤트(시각, 수준, 메시지)를 대기열에 넣고 바로 돌아오므로, 크롤러의 log_callback으로 넘겨
+        여러 스레드에서 불러도 요청/파싱을 막지 않습니다. (log_callback은 모두 (메시지, level="info") 형식입니다)
+      - 백그라운드 스레드가 flush_ms마다 쌓인 이벤트를 묶어 각 sink(이벤트 목록을 받는 함수)에 한 번에 넘깁니다.
+      - jsonl_path를 주면 이벤트를 한 줄에 하나씩 JSON으로 이어 씁니다.
+      - close()(또는 with 문)는 남은 이벤트를 모두 넘긴 뒤 파일을 닫습니다.
+    """
+    def __init__(self, sinks: list = (), flush_ms: int = DEFAULT_FLUSH_MS, jsonl_path: str = None):
+        self.sinks = list(sinks)
+        self.flush_seconds = max(0.01, flush_ms / 1000)
+        self.jsonl_path = jsonl_path
+        self._file = open(jsonl_path, "a", encoding="utf-8") if jsonl_path else None
+        self._pending = []
+        self._lock = threading.Lock()
+        # sink 호출은 한 번에 하나씩, 들어온 순서대로 합니다.
+        self._deliver_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="kapt-log", daemon=True)
+        self._thread.start()
+
+    def emit(self, message: str, level: str = "info") -> None:
+        if level not in LOG_LEVELS:
+            raise ValueError(f"지원되지 않는 로그 수준: {level}")
+        event = LogEvent(time.time(), level, message)
+        with self._lock:
+            self._pending.append(event)
+
+    def _run(self) -> None:
+        while not self._closed.wait(self.flush_seconds):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        쌓인 이벤트를 지금 sink와 파일로 넘깁니다.
+        """
+        with self._deliver_lock:
+            with self._lock:
+                events, self._pending = self._pending, []
+            if not events:
+                return
+            if self._file:
+                self._file.write("".join(json.dumps(event_record(e), ensure_ascii=False) + "\n" for e in events))
+                self._file.flush()
+            for sink in self.sinks:
+                try:
+                    sink(events)
+                except Exception as e:
+                    # 로그 표시에 실패해도 크롤링은 계속합니다.
+                    print(f"로그 전달 실패: {e}", file=sys.stderr)
+
+    def close(self) -> None:
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._thread.join()
+        self.flush()
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+def print_sink(with_time: bool = False):
+    """
+    이벤트 묶음을 표준 출력에 한 번에 쓰는 sink를 반환합니다. with_time이면 줄 앞에 시각을 붙입니다.
+    """
+    def _sink(events: list) -> None:
+        if with_time:
+            lines = [f"{format_time(e)} {e.message}" for e in events]
+        else:
+            lines = [e.message for e in events]
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+    return _sink
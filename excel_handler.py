@@ -1,152 +1,315 @@
 import os
+import asyncio
+import threading
+import time
+from collections import deque
 from datetime import datetime
-import openpyxl
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from output_formats import open_writer, output_extension, read_rows, DEFAULT_OUTPUT_FORMAT
+from run_control import CrawlCancelled
 
-def make_unique_filename(base_name: str = "추출데이터", folder_name: str = "추출데이터") -> str:
+# 이번 프로세스에서 이미 내준 결과 파일 경로 (동시 실행 작업 간 이름 충돌 방지)
+_issued_filenames = set()
+_filename_lock = threading.Lock()
+
+def make_unique_filename(base_name: str = "추출데이터", folder_name: str = "추출데이터",
+                         extension: str = ".xlsx") -> str:
     """
     유니크한 파일 이름을 생성합니다.
+    동시에 실행 중인 작업끼리 같은 이름을 받지 않도록, 이미 내준 이름은 아직 파일이 없어도 건너뜁니다.
     """
     os.makedirs(folder_name, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{base_name}_{timestamp}.xlsx"
+    filename = f"{base_name}_{timestamp}{extension}"
     full_path = os.path.join(folder_name, filename)
-    if os.path.exists(full_path):
-        counter = 1
-        while True:
-            new_filename = f"{base_name}_{timestamp}_{counter}.xlsx"
-            new_full_path = os.path.join(folder_name, new_filename)
-            if not os.path.exists(new_full_path):
-                full_path = new_full_path
-                break
-            counter += 1
+    with _filename_lock:
+        if os.path.exists(full_path) or full_path in _issued_filenames:
+            counter = 1
+            while True:
+                new_filename = f"{base_name}_{timestamp}_{counter}{extension}"
+                new_full_path = os.path.join(folder_name, new_filename)
+                if not os.path.exists(new_full_path) and new_full_path not in _issued_filenames:
+                    full_path = new_full_path
+                    break
+                counter += 1
+        _issued_filenames.add(full_path)
     return full_path
 
-def save_to_excel(data_list: list, filename: str, page_type_index: int = 0) -> None:
+def summary_columns(page_type_index: int) -> list:
+    if page_type_index == 0:
+        return ["순번", "단지명", "계약업체", "계약명", "계약일", "계약금액", "계약기간", "상세정보링크"]
+    return ["순번", "종류", "낙찰방법", "입찰공고명", "입찰마감일", "상태", "단지명", "공고일", "상세정보링크"]
+
+def summary_sheet_title(page_type_index: int) -> str:
+    return "수의계약" if page_type_index == 0 else "입찰공고"
+
+def save_to_excel(data_list, filename: str, page_type_index: int = 0, metrics=None) -> None:
     """
-    데이터 리스트를 엑셀 파일로 저장합니다.
+    데이터 리스트(또는 제너레이터)를 파일로 저장합니다. 형식은 확장자(.xlsx/.parquet/.csv.gz/.jsonl)를 따릅니다.
     """
-    wb = openpyxl.Workbook()
-    ws = wb.active
+    try:
+        with open_writer(filename, summary_columns(page_type_index),
+                         sheet_title=summary_sheet_title(page_type_index), metrics=metrics) as writer:
+            for item in data_list:
+                writer.write_row({col: item.get(col, "") for col in writer.columns})
+    except Exception as e:
+        raise Exception(f"결과 파일 저장 실패: {e}")
 
-    if page_type_index == 0:
-        ws.title = "수의계약"
-        headers = ["순번", "단지명", "계약업체", "계약명", "계약일", "계약금액", "계약기간", "상세정보링크"]
+def _finish_detail_row(integrated_data: dict, crawled_data: dict, label: str, selected_columns: list, _log) -> dict:
+    if crawled_data:
+        _log(f"  {label} [성공]")
+        integrated_data.update(crawled_data)
     else:
-        ws.title = "입찰공고"
-        headers = ["순번", "종류", "낙찰방법", "입찰공고명", "입찰마감일", "상태", "단지명", "공고일", "상세정보링크"]
-    
-    ws.append(headers)
-    for item in data_list:
-        if page_type_index == 0:
-            row = [
-                item.get("순번", ""),
-                item.get("단지명", ""),
-                item.get("계약업체", ""),
-                item.get("계약명", ""),
-                item.get("계약일", ""),
-                item.get("계약금액", ""),
-                item.get("계약기간", ""),
-                item.get("상세정보링크", "")
-            ]
-        else:
-            row = [
-                item.get("순번", ""),
-                item.get("종류", ""),
-                item.get("낙찰방법", ""),
-                item.get("입찰공고명", ""),
-                item.get("입찰마감일", ""),
-                item.get("상태", ""),
-                item.get("단지명", ""),
-                item.get("공고일", ""),
-                item.get("상세정보링크", "")
-            ]
-        ws.append(row)
+        integrated_data.update({col: 'FAILED' for col in selected_columns})
+    return integrated_data
+
+def is_failed_row(row: dict, selected_columns: list) -> bool:
+    """
+    상세정보를 끝내 가져오지 못해 선택된 컬럼이 'FAILED'로 채워진 행인지 확인합니다.
+    """
+    return bool(selected_columns) and all(row.get(col) == 'FAILED' for col in selected_columns)
+
+def _restore_detail_row(detail_url, integrated_data: dict, label: str, journal, _log) -> bool:
+    """
+    체크포인트 저널에 이미 완료된 항목이 있으면 그 결과를 합치고 True를 반환합니다.
+    """
+    restored = journal.get(detail_url) if journal is not None else None
+    if restored is None:
+        return False
+    _log(f"{label} 체크포인트에서 복원: {detail_url}")
+    integrated_data.update(restored)
+    return True
+
+def _crawl_detail_row(row: dict, label: str, selected_columns: list, detail_crawler, _log, journal=None) -> dict:
+    """
+    한 행의 상세정보를 크롤링하고, 목록 데이터와 합친 결과를 반환합니다.
+    재시도와 백오프는 크롤러의 RequestScheduler가 담당하며,
+    끝내 실패하면 선택된 컬럼을 'FAILED'로 채웁니다. 성공한 결과는 journal에 기록합니다.
+    """
+    detail_url = row.get('상세정보링크')
+    integrated_data = dict(row)
+    if not detail_url:
+        _log(f"{label} 링크 없음 (건너뛰기)")
+        return integrated_data
+    if _restore_detail_row(detail_url, integrated_data, label, journal, _log):
+        return integrated_data
+
+    _log(f"{label} 상세정보 크롤링 중: {detail_url}")
+    crawled_data = None
     try:
-        wb.save(filename)
+        crawled_data = detail_crawler.crawl_detail_page(detail_url)
+    except CrawlCancelled:
+        raise
     except Exception as e:
-        raise Exception(f"엑셀 파일 저장 실패: {e}")
+        _log(f"  {label} [실패] 재시도 후 포기: {e}", "error")
+    if crawled_data and journal is not None:
+        journal.record(detail_url, crawled_data)
+    return _finish_detail_row(integrated_data, crawled_data, label, selected_columns, _log)
+
+async def _crawl_detail_row_async(row: dict, label: str, selected_columns: list, detail_crawler, _log,
+                                  journal=None) -> dict:
+    """
+    _crawl_detail_row의 asyncio 버전입니다. (async 백엔드의 DetailCrawler 전용)
+    저널 기록(주기적인 fsync 포함)은 스레드 풀에서 처리하여 이벤트 루프를 막지 않습니다.
+    """
+    detail_url = row.get('상세정보링크')
+    integrated_data = dict(row)
+    if not detail_url:
+        _log(f"{label} 링크 없음 (건너뛰기)")
+        return integrated_data
+    if _restore_detail_row(detail_url, integrated_data, label, journal, _log):
+        return integrated_data
 
-def generate_output_filename() -> str:
-    now_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-    base_filename = f"추출데이터_상세정보_{now_str}"
-    ext = ".xlsx"
-    output_filename = base_filename + ext
-    counter = 1
-    while os.path.exists(output_filename):
-        output_filename = f"{base_filename}_{counter}{ext}"
-        counter += 1
-    return output_filename
+    _log(f"{label} 상세정보 크롤링 중: {detail_url}")
+    crawled_data = None
+    try:
+        crawled_data = await detail_crawler.crawl_detail_page_async(detail_url)
+    except CrawlCancelled:
+        raise
+    except Exception as e:
+        _log(f"  {label} [실패] 재시도 후 포기: {e}", "error")
+    if crawled_data and journal is not None:
+        await asyncio.get_running_loop().run_in_executor(None, journal.record, detail_url, crawled_data)
+    return _finish_detail_row(integrated_data, crawled_data, label, selected_columns, _log)
 
-def crawl_detail_info_from_excel(input_excel_path: str, selected_columns: list, detail_crawler, log_callback=None, page_type_index: int = 0) -> str:
+def iter_detail_rows(rows, selected_columns: list, detail_crawler, log_callback=None,
+                     max_workers: int = 1, total: int = None, journal=None, progress=None):
     """
-    기존 엑셀 파일을 읽어 상세정보를 크롤링 후 새로운 엑셀 파일로 저장합니다.
+    목록 행을 받는 대로 상세정보를 크롤링하여, 입력 순서대로 합친 행을 내보내는 제너레이터입니다.
+    추출할 컬럼을 모두 목록 행에서 얻을 수 있으면 상세 페이지는 요청하지 않습니다.
+    rows는 리스트나 제너레이터 모두 가능하며, 동시에 진행하는 요청은 최대 max_workers의 2배로 제한합니다.
+    journal(DetailJournal)이 주어지면 이미 완료된 항목은 요청하지 않고 저널의 결과를 사용합니다.
+    progress(ProgressTracker)를 넘기면 내보낸 행 수를 "detail" 단계의 진행 상황으로 보고합니다.
+    행마다 detail_crawler.control(RunControl)을 확인하여, 일시정지 중이면 기다리고 취소되면 CrawlCancelled를 발생시킵니다.
     """
-    def _log(msg: str) -> None:
+    results = _iter_detail_rows(rows, selected_columns, detail_crawler, log_callback, max_workers, total, journal)
+    if not progress:
+        yield from results
+        return
+    progress.start("detail", total)
+    try:
+        for row in results:
+            progress.advance("detail")
+            yield row
+    finally:
+        results.close()
+
+def _iter_detail_rows(rows, selected_columns: list, detail_crawler, log_callback, max_workers: int, total: int,
+                      journal):
+    def _log(msg: str, level: str = "info") -> None:
         if log_callback:
-            log_callback(msg)
+            log_callback(msg, level)
 
-    if not os.path.exists(input_excel_path):
-        _log(f"엑셀 파일이 존재하지 않습니다: {input_excel_path}")
-        return None
+    def _label(idx: int) -> str:
+        return f"[{idx}/{total}]" if total else f"[{idx}]"
+
+    control = detail_crawler.control
+    if detail_crawler.summary_only:
+        _log("선택한 상세 컬럼을 모두 목록 데이터에서 얻을 수 있어 상세 페이지를 요청하지 않습니다.")
+        for idx, row in enumerate(rows, 1):
+            control.checkpoint()
+            from_summary = detail_crawler.detail_from_summary(row)
+            if from_summary is None:  # 입력 엑셀에 해당 목록 컬럼이 없는 경우
+                yield _crawl_detail_row(row, _label(idx), selected_columns, detail_crawler, _log, journal)
+            else:
+                yield {**row, **from_summary}
+        return
 
-    output_dir = "추출데이터_상세정보"
-    os.makedirs(output_dir, exist_ok=True)
-    output_filename = generate_output_filename()
-    output_excel_path = os.path.join(output_dir, output_filename)
+    is_async = hasattr(detail_crawler, "crawl_detail_page_async")
+    workers = max(1, min(max_workers, detail_crawler.max_concurrency))
+    if workers == 1 and not is_async:
+        for idx, row in enumerate(rows, 1):
+            control.checkpoint()
+            yield _crawl_detail_row(row, _label(idx), selected_columns, detail_crawler, _log, journal)
+        return
 
+    executor = None if is_async else ThreadPoolExecutor(max_workers=workers)
+
+    def _submit(row: dict, label: str):
+        if is_async:
+            # async 백엔드: 하나의 이벤트 루프에서 요청을 동시에 처리합니다.
+            return detail_crawler.client.submit(
+                _crawl_detail_row_async(row, label, selected_columns, detail_crawler, _log, journal))
+        return executor.submit(_crawl_detail_row, row, label, selected_columns, detail_crawler, _log, journal)
+
+    pending = deque()
     try:
-        df_input = pd.read_excel(input_excel_path)
-    except Exception as e:
-        _log(f"엑셀 파일 읽기 실패: {e}")
-        return None
+        for idx, row in enumerate(rows, 1):
+            control.checkpoint()
+            pending.append(_submit(row, _label(idx)))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if executor:
+            executor.shutdown(wait=True)
+
+def make_detail_output_path(output_format: str = DEFAULT_OUTPUT_FORMAT) -> str:
+    return make_unique_filename("추출데이터_상세정보", "추출데이터_상세정보", output_extension(output_format))
+
+def detail_output_columns(selected_columns: list, page_type_index: int = 0, input_columns: list = None) -> list:
+    """
+    상세정보 결과 파일의 컬럼: 목록 컬럼(입력에 있는 것만) 뒤에 선택된 상세 컬럼을 붙입니다.
+    """
+    original_summary_cols = summary_columns(page_type_index)
+    if input_columns is not None:
+        original_summary_cols = [c for c in original_summary_cols if c in input_columns]
+    return original_summary_cols + [col for col in selected_columns if col not in original_summary_cols]
+
+def save_detail_results(results, columns: list, output_excel_path: str, metrics=None) -> int:
+    """
+    상세정보가 합쳐진 행들을 받는 대로 결과 파일(형식은 확장자를 따름)에 기록하고 저장한 행 수를 반환합니다.
+    저장할 행이 없으면 파일을 남기지 않습니다. 도중에 중단되어도(취소 등) 그때까지 기록한 행은 파일로 남깁니다.
+    """
+    writer = open_writer(output_excel_path, columns, metrics=metrics)
+    try:
+        for row in results:
+            writer.write_row(row)
+    finally:
+        writer.close()
+        if not writer.rows_written:
+            os.remove(output_excel_path)
+    return writer.rows_written
+
+def crawl_detail_info_from_rows(rows, selected_columns: list, detail_crawler, log_callback=None,
+                                page_type_index: int = 0, max_workers: int = 1, total: int = None,
+                                input_columns: list = None, journal=None,
+                                output_format: str = DEFAULT_OUTPUT_FORMAT, metrics=None, progress=None,
+                                failed_rows: list = None) -> str:
+    """
+    목록 행(리스트 또는 제너레이터)의 상세정보를 크롤링하여 output_format 형식의 새 결과 파일로 저장합니다.
+    중간 파일 없이 목록 수집, 상세 요청, 저장이 한 흐름으로 이어집니다.
+    metrics(RunMetrics)를 넘기면 결과 파일 기록 시간을, progress(ProgressTracker)를 넘기면 진행 상황을 보고합니다.
+    failed_rows(list)를 넘기면 상세정보를 가져오지 못한('FAILED') 행을 여기에 추가합니다.
+    작업이 취소되면 그때까지의 결과 파일 경로(없으면 None)를 담아 CrawlCancelled를 다시 발생시킵니다.
+    """
+    def _log(msg: str, level: str = "info") -> None:
+        if log_callback:
+            log_callback(msg, level)
+
+    output_excel_path = make_detail_output_path(output_format)
+    results = iter_detail_rows(rows, selected_columns, detail_crawler, log_callback=log_callback,
+                               max_workers=max_workers, total=total, journal=journal, progress=progress)
+
+    def _track_failed(results):
+        for row in results:
+            if is_failed_row(row, selected_columns):
+                failed_rows.append(row)
+            yield row
 
-    total_count = len(df_input)
-    _log(f"총 {total_count} 건에 대해 상세정보 크롤링 시작...")
-
-    results = []
-    for idx, row in df_input.iterrows():
-        detail_url = row.get('상세정보링크')
-        if not detail_url:
-            _log(f"[{idx+1}/{total_count}] 링크 없음 (건너뛰기)")
-            integrated_data = row.to_dict()
-            results.append(integrated_data)
-            continue
-
-        _log(f"[{idx+1}/{total_count}] 상세정보 크롤링 중: {detail_url}")
-        max_retries = 3
-        crawled_data = None
-        for attempt in range(1, max_retries + 1):
-            try:
-                crawled_data = detail_crawler.crawl_detail_page(detail_url)
-                _log(f"  [성공] (시도 {attempt}/{max_retries})")
-                break
-            except Exception as e:
-                _log(f"  [오류] (시도 {attempt}/{max_retries}): {e}")
-
-        if crawled_data:
-            integrated_data = row.to_dict()
-            integrated_data.update(crawled_data)
-            results.append(integrated_data)
-        else:
-            _log("  [실패] 3번 재시도 후 포기.")
-            failed_data = {col: 'FAILED' for col in selected_columns}
-            integrated_data = row.to_dict()
-            integrated_data.update(failed_data)
-            results.append(integrated_data)
-
-    df_result = pd.DataFrame(results)
-    if page_type_index == 0:
-        original_summary_cols = ["순번", "단지명", "계약업체", "계약명", "계약일", "계약금액", "계약기간", "상세정보링크"]
-    else:
-        original_summary_cols = ["순번", "종류", "낙찰방법", "입찰공고명", "입찰마감일", "상태", "단지명", "공고일", "상세정보링크"]
-    final_cols = original_summary_cols + [col for col in selected_columns if col not in original_summary_cols]
-    final_cols = [c for c in final_cols if c in df_result.columns]
-    df_result = df_result[final_cols]
     try:
-        df_result.to_excel(output_excel_path, index=False)
+        columns = detail_output_columns(selected_columns, page_type_index, input_columns)
+        saved_count = save_detail_results(results if failed_rows is None else _track_failed(results), columns,
+                                          output_excel_path, metrics=metrics)
+    except CrawlCancelled as e:
+        if os.path.exists(output_excel_path):
+            e.output_path = output_excel_path
+            _log(f"취소 전까지의 상세정보 결과를 저장했습니다: {output_excel_path}")
+        raise
     except Exception as e:
-        _log(f"결과 엑셀 파일 저장 실패: {e}")
+        _log(f"결과 파일 저장 실패: {e}", "error")
+        return None
+    finally:
+        # 중간에 멈춘 경우에도 남은 요청을 바로 취소합니다.
+        results.close()
+    if not saved_count:
         return None
     _log(f"\n상세정보 크롤링 완료! 결과: {output_excel_path}")
     return output_excel_path
+
+def crawl_detail_info_from_excel(input_excel_path: str, selected_columns: list, detail_crawler, log_callback=None,
+                                 page_type_index: int = 0, max_workers: int = 1, journal=None,
+                                 output_format: str = DEFAULT_OUTPUT_FORMAT, metrics=None, progress=None) -> str:
+    """
+    기존 결과 파일(xlsx/xls, parquet, csv.gz/csv, jsonl)을 읽어 상세정보를 크롤링 후 새로운 결과 파일로 저장합니다.
+    max_workers가 1보다 크면 상세 페이지를 동시에 요청하며, 결과 행 순서는 입력 순서를 유지합니다.
+    metrics(RunMetrics)를 넘기면 입력 파일 읽기("read_input")와 결과 파일 기록 시간을 집계합니다.
+    """
+    def _log(msg: str, level: str = "info") -> None:
+        if log_callback:
+            log_callback(msg, level)
+
+    if not os.path.exists(input_excel_path):
+        _log(f"입력 파일이 존재하지 않습니다: {input_excel_path}", "error")
+        return None
+
+    read_started = time.perf_counter()
+    try:
+        rows, input_columns = read_rows(input_excel_path)
+    except Exception as e:
+        _log(f"입력 파일 읽기 실패: {e}", "error")
+        return None
+    if metrics is not None:
+        metrics.add("read_input", time.perf_counter() - read_started)
+
+    total_count = len(rows)
+    workers = max(1, min(max_workers, detail_crawler.max_concurrency))
+    _log(f"총 {total_count} 건에 대해 상세정보 크롤링 시작... (동시 요청 수: {workers})")
+    return crawl_detail_info_from_rows(rows, selected_columns, detail_crawler, log_callback=log_callback,
+                                       page_type_index=page_type_index, max_workers=max_workers,
+                                       total=total_count, input_columns=input_columns,
+                                       journal=journal, output_format=output_format, metrics=metrics,
+                                       progress=progress)
@@ -0,0 +1,155 @@
+import threading
+import time
+from collections import deque
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 10
+# 응답 시간 백분위수를 계산할 최근 요청 수
+LATENCY_SAMPLES = 10000
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """
+    정렬된 값 목록의 백분위수(fraction: 0~1, 최근접 순위)를 반환합니다. 값이 없으면 0을 반환합니다.
+    """
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+class RequestCounter:
+    """
+    요청 수, 오류 수, 받은 바이트, 응답 대기 시간을 스레드 안전하게 집계합니다.
+    최근 LATENCY_SAMPLES건의 응답 시간으로 p50/p95를 계산합니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.bytes = 0
+        self.elapsed = 0.0
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, started: float, size: int = 0, error: bool = False) -> None:
+        latency = time.perf_counter() - started
+        with self._lock:
+            self.requests += 1
+            self.errors += int(error)
+            self.bytes += size
+            self.elapsed += latency
+            self._latencies.append(latency)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "bytes": self.bytes,
+                "elapsed": self.elapsed,
+                "avg_latency": (self.elapsed / self.requests) if self.requests else 0.0,
+                "p50_latency": percentile(latencies, 0.50),
+                "p95_latency": percentile(latencies, 0.95),
+            }
+
+class PooledSession:
+    """
+    크롤러들이 공유하는 HTTP 세션:
+      - keep-alive 연결 풀을 재사용하여 요청마다 TCP/TLS 핸드셰이크를 반복하지 않습니다.
+      - 한 번의 실행 동안의 요청/연결 통계를 집계합니다.
+    """
+    # RequestScheduler가 재시도할 네트워크 오류
+    retry_exceptions = (requests.Timeout, requests.ConnectionError)
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, keep_alive: bool = True,
+                 timeout: float = DEFAULT_TIMEOUT):
+        self.pool_size = max(1, pool_size)
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self._session = requests.Session()
+        self._adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        self._session.mount("http://", self._adapter)
+        self._session.mount("https://", self._adapter)
+        if not keep_alive:
+            self._session.headers["Connection"] = "close"
+        self._counter = RequestCounter()
+
+    def get(self, url: str, params: dict = None, timeout: float = None) -> requests.Response:
+        started = time.perf_counter()
+        try:
+            response = self._session.get(url, params=params, timeout=timeout or self.timeout)
+        except Exception:
+            self._counter.record(started, error=True)
+            raise
+        self._counter.record(started, size=len(response.content))
+        return response
+
+    def _new_connection_count(self) -> int:
+        pools = self._adapter.poolmanager.pools
+        count = 0
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                count += getattr(pool, "num_connections", 0)
+        return count
+
+    def stats(self) -> dict:
+        """
+        현재까지의 연결 통계를 반환합니다.
+        """
+        stats = self._counter.snapshot()
+        stats["new_connections"] = self._new_connection_count()
+        stats["reused_connections"] = max(0, stats["requests"] - stats["new_connections"])
+        return stats
+
+    def close(self) -> None:
+        self._session.close()
+
+class SessionView:
+    """
+    여러 작업이 동시에 공유하는 PooledSession을 한 작업 전용으로 감쌉니다:
+      - 요청은 공유 연결 풀로 보내고, 통계는 이 작업의 요청만 따로 집계합니다.
+      - 연결 수는 풀 전체 단위라 작업별로 나눌 수 없으므로 통계에 넣지 않습니다.
+    """
+    def __init__(self, session: PooledSession):
+        self.session = session
+        self.retry_exceptions = session.retry_exceptions
+        self._counter = RequestCounter()
+
+    def get(self, url: str, params: dict = None, timeout: float = None) -> requests.Response:
+        started = time.perf_counter()
+        try:
+            response = self.session.get(url, params=params, timeout=timeout)
+        except Exception:
+            self._counter.record(started, error=True)
+            raise
+        self._counter.record(started, size=len(response.content))
+        return response
+
+    def stats(self) -> dict:
+        return self._counter.snapshot()
+
+def stats_delta(before: dict, after: dict) -> dict:
+    """
+    공유 세션에서 한 작업 구간 동안의 통계만 계산합니다.
+    """
+    delta = {key: after[key] - before[key] for key in
+             ("requests", "errors", "new_connections", "bytes", "elapsed") if key in after}
+    if "new_connections" in delta:
+        delta["reused_connections"] = max(0, delta["requests"] - delta["new_connections"])
+    delta["avg_latency"] = (delta["elapsed"] / delta["requests"]) if delta["requests"] else 0.0
+    # 백분위수는 빼서 구할 수 없으므로 최근 요청 기준 값을 그대로 씁니다.
+    # (작업마다 새 세션이나 SessionView를 쓰므로 사실상 그 작업의 값입니다.)
+    for key in ("p50_latency", "p95_latency"):
+        if key in after:
+            delta[key] = after[key]
+    return delta
+
+def format_stats(stats: dict) -> str:
+    connections = ""
+    if "new_connections" in stats:
+        connections = f"신규 연결 {stats['new_connections']}개, 재사용 {stats['reused_connections']}회, "
+    latency = f"평균 응답 {stats['avg_latency']:.3f}초"
+    if "p95_latency" in stats:
+        latency += f" (p50 {stats['p50_latency']:.3f}초, p95 {stats['p95_latency']:.3f}초)"
+    return f"요청 {stats['requests']}건 (오류 {stats['errors']}건), {connections}{latency}"
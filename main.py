@@ -1,6 +1,7 @@
 import sys
 import os
-from ui import run_app
+import signal
+import multiprocessing
 from utils import read_json_with_encoding
 
 def print_help() -> None:
@@ -9,7 +10,16 @@ def print_help() -> None:
         "사용법:\n"
         "  python main.py              : GUI 모드로 실행\n"
         "  python main.py help         : 도움말 출력\n"
-        "  python main.py <설정파일.json> : 설정 파일에 따라 CLI 모드로 크롤링 실행\n\n"
+        "  python main.py <설정파일.json> : 설정 파일에 따라 CLI 모드로 크롤링 실행\n"
+        "  python main.py <설정파일.json> --resume : 중단된 상세정보 크롤링을 체크포인트부터 이어서 실행\n"
+        "  python main.py batch <폴더> [--jobs N] : 폴더의 설정 파일들을 N개씩 동시에 실행 (GUI 없이)\n"
+        "  python main.py daemon <대기열 폴더> [--jobs N] [--poll 초] [--once]\n"
+        "                              : 대기열 폴더에 들어오는 설정 파일을 계속 실행하는 상주 모드\n"
+        "  --metrics-port 포트          : 실행 중 지표를 http://127.0.0.1:<포트>/metrics 로 제공\n"
+        "                              (설정 파일 실행, batch, daemon 모두 사용 가능)\n"
+        "  --rate-limit 초당요청수        : batch/daemon의 모든 작업을 합친 호스트별 초당 요청 수 (기본 10)\n"
+        "  --log-file 파일.jsonl         : 로그를 한 줄에 하나씩 JSON으로 파일에도 기록 (설정 파일 실행, batch, daemon)\n"
+        "  Ctrl+C                      : 작업을 취소하고 지금까지의 결과를 저장 (daemon은 두 번째 Ctrl+C부터)\n\n"
         "GUI 사용 방법:\n"
         "  1. 크롤링할 URL 입력 (빈 칸이면 기본 URL 사용)\n"
         "  2. 추출할 데이터 건수 설정\n"
@@ -24,27 +34,104 @@ def print_help() -> None:
     )
     print(help_text)
 
-def run_cli_mode(settings: dict) -> None:
-    url_text = settings.get("url", "").strip()
-    extraction_count = settings.get("extraction_count", 50)
-    mode = settings.get("mode", 1)
-    page_type_index = settings.get("page_type_index", 0)
-    selected_excel_path = settings.get("selected_excel_path", "")
-    selected_detail_columns = settings.get("selected_detail_columns", [])
-    
-    def log_callback(msg: str) -> None:
-        print(msg)
-    
+def run_cli_mode(settings: dict, resume: bool = False, metrics_port: int = None, log_file: str = None) -> None:
+    settings = dict(settings)
+    settings["url"] = settings.get("url", "").strip()
+    if resume:
+        settings["resume"] = True
+    if metrics_port is not None:
+        settings["metrics_port"] = metrics_port
+
+    from events import EventLog, print_sink
+    from progress import format_progress, LOG_PROGRESS_INTERVAL
+    from run_control import RunControl
     from worker import CrawlerWorker
     print("CLI 모드 크롤링을 시작합니다...")
-    try:
-        worker = CrawlerWorker(mode, url_text, selected_excel_path, 
-                                 selected_detail_columns, extraction_count, 
-                                 page_type_index, log_callback=log_callback)
-        result = worker.run()
-        print("크롤링 결과:", result)
-    except Exception as e:
-        print(f"크롤링 실행 중 오류 발생: {e}")
+    # 로그는 모아서 flush 간격마다 한 번에 출력합니다. (log_file을 주면 JSONL 파일에도 기록)
+    # 진행 상황(처리/전체 건수, 행/초, 요청 중인 수, 남은 시간)은 LOG_PROGRESS_INTERVAL초마다 한 줄씩 출력합니다.
+    with EventLog([print_sink()], jsonl_path=log_file or settings.get("log_file") or None) as events:
+        control = RunControl()
+        install_cancel_handler(control.cancel, events.emit)
+        try:
+            worker = CrawlerWorker.from_settings(settings, log_callback=events.emit,
+                                                 progress_callback=lambda update: events.emit(format_progress(update)),
+                                                 progress_interval=LOG_PROGRESS_INTERVAL, control=control)
+            result = worker.run()
+        except Exception as e:
+            events.emit(f"크롤링 실행 중 오류 발생: {e}", "error")
+            return
+    print("크롤링 결과:", result)
+
+def option_value(args: list, name: str, default, cast=int):
+    """
+    명령줄 인자에서 "--name 값" 형태의 옵션 값을 읽습니다.
+    """
+    if name in args:
+        idx = args.index(name)
+        if idx + 1 < len(args):
+            try:
+                return cast(args[idx + 1])
+            except ValueError:
+                print(f"{name} 값이 올바르지 않습니다: {args[idx + 1]}")
+                sys.exit(1)
+    return default
+
+def install_cancel_handler(cancel, log) -> None:
+    """
+    Ctrl+C/SIGTERM을 받으면 cancel()을 호출합니다. 작업은 진행 중인 요청을 마친 뒤 지금까지의 결과를 저장하고 멈춥니다.
+    """
+    def request_cancel(signum, frame) -> None:
+        log("취소 요청을 받았습니다. 지금까지의 결과를 저장하고 종료합니다.")
+        cancel()
+
+    signal.signal(signal.SIGINT, request_cancel)
+    signal.signal(signal.SIGTERM, request_cancel)
+
+def open_event_log(args: list):
+    """
+    batch/daemon 모드의 로그 스트림: 줄 앞에 시각을 붙여 출력하고, --log-file을 주면 JSONL 파일에도 기록합니다.
+    """
+    from events import EventLog, print_sink
+    return EventLog([print_sink(with_time=True)], jsonl_path=option_value(args, "--log-file", None, str))
+
+def run_batch_mode(folder_path: str, args: list) -> None:
+    from batch import BatchRunner, list_job_files, DEFAULT_PARALLEL_JOBS
+    if not os.path.isdir(folder_path):
+        print(f"폴더가 존재하지 않습니다: {folder_path}")
+        sys.exit(1)
+    with open_event_log(args) as events:
+        runner = BatchRunner(list_job_files(folder_path), log_callback=events.emit,
+                             parallel_jobs=option_value(args, "--jobs", DEFAULT_PARALLEL_JOBS),
+                             rate_limit=option_value(args, "--rate-limit", None, float),
+                             metrics_port=option_value(args, "--metrics-port", 0))
+        install_cancel_handler(runner.cancel, events.emit)
+        results = runner.run()
+    sys.exit(0 if all(r.ok for r in results) else 1)
+
+def run_daemon_mode(queue_dir: str, args: list) -> None:
+    from batch import JobQueueDaemon, DEFAULT_PARALLEL_JOBS, DEFAULT_POLL_SECONDS
+    events = open_event_log(args)
+    daemon = JobQueueDaemon(queue_dir, log_callback=events.emit,
+                            parallel_jobs=option_value(args, "--jobs", DEFAULT_PARALLEL_JOBS),
+                            rate_limit=option_value(args, "--rate-limit", None, float),
+                            poll_seconds=option_value(args, "--poll", DEFAULT_POLL_SECONDS, float),
+                            once="--once" in args,
+                            metrics_port=option_value(args, "--metrics-port", 0))
+
+    def request_stop(signum, frame) -> None:
+        if daemon.stopping:
+            events.emit("다시 종료 요청을 받았습니다. 실행 중인 작업을 취소하고 지금까지의 결과를 저장합니다.")
+            daemon.cancel()
+            return
+        events.emit("종료 요청을 받았습니다. 실행 중인 작업이 끝나면 종료합니다. (한 번 더 누르면 작업을 취소합니다)")
+        daemon.stop()
+
+    # Ctrl+C/SIGTERM은 실행 중인 작업을 끊지 않고 새 작업만 멈춥니다. 두 번째 요청은 실행 중인 작업을 취소합니다.
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+    with events:
+        daemon.run()
+    sys.exit(0)
 
 def main():
     if len(sys.argv) > 1:
@@ -52,6 +139,14 @@ def main():
         if arg == "help":
             print_help()
             sys.exit(0)
+        elif arg in ("batch", "daemon"):
+            if len(sys.argv) < 3:
+                print(f"폴더를 지정해야 합니다: python main.py {arg} <폴더>")
+                sys.exit(1)
+            if arg == "batch":
+                run_batch_mode(sys.argv[2], sys.argv[3:])
+            else:
+                run_daemon_mode(sys.argv[2], sys.argv[3:])
         elif arg.endswith(".json"):
             json_file = sys.argv[1]
             if not os.path.exists(json_file):
@@ -62,10 +157,15 @@ def main():
             except Exception as e:
                 print(f"설정 파일 읽기 실패: {e}")
                 sys.exit(1)
-            run_cli_mode(settings)
+            run_cli_mode(settings, resume="--resume" in sys.argv[2:],
+                         metrics_port=option_value(sys.argv[2:], "--metrics-port", None),
+                         log_file=option_value(sys.argv[2:], "--log-file", None, str))
             sys.exit(0)
-    # 인자가 없으면 GUI 모드 실행
+    # 인자가 없으면 GUI 모드 실행 (PyQt5는 GUI 모드에서만 불러옵니다)
+    from ui import run_app
     run_app()
 
 if __name__ == "__main__":
+    # 실행 파일로 묶었을 때 파서 프로세스(parse_workers)가 GUI/CLI를 다시 실행하지 않도록 합니다.
+    multiprocessing.freeze_support()
     main()
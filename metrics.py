@@ -0,0 +1,250 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from http_session import percentile, LATENCY_SAMPLES
+
+# 요청 응답 시간 히스토그램 구간 상한(초). 마지막 구간(None)은 그보다 긴 요청입니다.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 단계:
+#   - network: 요청 시도별 응답 대기 시간 (재시도 포함, 동시 요청은 각각 더함)
+#   - wait: 속도 제한/동시 요청 한도/재시도 백오프로 기다린 시간
+#   - parse: HTML 파싱 시간 (파서 프로세스를 쓰면 결과를 기다린 시간)
+#   - read_input: 모드 3 입력 파일을 읽어 행 목록(DataFrame)을 만드는 시간
+#   - write: 결과 파일 기록 시간
+STAGES = ("network", "wait", "parse", "read_input", "write")
+
+def _now_text() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+class _TimedSend:
+    """
+    RequestScheduler에 넘기는 send를 감싸 시도마다 응답 시간과 재시도를 기록합니다.
+    """
+    def __init__(self, metrics: "RunMetrics", send):
+        self.metrics = metrics
+        self.send = send
+        self.attempts = 0
+        self.network = 0.0
+
+    def _start(self) -> float:
+        if self.attempts:
+            self.metrics.count_retry()
+        self.attempts += 1
+        self.metrics.begin_request()
+        return time.perf_counter()
+
+    def _finish(self, started: float, error: bool) -> None:
+        latency = time.perf_counter() - started
+        self.network += latency
+        self.metrics.observe_request(latency, error)
+
+    def __call__(self):
+        started = self._start()
+        try:
+            response = self.send()
+        except Exception:
+            self._finish(started, True)
+            raise
+        self._finish(started, response.status_code >= 400)
+        return response
+
+    async def call_async(self):
+        started = self._start()
+        try:
+            response = await self.send()
+        except Exception:
+            self._finish(started, True)
+            raise
+        self._finish(started, response.status_code >= 400)
+        return response
+
+class RunMetrics:
+    """
+    한 작업의 실행 지표를 스레드 안전하게 집계합니다:
+      - 단계별(STAGES) 누적 시간과 횟수
+      - 요청 시도별 응답 시간 히스토그램(LATENCY_BUCKETS), p50/p95, 오류 수, 재시도 수
+      - 지금 응답을 기다리는 요청 수(in_flight)
+    크롤러(BaseCrawler/DetailCrawler)와 결과 파일 작성기가 같은 객체에 기록하며, snapshot()은 언제든 호출할 수 있습니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = _now_text()
+        self._started = time.perf_counter()
+        self._stages = {stage: [0.0, 0] for stage in STAGES}
+        self._buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self._requests = 0
+        self._errors = 0
+        self._retries = 0
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return self._in_flight
+
+    def add(self, stage: str, seconds: float, count: int = 1) -> None:
+        with self._lock:
+            entry = self._stages.setdefault(stage, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += count
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def begin_request(self) -> None:
+        with self._lock:
+            self._in_flight += 1
+
+    def observe_request(self, latency: float, error: bool = False) -> None:
+        """
+        끝난 요청 시도를 기록합니다. (begin_request로 시작한 시도는 반드시 여기서 끝냅니다)
+        """
+        bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS) if latency <= bound), len(LATENCY_BUCKETS))
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._requests += 1
+            self._errors += int(error)
+            self._buckets[bucket] += 1
+            self._latencies.append(latency)
+            self._stages["network"][0] += latency
+            self._stages["network"][1] += 1
+
+    def count_retry(self) -> None:
+        with self._lock:
+            self._retries += 1
+
+    def request(self, execute, send):
+        """
+        execute(send)로 요청을 실행하면서 시도별 응답 시간, 재시도, 스케줄러 대기 시간을 기록합니다.
+        execute는 감싼 send를 받아 RequestScheduler.execute를 호출하는 함수입니다.
+        """
+        timed = _TimedSend(self, send)
+        started = time.perf_counter()
+        try:
+            return execute(timed)
+        finally:
+            self.add("wait", max(0.0, time.perf_counter() - started - timed.network))
+
+    async def request_async(self, execute, send):
+        """
+        request()의 asyncio 버전입니다. send는 응답을 반환하는 코루틴 함수입니다.
+        """
+        timed = _TimedSend(self, send)
+        started = time.perf_counter()
+        try:
+            return await execute(timed.call_async)
+        finally:
+            self.add("wait", max(0.0, time.perf_counter() - started - timed.network))
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            return {
+                "started_at": self.started_at,
+                "elapsed_seconds": round(time.perf_counter() - self._started, 3),
+                "stages": {stage: {"seconds": round(seconds, 4), "count": count}
+                           for stage, (seconds, count) in self._stages.items()},
+                "requests": {
+                    "count": self._requests,
+                    "errors": self._errors,
+                    "retries": self._retries,
+                    "in_flight": self._in_flight,
+                    "p50_latency": round(percentile(latencies, 0.50), 4),
+                    "p95_latency": round(percentile(latencies, 0.95), 4),
+                    "histogram": [{"le": bound, "count": count}
+                                  for bound, count in zip(LATENCY_BUCKETS + (None,), self._buckets)],
+                },
+            }
+
+def format_stage_summary(snapshot: dict) -> str:
+    """
+    단계별 누적 시간을 한 줄로 요약합니다. (기록이 없는 단계는 생략)
+    """
+    names = {"network": "네트워크", "wait": "대기", "parse": "파싱", "read_input": "입력 읽기", "write": "파일 기록"}
+    parts = [f"{names.get(stage, stage)} {entry['seconds']:.2f}초"
+             for stage, entry in snapshot["stages"].items() if entry["count"]]
+    return ", ".join(parts) if parts else "기록 없음"
+
+def write_report(path: str, report: dict) -> None:
+    """
+    실행 지표 보고서를 JSON으로 저장합니다. (임시 파일에 쓴 뒤 교체)
+    """
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+class MetricsServer:
+    """
+    실행 중인 지표를 JSON으로 보여 주는 HTTP 엔드포인트 (GET /metrics):
+      - source()가 반환하는 dict를 요청마다 JSON으로 응답합니다.
+      - 백그라운드 스레드에서 실행하며, 기본적으로 로컬(127.0.0.1)에서만 접속할 수 있습니다.
+    """
+    def __init__(self, port: int, source, host: str = "127.0.0.1"):
+        self.source = source
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="kapt-metrics", daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self) -> "MetricsServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = json.dumps(server.source(), ensure_ascii=False).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+def start_metrics_server(port: int, source, log_callback=None) -> MetricsServer:
+    """
+    port가 0이 아니면 MetricsServer를 시작해 반환합니다. 포트를 열 수 없으면 기록만 하고 None을 반환합니다.
+    """
+    if not port:
+        return None
+    try:
+        server = MetricsServer(port, source).start()
+    except OSError as e:
+        if log_callback:
+            log_callback(f"지표 엔드포인트를 열 수 없습니다 (포트 {port}): {e}", "error")
+        return None
+    if log_callback:
+        log_callback(f"지표 엔드포인트: {server.url}")
+    return server
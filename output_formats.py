@@ -0,0 +1,283 @@
+import os
+import csv
+import gzip
+import json
+import time
+import importlib.util
+from datetime import datetime
+
+# 결과 파일 형식 -> 확장자
+OUTPUT_FORMATS = {"xlsx": ".xlsx", "parquet": ".parquet", "csv.gz": ".csv.gz", "jsonl": ".jsonl"}
+DEFAULT_OUTPUT_FORMAT = "xlsx"
+# 읽기 전용으로 추가 지원하는 확장자
+INPUT_EXTENSIONS = {".xls": "xlsx", ".csv": "csv"}
+
+# parquet 저장 시 숫자/날짜 타입으로 바꿔 볼 컬럼 (값이 모두 변환될 때만 적용)
+INTEGER_COLUMNS = {"순번", "계약금액", "동수", "세대수", "입찰보증금"}
+DATE_COLUMNS = {"계약일", "입찰마감일", "공고일", "계약(예정)일", "등록일", "입찰서 제출 마감일", "서류제출마감일",
+                "현장설명일시"}
+# parquet은 이 행 수마다 row group 하나씩 기록하므로 메모리에는 한 묶음만 남습니다.
+PARQUET_ROW_GROUP_SIZE = 5000
+# pyarrow는 parquet 형식에만 필요한 선택 패키지입니다. (requirements.txt에 포함하지 않음)
+PYARROW_MISSING = "parquet 형식으로 저장하려면 pyarrow 패키지가 필요합니다. (pip install pyarrow)"
+
+def output_extension(output_format: str) -> str:
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"지원되지 않는 결과 파일 형식: {output_format}")
+    return OUTPUT_FORMATS[output_format]
+
+def check_output_format(output_format: str) -> None:
+    """
+    결과 파일 형식을 확인합니다. 크롤링을 시작하기 전에 부르면, 지원하지 않는 형식이나
+    parquet인데 pyarrow가 없는 경우를 요청을 보내기 전에 알 수 있습니다.
+    """
+    output_extension(output_format)
+    if output_format == "parquet" and importlib.util.find_spec("pyarrow") is None:
+        raise ImportError(PYARROW_MISSING)
+
+def format_for_path(path: str) -> str:
+    """
+    파일 확장자로 형식("xlsx", "parquet", "csv.gz", "jsonl", "csv")을 판단합니다.
+    """
+    lower = path.lower()
+    for output_format, extension in OUTPUT_FORMATS.items():
+        if lower.endswith(extension):
+            return output_format
+    for extension, input_format in INPUT_EXTENSIONS.items():
+        if lower.endswith(extension):
+            return input_format
+    raise ValueError(f"지원되지 않는 파일 형식: {path}")
+
+def _cell_value(value):
+    # pandas에서 읽은 빈 칸(NaN)은 빈 값으로 기록합니다.
+    if isinstance(value, float) and value != value:
+        return None
+    return value
+
+class RowWriter:
+    """
+    행을 받는 대로 기록하는 결과 파일 작성기의 공통 부분:
+      - write_row(행 dict)로 columns 순서대로 기록하고, rows_written에 기록한 행 수를 셉니다.
+      - with 문으로 사용하면 블록을 벗어날 때 파일을 닫습니다.
+      - metrics(RunMetrics)가 있으면 행 기록과 파일 닫기에 걸린 시간을 "write" 단계로 기록합니다.
+    """
+    metrics = None
+
+    def __init__(self, filename: str, columns: list):
+        self.filename = filename
+        self.columns = list(columns)
+        self.rows_written = 0
+
+    def write_row(self, item: dict) -> None:
+        started = time.perf_counter()
+        self._write_values([_cell_value(item.get(col, None)) for col in self.columns])
+        self.rows_written += 1
+        if self.metrics is not None:
+            self.metrics.add("write", time.perf_counter() - started)
+
+    def _write_values(self, values: list) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        started = time.perf_counter()
+        self._close()
+        if self.metrics is not None:
+            self.metrics.add("write", time.perf_counter() - started)
+
+    def _close(self) -> None:
+        raise NotImplementedError
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+class StreamingExcelWriter(RowWriter):
+    """
+    쓰기 전용 엑셀 작성기:
+      - openpyxl write_only 모드를 사용하여 행 수와 관계없이 메모리 사용량이 일정합니다.
+    """
+    def __init__(self, filename: str, columns: list, sheet_title: str = None):
+        super().__init__(filename, columns)
+        import openpyxl  # 엑셀을 실제로 쓸 때만 불러옵니다.
+        self._wb = openpyxl.Workbook(write_only=True)
+        self._ws = self._wb.create_sheet(title=sheet_title)
+        self._ws.append(self.columns)
+
+    def _write_values(self, values: list) -> None:
+        self._ws.append(values)
+
+    def _close(self) -> None:
+        self._wb.save(self.filename)
+
+class CsvGzipWriter(RowWriter):
+    """
+    gzip으로 압축한 UTF-8 CSV 작성기 (첫 줄은 컬럼명, 빈 값은 빈 칸)
+    """
+    def __init__(self, filename: str, columns: list):
+        super().__init__(filename, columns)
+        self._file = gzip.open(filename, "wt", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.columns)
+
+    def _write_values(self, values: list) -> None:
+        self._writer.writerow(["" if value is None else value for value in values])
+
+    def _close(self) -> None:
+        self._file.close()
+
+class JsonlWriter(RowWriter):
+    """
+    한 줄에 한 행씩 JSON 객체로 기록하는 작성기 (빈 값은 null)
+    """
+    def __init__(self, filename: str, columns: list):
+        super().__init__(filename, columns)
+        self._file = open(filename, "w", encoding="utf-8")
+
+    def _write_values(self, values: list) -> None:
+        self._file.write(json.dumps(dict(zip(self.columns, values)), ensure_ascii=False, default=str) + "\n")
+
+    def _close(self) -> None:
+        self._file.close()
+
+def _to_int(value):
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return int(str(value).strip().replace(",", "").removesuffix("원").strip())
+
+def _to_datetime(value):
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value).strip().replace(".", "-").replace("/", "-"))
+
+class ParquetWriter(RowWriter):
+    """
+    Parquet 작성기 (pyarrow 필요):
+      - INTEGER_COLUMNS/DATE_COLUMNS에 속한 컬럼은 빈 값을 뺀 파일 전체의 값이 변환될 때만 int64/timestamp로,
+        그 밖의 컬럼(또는 'FAILED' 등 변환되지 않는 값이 섞인 컬럼)은 문자열로 기록합니다.
+      - 타입은 마지막 행까지 봐야 정해지므로, row_group_size행마다 문자열 값과 변환한 값을 함께 임시 파일에
+        row group으로 기록해 두고, close()에서 row group 단위로 옮겨 쓰며 컬럼마다 한쪽을 고릅니다.
+        (메모리에는 한 묶음만 남습니다)
+    """
+    row_group_size = PARQUET_ROW_GROUP_SIZE
+
+    def __init__(self, filename: str, columns: list):
+        super().__init__(filename, columns)
+        try:
+            import pyarrow  # parquet으로 저장할 때만 불러옵니다.
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError(PYARROW_MISSING)
+        self._pa = pyarrow
+        self._rows = []
+        pa = pyarrow
+        # 타입을 바꿔 볼 컬럼 -> (변환 함수, 타입). 임시 파일에는 "컬럼명#typed" 컬럼으로 함께 기록합니다.
+        self._typed = {}
+        for name in self.columns:
+            if name in INTEGER_COLUMNS:
+                self._typed[name] = (_to_int, pa.int64())
+            elif name in DATE_COLUMNS:
+                self._typed[name] = (_to_datetime, pa.timestamp("s"))
+        self._convertible = dict.fromkeys(self._typed, True)
+        self._has_values = dict.fromkeys(self._typed, False)
+        self._tmp_path = filename + ".tmp"
+        self._tmp_writer = None
+
+    def _write_values(self, values: list) -> None:
+        self._rows.append(values)
+        if len(self._rows) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        pa = self._pa
+        columns = list(zip(*self._rows)) if self._rows else [[] for _ in self.columns]
+        arrays = {}
+        for name, values in zip(self.columns, columns):
+            arrays[name] = pa.array([None if v is None else str(v) for v in values], type=pa.string())
+            if name not in self._typed:
+                continue
+            convert, arrow_type = self._typed[name]
+            typed = None
+            if self._convertible[name]:
+                self._has_values[name] |= any(v is not None and v != "" for v in values)
+                try:
+                    typed = pa.array([None if v is None or v == "" else convert(v) for v in values], type=arrow_type)
+                except (ValueError, TypeError):
+                    self._convertible[name] = False
+            arrays[name + "#typed"] = typed if typed is not None else pa.nulls(len(values), type=arrow_type)
+        table = pa.table(arrays)
+        if self._tmp_writer is None:
+            self._tmp_writer = pa.parquet.ParquetWriter(self._tmp_path, table.schema)
+        self._tmp_writer.write_table(table)
+        self._rows = []
+
+    def _close(self) -> None:
+        pa = self._pa
+        if self._rows or self._tmp_writer is None:
+            self._flush()
+        self._tmp_writer.close()
+        chosen = [name + "#typed" if name in self._typed and self._convertible[name] and self._has_values[name]
+                  else name for name in self.columns]
+        source = pa.parquet.ParquetFile(self._tmp_path)
+        try:
+            schema = pa.schema([source.schema_arrow.field(src).with_name(name)
+                                for name, src in zip(self.columns, chosen)])
+            with pa.parquet.ParquetWriter(self.filename, schema) as writer:
+                for i in range(source.num_row_groups):
+                    group = source.read_row_group(i, columns=chosen)
+                    writer.write_table(pa.Table.from_arrays([group.column(src) for src in chosen], schema=schema))
+        finally:
+            source.close()
+            os.remove(self._tmp_path)
+
+def open_writer(filename: str, columns: list, sheet_title: str = None, metrics=None) -> RowWriter:
+    """
+    파일 확장자에 맞는 결과 파일 작성기를 반환합니다. metrics(RunMetrics)를 넘기면 기록 시간을 집계합니다.
+    """
+    output_format = format_for_path(filename)
+    if output_format == "xlsx":
+        writer = StreamingExcelWriter(filename, columns, sheet_title=sheet_title)
+    elif output_format == "csv.gz":
+        writer = CsvGzipWriter(filename, columns)
+    elif output_format == "jsonl":
+        writer = JsonlWriter(filename, columns)
+    elif output_format == "parquet":
+        writer = ParquetWriter(filename, columns)
+    else:
+        raise ValueError(f"지원되지 않는 결과 파일 형식: {filename}")
+    writer.metrics = metrics
+    return writer
+
+def _dataframe_rows(df) -> tuple:
+    # 빈 값(NaN/NaT)은 None으로 바꿔 다른 형식에서 읽은 행과 같게 맞춥니다.
+    df = df.astype(object).where(df.notna(), None)
+    return df.to_dict("records"), list(df.columns)
+
+def read_rows(path: str) -> tuple:
+    """
+    결과 파일(xlsx/xls, parquet, csv.gz/csv, jsonl)을 읽어 (행 목록, 컬럼 목록)을 반환합니다.
+    """
+    input_format = format_for_path(path)
+    if input_format == "xlsx":
+        import pandas as pd  # 엑셀을 읽을 때만 필요합니다.
+        return _dataframe_rows(pd.read_excel(path))
+    if input_format == "parquet":
+        import pandas as pd
+        return _dataframe_rows(pd.read_parquet(path))
+    if input_format in ("csv.gz", "csv"):
+        opener = gzip.open if input_format == "csv.gz" else open
+        with opener(path, "rt", encoding="utf-8-sig", newline="") as f:
+            reader = csv.DictReader(f)
+            return list(reader), list(reader.fieldnames or [])
+    rows, columns = [], {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                rows.append(row)
+                columns.update(dict.fromkeys(row))
+    return rows, list(columns)
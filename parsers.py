@@ -0,0 +1,435 @@
+import re
+from typing import TYPE_CHECKING
+from lxml import etree, html as lxml_html
+
+if TYPE_CHECKING:
+    # 타입 표기용입니다. 실행 중에는 bs4 파서를 고른 경우에만 make_soup에서 불러옵니다.
+    from bs4 import BeautifulSoup
+
+PARSER_BACKENDS = ("lxml", "bs4")
+DEFAULT_PARSER = "lxml"
+
+# 상세정보 링크를 만들 사이트. 로컬 서버로 측정하는 벤치마크만 설정의 site로 바꿉니다.
+DEFAULT_SITE = "https://www.k-apt.go.kr"
+PRIVATE_CONTRACT_DETAIL_PATH = "/bid/privateContractDetail.do?pcNum={}"
+BID_DETAIL_PATH = "/bid/bidDetail.do?bidNum={}"
+PRIVATE_CONTRACT_DETAIL_URL = DEFAULT_SITE + PRIVATE_CONTRACT_DETAIL_PATH
+BID_DETAIL_URL = DEFAULT_SITE + BID_DETAIL_PATH
+
+PRIVATE_CONTRACT_DETAIL_FIELDS = [
+    '주택관리업자', '아파트명', '관리사무소 주소', '전화번호', '팩스번호',
+    '동수', '세대수', '계약번호', '계약명', '계약업체명',
+    '업체대표자명', '업체전화번호', '사업자등록번호', '업체주소',
+    '계약(예정)일', '계약금액', '계약기간', '등록일', '분류',
+    '수의계약 체결사유'
+]
+BID_DETAIL_FIELDS = [
+    '주택관리업자', '단지명', '관리사무소 주소', '전화번호', '팩스번호',
+    '동수', '세대수', '입찰번호', '입찰방법', '입찰서 제출 마감일',
+    '입찰제목', '긴급입찰여부', '입찰종류', '낙찰방법', '입찰분류',
+    '신용평가등급확인서 제출여부', '현장설명', '관리(공사용역) 실적증명서 제출여부',
+    '현장설명일시', '현장설명장소', '서류제출마감일', '입찰보증금',
+    '지급조건', '내용', '계약번호', '계약명', '계약업체명',
+    '업체대표자명', '업체전화번호', '사업자등록번호', '업체주소',
+    '계약(예정)일', '계약기간', '계약금액', '등록일', '분류',
+    '수의계약 체결사유'
+]
+# 입찰공고 상세 페이지는 항목명이 곧 결과 컬럼명입니다.
+BID_DETAIL_MAPPING = {field: field for field in BID_DETAIL_FIELDS}
+# 수의계약 상세 페이지의 공통 정보 표(첫 행)의 열 순서
+PRIVATE_CONTRACT_COMMON_FIELDS = ['주택관리업자', '아파트명', '관리사무소 주소', '전화번호', '팩스번호', '동수', '세대수']
+# 수의계약 상세 페이지의 항목명 -> 결과 컬럼명
+PRIVATE_CONTRACT_DETAIL_MAPPING = {
+    "주택관리업자": "주택관리업자",
+    "아파트명": "아파트명",
+    "단지명": "아파트명",
+    "관리사무소 주소": "관리사무소 주소",
+    "전화번호": "전화번호",
+    "팩스번호": "팩스번호",
+    "동수": "동수",
+    "세대수": "세대수",
+    "계약번호": "계약번호",
+    "계약명": "계약명",
+    "계약업체명": "계약업체명",
+    "업체대표자명": "업체대표자명",
+    "업체전화번호": "업체전화번호",
+    "사업자등록번호": "사업자등록번호",
+    "업체주소": "업체주소",
+    "계약(예정)일": "계약(예정)일",
+    "계약금액": "계약금액",
+    "계약기간": "계약기간",
+    "등록일": "등록일",
+    "분 류": "분류",
+    "분류": "분류",
+    "수의계약 체결사유": "수의계약 체결사유"
+}
+
+# 목록 행에 같은 값이 그대로 나오는 상세 컬럼 -> 목록 컬럼
+PRIVATE_CONTRACT_SUMMARY_SOURCES = {"아파트명": "단지명", "계약명": "계약명", "계약금액": "계약금액", "계약기간": "계약기간"}
+BID_SUMMARY_SOURCES = {"단지명": "단지명", "낙찰방법": "낙찰방법", "입찰제목": "입찰공고명"}
+
+GO_LIST_PATTERN = re.compile(r"goList\((\d+)\)")
+GO_VIEW_PATTERN = re.compile(r"goView\('(.+?)'\)")
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+class DetailSchema:
+    """
+    상세 페이지 항목 스키마 (페이지 유형별로 한 번만 만들어 둡니다):
+      - fields: 결과 컬럼 목록(순서 포함)
+      - headers: 항목명 -> 결과 컬럼. 항목명 셀과 값 셀이 번갈아 나오는 contTbl 표에서 사용합니다.
+      - common_fields: 공통 정보 표(contTbl txtC) 첫 행의 열 순서. None인 열은 읽지 않습니다.
+      - normalize_headers: 항목명의 연속 공백을 한 칸으로 바꿔 비교할지 여부
+      - first_pair_table_only: True이면 txtC가 아닌 첫 contTbl 표만, False이면 모든 contTbl 표를 읽습니다.
+      - summary_sources: 목록 행에서 같은 값을 얻을 수 있는 컬럼 -> 목록 컬럼
+      - 같은 컬럼이 여러 번 나오면 기존 방식대로 마지막에 찾은 값을 사용합니다. (공통 정보 표 -> contTbl 표 순서)
+        파서는 이 순서를 거꾸로 읽어 컬럼을 모두 찾는 즉시 멈춥니다.
+    """
+    def __init__(self, fields: list, headers: dict, common_fields: list = None,
+                 normalize_headers: bool = False, first_pair_table_only: bool = False,
+                 summary_sources: dict = None):
+        self.fields = list(fields)
+        self.headers = dict(headers)
+        self.common_fields = list(common_fields) if common_fields else []
+        self.normalize_headers = normalize_headers
+        self.first_pair_table_only = first_pair_table_only
+        self.summary_sources = dict(summary_sources or {})
+        self.reads_common = any(self.common_fields)
+        # 추출할 컬럼이 모두 목록 행에 있으면 상세 페이지를 받을 필요가 없습니다.
+        self.summary_only = all(field in self.summary_sources for field in self.fields)
+
+    def select(self, columns: list) -> "DetailSchema":
+        """
+        columns에 있는 결과 컬럼만 추출하는 스키마를 반환합니다. columns가 None이면 전체 스키마를 그대로 씁니다.
+        """
+        if columns is None:
+            return self
+        wanted = set(columns)
+        return DetailSchema([field for field in self.fields if field in wanted],
+                            {header: field for header, field in self.headers.items() if field in wanted},
+                            [field if field in wanted else None for field in self.common_fields],
+                            self.normalize_headers, self.first_pair_table_only, self.summary_sources)
+
+    def needed_columns(self, selected_columns: list, row_columns: list) -> list:
+        """
+        결과 행({**목록 행, **상세정보})을 만들 때 상세 페이지에서 읽어야 하는 컬럼을 반환합니다.
+        목록 행과 이름이 같은 상세 컬럼은 상세 값이 목록 값을 덮어쓰므로 함께 읽되,
+        목록 행에 같은 값이 그대로 있는 컬럼(summary_sources)은 읽지 않습니다.
+        """
+        overwritten = [column for column in row_columns
+                       if column in self.fields and self.summary_sources.get(column) != column]
+        return list(dict.fromkeys(list(selected_columns) + overwritten))
+
+    def from_summary(self, row: dict) -> dict:
+        """
+        summary_only 스키마이고 목록 행에 필요한 컬럼이 있으면 그 값으로 만든 결과를, 아니면 None을 반환합니다.
+        """
+        if not self.summary_only or any(self.summary_sources[field] not in row for field in self.fields):
+            return None
+        return {field: row[self.summary_sources[field]] for field in self.fields}
+
+    def column_for(self, header_text: str) -> str:
+        """
+        항목명에 해당하는 결과 컬럼을 반환합니다. 추출 대상이 아니면 None을 반환합니다.
+        """
+        column = self.headers.get(header_text)
+        # 항목명에 연속 공백이나 줄바꿈이 있을 때만 정규화 결과로 다시 찾습니다.
+        if column is None and self.normalize_headers:
+            column = self.headers.get(WHITESPACE_PATTERN.sub(' ', header_text))
+        return column
+
+PRIVATE_CONTRACT_DETAIL_SCHEMA = DetailSchema(PRIVATE_CONTRACT_DETAIL_FIELDS, PRIVATE_CONTRACT_DETAIL_MAPPING,
+                                              common_fields=PRIVATE_CONTRACT_COMMON_FIELDS,
+                                              normalize_headers=True, first_pair_table_only=True,
+                                              summary_sources=PRIVATE_CONTRACT_SUMMARY_SOURCES)
+BID_DETAIL_SCHEMA = DetailSchema(BID_DETAIL_FIELDS, BID_DETAIL_MAPPING, summary_sources=BID_SUMMARY_SOURCES)
+
+def detail_schema(page_type_index: int) -> DetailSchema:
+    return PRIVATE_CONTRACT_DETAIL_SCHEMA if page_type_index == 0 else BID_DETAIL_SCHEMA
+
+def _detail_link(page_type_index: int, onclick_attr: str, site: str) -> str:
+    match = GO_VIEW_PATTERN.search(onclick_attr)
+    detail_id = match.group(1) if match else ""
+    if page_type_index == 0:
+        return site + PRIVATE_CONTRACT_DETAIL_PATH.format(detail_id) if detail_id else ""
+    return site + BID_DETAIL_PATH.format(detail_id)
+
+def _listing_row(page_type_index: int, texts: list, onclick_attr: str, site: str = DEFAULT_SITE) -> dict:
+    detail_link = _detail_link(page_type_index, onclick_attr, site)
+    if page_type_index == 0:
+        return {
+            "순번": texts[0],
+            "단지명": texts[1],
+            "계약업체": texts[2],
+            "계약명": texts[3],
+            "계약일": texts[4],
+            "계약금액": texts[5],
+            "계약기간": texts[6],
+            "상세정보링크": detail_link
+        }
+    return {
+        "순번": texts[0],
+        "종류": texts[1],
+        "낙찰방법": texts[2],
+        "입찰공고명": texts[3],
+        "입찰마감일": texts[4],
+        "상태": texts[5],
+        "단지명": texts[6],
+        "공고일": texts[7],
+        "상세정보링크": detail_link
+    }
+
+def make_soup(html: str) -> "BeautifulSoup":
+    # bs4는 bs4 파서를 고른 경우에만 불러옵니다. (기본 lxml 파서 사용 시 시작 시간 단축)
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, "lxml")
+
+class SoupParser:
+    """
+    BeautifulSoup 기반 파서 (기존 방식):
+      - LxmlParser와 결과가 같아야 하며, 결과 비교 기준으로 남겨 둡니다.
+      - columns를 주면 상세 페이지에서 그 컬럼만 추출합니다. (None이면 전체)
+      - site: 상세정보 링크를 만들 사이트 (기본 DEFAULT_SITE)
+    """
+    name = "bs4"
+
+    def __init__(self, page_type_index: int = 0, columns: list = None, site: str = DEFAULT_SITE):
+        self.page_type_index = page_type_index
+        self.schema = detail_schema(page_type_index).select(columns)
+        self.site = site
+
+    def parse_listing(self, html: str) -> tuple:
+        """
+        목록 페이지 HTML에서 (마지막 페이지 번호, 행 목록)을 반환합니다.
+        """
+        soup = make_soup(html)
+        return self.get_last_page_number(soup), self.parse_bid_table(soup)
+
+    def get_last_page_number(self, soup: "BeautifulSoup") -> int:
+        pagination_div = soup.find("div", class_="pagination")
+        if not pagination_div:
+            return 1
+
+        last_link = pagination_div.find("a", class_="last")
+        if last_link and last_link.get("href"):
+            match = GO_LIST_PATTERN.search(last_link["href"])
+            if match:
+                return int(match.group(1))
+
+        page_links = pagination_div.find_all("a", class_="page")
+        page_numbers = []
+        for link in page_links:
+            href_val = link.get("href", "")
+            match = GO_LIST_PATTERN.search(href_val)
+            if match:
+                page_numbers.append(int(match.group(1)))
+        return max(page_numbers) if page_numbers else 1
+
+    def parse_bid_table(self, soup: "BeautifulSoup") -> list:
+        data_list = []
+        if self.page_type_index == 0:
+            table = soup.find("table", {"class": "contTbl txtC"})
+            min_cells = 7
+        else:
+            table = soup.find("table", id="tblBidList")
+            min_cells = 8
+        if not table:
+            return data_list
+
+        tbody = table.find("tbody")
+        if not tbody:
+            return data_list
+
+        for row in tbody.find_all("tr"):
+            tds = row.find_all("td")
+            if len(tds) < min_cells:
+                continue
+            texts = [td.get_text(strip=True) for td in tds[:min_cells]]
+            data_list.append(_listing_row(self.page_type_index, texts, tds[0].get("onclick", ""), self.site))
+        return data_list
+
+    def parse_detail(self, html: str) -> dict:
+        """
+        같은 컬럼은 마지막에 나온 값을 쓰므로 표, 행, 항목을 뒤에서부터 읽어 처음 찾은 값을 확정하고,
+        추출할 컬럼을 모두 찾으면 나머지(앞쪽) 표와 공통 정보 표는 읽지 않습니다.
+        """
+        schema = self.schema
+        data = dict.fromkeys(schema.fields, '')
+        remaining = set(schema.fields)
+        soup = make_soup(html)
+        if schema.headers:
+            tables = soup.find_all("table", class_="contTbl")
+            if schema.first_pair_table_only:
+                tables = [t for t in tables if "txtC" not in t.get("class", [])][:1]
+            for table in reversed(tables):
+                if not remaining:
+                    break
+                self._read_pair_table(table, data, remaining)
+        if schema.reads_common and remaining:
+            table_common = soup.find("table", class_="contTbl txtC")
+            tbody = table_common.find("tbody") if table_common else None
+            row = tbody.find("tr") if tbody else None
+            if row:
+                cells = row.find_all("td")
+                if len(cells) >= len(schema.common_fields):
+                    for field, cell in zip(schema.common_fields, cells):
+                        if field in remaining:
+                            data[field] = cell.get_text(strip=True)
+        return data
+
+    def _read_pair_table(self, table, data: dict, remaining: set) -> None:
+        """
+        항목명/값 셀이 번갈아 나오는 표를 뒤에서부터 읽어, 아직 찾지 못한 컬럼(remaining)의 값을 채웁니다.
+        """
+        tbody = table.find("tbody")
+        if not tbody:
+            return
+        for row in reversed(tbody.find_all("tr")):
+            cells = row.find_all(["th", "td"])
+            for i in reversed(range(0, len(cells) - 1, 2)):
+                column = self.schema.column_for(cells[i].get_text(strip=True))
+                if column in remaining:
+                    data[column] = cells[i+1].get_text(strip=True)
+                    remaining.discard(column)
+                    if not remaining:
+                        return
+
+def _class_token(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# BeautifulSoup의 find/find_all과 같은 요소를 고르도록 미리 컴파일한 XPath
+_XP_PAGINATION = etree.XPath(f"(//div[{_class_token('pagination')}])[1]")
+_XP_LAST_LINK = etree.XPath(f"(.//a[{_class_token('last')}])[1]")
+_XP_PAGE_LINKS = etree.XPath(f".//a[{_class_token('page')}]")
+_XP_CONTRACT_LIST_TABLE = etree.XPath("(//table[normalize-space(@class)='contTbl txtC'])[1]")
+_XP_BID_LIST_TABLE = etree.XPath("(//table[@id='tblBidList'])[1]")
+_XP_CONT_TABLES = etree.XPath(f"//table[{_class_token('contTbl')}]")
+_XP_FIRST_TBODY = etree.XPath("(.//tbody)[1]")
+_XP_FIRST_ROW = etree.XPath("(.//tr)[1]")
+
+# BeautifulSoup의 get_text()는 script/style/template 안의 문자열을 제외합니다.
+_XP_VISIBLE_TEXT = etree.XPath(".//text()[not(ancestor::script or ancestor::style or ancestor::template)]")
+
+def _text(element) -> str:
+    """
+    BeautifulSoup의 get_text(strip=True)와 같은 결과를 반환합니다.
+    """
+    if len(element) == 0:  # 하위 요소(주석 포함)가 없는 셀은 XPath 없이 바로 읽습니다.
+        return (element.text or "").strip()
+    return "".join(text.strip() for text in _XP_VISIBLE_TEXT(element))
+
+def _first(xpath, element):
+    found = xpath(element)
+    return found[0] if found else None
+
+def _document(html: str):
+    try:
+        return lxml_html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+class LxmlParser(SoupParser):
+    """
+    lxml 트리와 미리 컴파일한 XPath로 파싱하는 빠른 파서:
+      - SoupParser와 같은 dict를 반환합니다.
+    """
+    name = "lxml"
+
+    def parse_listing(self, html: str) -> tuple:
+        doc = _document(html)
+        if doc is None:
+            return 1, []
+        return self._last_page_number(doc), self._parse_rows(doc)
+
+    def _last_page_number(self, doc) -> int:
+        pagination_div = _first(_XP_PAGINATION, doc)
+        if pagination_div is None:
+            return 1
+
+        last_link = _first(_XP_LAST_LINK, pagination_div)
+        if last_link is not None and last_link.get("href"):
+            match = GO_LIST_PATTERN.search(last_link.get("href"))
+            if match:
+                return int(match.group(1))
+
+        page_numbers = []
+        for link in _XP_PAGE_LINKS(pagination_div):
+            match = GO_LIST_PATTERN.search(link.get("href", ""))
+            if match:
+                page_numbers.append(int(match.group(1)))
+        return max(page_numbers) if page_numbers else 1
+
+    def _parse_rows(self, doc) -> list:
+        data_list = []
+        if self.page_type_index == 0:
+            table = _first(_XP_CONTRACT_LIST_TABLE, doc)
+            min_cells = 7
+        else:
+            table = _first(_XP_BID_LIST_TABLE, doc)
+            min_cells = 8
+        if table is None:
+            return data_list
+
+        tbody = _first(_XP_FIRST_TBODY, table)
+        if tbody is None:
+            return data_list
+
+        for row in tbody.iter("tr"):
+            tds = list(row.iter("td"))
+            if len(tds) < min_cells:
+                continue
+            texts = [_text(td) for td in tds[:min_cells]]
+            data_list.append(_listing_row(self.page_type_index, texts, tds[0].get("onclick", ""), self.site))
+        return data_list
+
+    def parse_detail(self, html: str) -> dict:
+        schema = self.schema
+        data = dict.fromkeys(schema.fields, '')
+        remaining = set(schema.fields)
+        doc = _document(html)
+        if doc is None:
+            return data
+        if schema.headers:
+            tables = _XP_CONT_TABLES(doc)
+            if schema.first_pair_table_only:
+                tables = [t for t in tables if "txtC" not in t.get("class", "").split()][:1]
+            for table in reversed(tables):
+                if not remaining:
+                    break
+                self._read_pair_table(table, data, remaining)
+        if schema.reads_common and remaining:
+            table_common = _first(_XP_CONTRACT_LIST_TABLE, doc)
+            tbody = _first(_XP_FIRST_TBODY, table_common) if table_common is not None else None
+            row = _first(_XP_FIRST_ROW, tbody) if tbody is not None else None
+            if row is not None:
+                cells = list(row.iter("td"))
+                if len(cells) >= len(schema.common_fields):
+                    for field, cell in zip(schema.common_fields, cells):
+                        if field in remaining:
+                            data[field] = _text(cell)
+        return data
+
+    def _read_pair_table(self, table, data: dict, remaining: set) -> None:
+        tbody = _first(_XP_FIRST_TBODY, table)
+        if tbody is None:
+            return
+        for row in reversed(list(tbody.iter("tr"))):
+            cells = list(row.iter("th", "td"))
+            for i in reversed(range(0, len(cells) - 1, 2)):
+                column = self.schema.column_for(_text(cells[i]))
+                if column in remaining:
+                    data[column] = _text(cells[i+1])
+                    remaining.discard(column)
+                    if not remaining:
+                        return
+
+def make_parser(name: str = DEFAULT_PARSER, page_type_index: int = 0, columns: list = None,
+                site: str = DEFAULT_SITE) -> SoupParser:
+    """
+    이름("lxml" 또는 "bs4")에 맞는 파서를 만듭니다. columns는 상세 페이지에서 추출할 컬럼,
+    site는 목록 행의 상세정보 링크를 만들 사이트입니다.
+    """
+    if name == "lxml":
+        return LxmlParser(page_type_index, columns, site)
+    if name == "bs4":
+        return SoupParser(page_type_index, columns, site)
+    raise ValueError(f"지원되지 않는 파서: {name}")
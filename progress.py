@@ -0,0 +1,134 @@
+import threading
+import time
+from collections import deque, namedtuple
+
+# 진행 상황을 콜백으로 보내는 최소 간격(초). GUI 진행 막대에 맞춘 값입니다.
+DEFAULT_PROGRESS_INTERVAL = 1.0
+# 로그(CLI, batch/daemon)로 진행 상황을 출력할 때의 간격(초)
+LOG_PROGRESS_INTERVAL = 10.0
+# 처리 속도(행/초)를 계산하는 최근 구간(초). 오래 걸리는 작업에서 현재 속도로 남은 시간을 추정합니다.
+RATE_WINDOW_SECONDS = 60.0
+# 단계: listing(목록 수집), detail(상세정보 수집). 뒤에 있는 단계일수록 최종 결과에 가깝습니다.
+STAGES = ("listing", "detail")
+STAGE_NAMES = {"listing": "목록", "detail": "상세"}
+
+# stage: 지금 보고하는 단계, done/total: 처리한 행 수/전체 행 수(모르면 None),
+# rows_per_sec: 최근 처리 속도, in_flight: 응답을 기다리는 요청 수, eta_seconds: 남은 시간 추정(모르면 None)
+ProgressUpdate = namedtuple("ProgressUpdate", ["stage", "done", "total", "rows_per_sec", "in_flight",
+                                               "eta_seconds", "elapsed_seconds"])
+
+class _StageProgress:
+    def __init__(self, total: int = None):
+        self.total = total
+        self.done = 0
+        self.started = time.perf_counter()
+        self.samples = deque([(self.started, 0)])
+
+    def advance(self, count: int, now: float) -> None:
+        self.done += count
+        self.samples.append((now, self.done))
+        while len(self.samples) > 2 and now - self.samples[1][0] > RATE_WINDOW_SECONDS:
+            self.samples.popleft()
+
+    def rate(self, now: float) -> float:
+        since, done_then = self.samples[0]
+        elapsed = now - since
+        return (self.done - done_then) / elapsed if elapsed > 0 else 0.0
+
+class ProgressTracker:
+    """
+    작업 진행 상황을 집계해 ProgressUpdate로 보내는 채널:
+      - 크롤러가 단계(STAGES)별로 start()/advance()를 호출하고, 여러 스레드에서 불러도 됩니다.
+      - callback(ProgressUpdate)은 advance() 때 최소 interval초 간격으로, 그리고 finish() 때 한 번 더 호출합니다.
+      - 보고하는 단계는 시작한 단계 중 가장 뒤의 단계입니다. 상세 단계의 전체 건수를 모르면(목록과 상세를 함께
+        수집하는 모드 1) 목록 단계의 전체 건수를 씁니다.
+      - in_flight는 응답을 기다리는 요청 수를 반환하는 함수입니다. (예: RunMetrics의 in_flight)
+    """
+    def __init__(self, callback=None, interval: float = DEFAULT_PROGRESS_INTERVAL, in_flight=None):
+        self.callback = callback
+        self.interval = interval
+        self.in_flight = in_flight
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._stages = {}
+        self._last_emit = 0.0
+
+    def start(self, stage: str, total: int = None) -> None:
+        with self._lock:
+            self._stages[stage] = _StageProgress(total)
+
+    def set_total(self, stage: str, total: int) -> None:
+        with self._lock:
+            if stage in self._stages:
+                self._stages[stage].total = total
+
+    def advance(self, stage: str, count: int = 1) -> None:
+        if not count:
+            return
+        with self._lock:
+            entry = self._stages.get(stage)
+            if entry is None:
+                entry = self._stages[stage] = _StageProgress()
+            entry.advance(count, time.perf_counter())
+        self._emit()
+
+    def finish(self) -> None:
+        """
+        마지막 진행 상황을 보냅니다. (작업이 끝날 때 호출)
+        """
+        self._emit(force=True)
+
+    def snapshot(self) -> ProgressUpdate:
+        now = time.perf_counter()
+        with self._lock:
+            stage = next((s for s in reversed(STAGES) if s in self._stages), None)
+            if stage is None:
+                return ProgressUpdate(None, 0, None, 0.0, self._in_flight(), None, now - self._started)
+            entry = self._stages[stage]
+            total = entry.total
+            if total is None and stage == "detail" and "listing" in self._stages:
+                total = self._stages["listing"].total
+            rate = entry.rate(now)
+        eta = None
+        if total is not None:
+            remaining = max(0, total - entry.done)
+            eta = 0.0 if not remaining else (remaining / rate if rate > 0 else None)
+        return ProgressUpdate(stage, entry.done, total, rate, self._in_flight(), eta, now - self._started)
+
+    def _in_flight(self) -> int:
+        return self.in_flight() if self.in_flight else 0
+
+    def _emit(self, force: bool = False) -> None:
+        if not self.callback:
+            return
+        now = time.perf_counter()
+        with self._lock:
+            if not force and now - self._last_emit < self.interval:
+                return
+            self._last_emit = now
+        self.callback(self.snapshot())
+
+def format_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}시간 {minutes}분"
+    if minutes:
+        return f"{minutes}분 {seconds}초"
+    return f"{seconds}초"
+
+def format_progress(update: ProgressUpdate) -> str:
+    """
+    진행 상황을 한 줄로 요약합니다. 예: "진행: 상세 120/10000 (1.2%), 8.5행/초, 요청 중 4, 남은 시간 약 19분 23초"
+    """
+    if update.stage is None:
+        return f"진행: 준비 중, 요청 중 {update.in_flight}"
+    name = STAGE_NAMES.get(update.stage, update.stage)
+    if update.total:
+        done = f"{update.done}/{update.total} ({update.done / update.total:.1%})"
+    else:
+        done = f"{update.done}"
+    eta = f"약 {format_duration(update.eta_seconds)}" if update.eta_seconds is not None else "계산 중"
+    return (f"진행: {name} {done}, {update.rows_per_sec:.1f}행/초, 요청 중 {update.in_flight}, "
+            f"남은 시간 {eta}")
@@ -0,0 +1,86 @@
+import asyncio
+import threading
+import time
+
+# 일시정지 중 비동기 작업이 재개/취소를 확인하는 간격(초)
+PAUSE_POLL_SECONDS = 0.1
+
+class CrawlCancelled(Exception):
+    """
+    작업이 취소되었음을 알리는 예외. output_path에는 취소 전까지 저장한 결과 파일 경로가 담깁니다. (없으면 None)
+    """
+    def __init__(self, output_path: str = None):
+        super().__init__("작업이 취소되었습니다.")
+        self.output_path = output_path
+
+class RunControl:
+    """
+    실행 중인 작업의 취소/일시정지 토큰 (여러 스레드와 asyncio 이벤트 루프에서 함께 사용):
+      - cancel(): 취소를 요청합니다. 이후 checkpoint()는 CrawlCancelled를 발생시킵니다.
+      - pause()/resume(): 일시정지 중에는 checkpoint()가 재개나 취소까지 기다립니다.
+      - 크롤러는 요청을 보내기 전과 목록 페이지/상세 행 사이에서 checkpoint()를 호출하므로,
+        이미 보낸 요청은 끝까지 받고 새 요청부터 멈춥니다.
+      - 요청 스케줄러는 속도 제한/재시도 대기에 time.sleep 대신 sleep()을 써서, 대기 중에도 바로 취소됩니다.
+      - 일괄 실행에서는 하나의 RunControl을 모든 작업이 공유합니다.
+    """
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self) -> bool:
+        return not self._running.is_set()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        # 일시정지 중 기다리던 작업도 깨워서 취소되게 합니다.
+        self._running.set()
+
+    def pause(self) -> None:
+        if not self.cancelled:
+            self._running.clear()
+
+    def resume(self) -> None:
+        self._running.set()
+
+    def checkpoint(self) -> None:
+        """
+        일시정지 중이면 재개될 때까지 기다리고, 취소되었으면 CrawlCancelled를 발생시킵니다.
+        """
+        self._running.wait()
+        if self.cancelled:
+            raise CrawlCancelled()
+
+    async def checkpoint_async(self) -> None:
+        """
+        checkpoint()의 asyncio 버전입니다. 기다리는 동안 이벤트 루프를 막지 않습니다.
+        """
+        while not self._running.is_set():
+            await asyncio.sleep(PAUSE_POLL_SECONDS)
+        if self.cancelled:
+            raise CrawlCancelled()
+
+    def sleep(self, seconds: float) -> None:
+        """
+        seconds초 동안 기다린 뒤 checkpoint()를 호출합니다. 기다리는 중에 취소되면 바로 CrawlCancelled를 발생시킵니다.
+        """
+        if seconds > 0:
+            self._cancelled.wait(seconds)
+        self.checkpoint()
+
+    async def sleep_async(self, seconds: float) -> None:
+        """
+        sleep()의 asyncio 버전입니다. 취소 여부는 최대 PAUSE_POLL_SECONDS 간격으로 확인합니다.
+        """
+        deadline = time.monotonic() + seconds
+        while not self.cancelled:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(remaining, PAUSE_POLL_SECONDS))
+        await self.checkpoint_async()
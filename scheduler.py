@@ -0,0 +1,207 @@
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from urllib.parse import urlparse
+
+# 재시도 대상 HTTP 상태 코드
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+DEFAULT_RATE_LIMIT = 10.0
+DEFAULT_MAX_RETRIES = 3
+
+def check_max_retries(max_retries: int) -> None:
+    """
+    max_retries는 요청당 최대 시도 횟수(첫 요청 포함)이므로 1 이상이어야 합니다.
+    """
+    if not isinstance(max_retries, int) or max_retries < 1:
+        raise ValueError(f"max_retries는 1 이상의 정수여야 합니다 (요청당 최대 시도 횟수): {max_retries}")
+
+class TokenBucket:
+    """
+    호스트별 초당 요청 수 제한:
+      - rate개/초로 토큰이 차고, 최대 burst개까지 쌓입니다.
+      - reserve()는 토큰 하나를 예약하고 기다려야 할 시간(초)을 반환합니다.
+    """
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+class RequestScheduler:
+    """
+    모든 외부 요청이 거치는 스케줄러:
+      - 호스트별 토큰 버킷으로 요청 속도를 제한합니다.
+      - 5xx, 429, 타임아웃/연결 오류는 지수 백오프(full jitter) 후 재시도합니다.
+      - 동시 요청 한도를 AIMD로 조절합니다. 성공하면 조금씩 늘리고,
+        429를 받거나 최근 오류율이 error_threshold를 넘으면 절반으로 줄입니다.
+      - control(RunControl)을 넘기면 속도 제한/백오프 대기 중에도 취소(CrawlCancelled)와 일시정지를 따릅니다.
+        (스케줄러는 여러 작업이 공유할 수 있으므로 control은 요청마다 넘깁니다)
+    """
+    def __init__(self, rate_limit: float = DEFAULT_RATE_LIMIT, burst: int = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES, max_concurrency: int = 16, min_concurrency: int = 1,
+                 backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 error_window: int = 20, error_threshold: float = 0.2, log_callback=None):
+        check_max_retries(max_retries)
+        self.rate_limit = rate_limit
+        self.burst = burst if burst is not None else max(1, int(rate_limit) if rate_limit else 1)
+        self.max_retries = max_retries
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.error_threshold = error_threshold
+        self.log_callback = log_callback
+        self._buckets = {}
+        self._limit = float(self.max_concurrency)
+        self._in_flight = 0
+        self._outcomes = deque(maxlen=error_window)
+        self._last_decrease = 0.0
+        self._retries = 0
+        self._cond = threading.Condition()
+
+    def _log(self, msg: str, level: str = "info") -> None:
+        if self.log_callback:
+            self.log_callback(msg, level)
+
+    @property
+    def concurrency_limit(self) -> int:
+        return int(self._limit)
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc
+        with self._cond:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate_limit, self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def _rate_delay(self, url: str) -> float:
+        if not self.rate_limit:
+            return 0.0
+        return self._bucket(url).reserve()
+
+    def backoff_delay(self, attempt: int, retry_after: str = None) -> float:
+        if retry_after:
+            try:
+                return min(self.backoff_max, float(retry_after))
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1))))
+
+    def _try_acquire(self) -> bool:
+        if self._in_flight < int(self._limit):
+            self._in_flight += 1
+            return True
+        return False
+
+    def _acquire(self) -> None:
+        with self._cond:
+            while not self._try_acquire():
+                self._cond.wait()
+
+    def _release(self, ok: bool, throttled: bool = False) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._outcomes.append(ok)
+            if ok:
+                self._limit = min(self.max_concurrency, self._limit + 1.0 / self._limit)
+            else:
+                error_rate = self._outcomes.count(False) / len(self._outcomes)
+                now = time.monotonic()
+                # 한 번의 오류 폭주로 여러 번 줄이지 않도록 최소 1초 간격을 둡니다.
+                if (throttled or error_rate > self.error_threshold) and now - self._last_decrease >= 1.0:
+                    self._limit = max(self.min_concurrency, self._limit / 2)
+                    self._last_decrease = now
+                    self._log(f"오류 증가로 동시 요청 한도 축소: {int(self._limit)}")
+            self._cond.notify_all()
+
+    def _count_retry(self) -> None:
+        with self._cond:
+            self._retries += 1
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {"retries": self._retries, "concurrency_limit": int(self._limit)}
+
+    def execute(self, send, url: str, retry_exceptions: tuple = (), control=None):
+        """
+        send()를 스케줄링하여 실행합니다. send는 status_code와 headers를 가진 응답을 반환해야 합니다.
+        재시도 대상 오류가 max_retries번 이어지면 마지막 응답을 반환하거나 마지막 예외를 다시 발생시킵니다.
+        """
+        sleep = control.sleep if control is not None else time.sleep
+        for attempt in range(1, self.max_retries + 1):
+            sleep(self._rate_delay(url))
+            self._acquire()
+            try:
+                response = send()
+            except retry_exceptions as e:
+                self._release(False)
+                if attempt == self.max_retries:
+                    raise
+                delay = self.backoff_delay(attempt)
+                self._log(f"  요청 오류, {delay:.1f}초 후 재시도 ({attempt}/{self.max_retries}): {e}")
+            except Exception:
+                self._release(True)
+                raise
+            else:
+                status = response.status_code
+                if status not in RETRYABLE_STATUS:
+                    self._release(True)
+                    return response
+                self._release(False, throttled=(status == 429))
+                if attempt == self.max_retries:
+                    return response
+                delay = self.backoff_delay(attempt, response.headers.get("Retry-After"))
+                self._log(f"  HTTP {status}, {delay:.1f}초 후 재시도 ({attempt}/{self.max_retries})")
+            self._count_retry()
+            sleep(delay)
+
+    async def execute_async(self, send, url: str, retry_exceptions: tuple = (), control=None):
+        """
+        execute()의 asyncio 버전입니다. send는 응답을 반환하는 코루틴 함수입니다.
+        """
+        sleep = control.sleep_async if control is not None else asyncio.sleep
+        for attempt in range(1, self.max_retries + 1):
+            await sleep(self._rate_delay(url))
+            while True:
+                with self._cond:
+                    if self._try_acquire():
+                        break
+                await sleep(0.05)
+            try:
+                response = await send()
+            except retry_exceptions as e:
+                self._release(False)
+                if attempt == self.max_retries:
+                    raise
+                delay = self.backoff_delay(attempt)
+                self._log(f"  요청 오류, {delay:.1f}초 후 재시도 ({attempt}/{self.max_retries}): {e}")
+            except Exception:
+                self._release(True)
+                raise
+            else:
+                status = response.status_code
+                if status not in RETRYABLE_STATUS:
+                    self._release(True)
+                    return response
+                self._release(False, throttled=(status == 429))
+                if attempt == self.max_retries:
+                    return response
+                delay = self.backoff_delay(attempt, response.headers.get("Retry-After"))
+                self._log(f"  HTTP {status}, {delay:.1f}초 후 재시도 ({attempt}/{self.max_retries})")
+            self._count_retry()
+            await sleep(delay)
@@ -0,0 +1,288 @@
+"""
+기준 코드 회귀 테스트: 파서를 나누기 전 crawler.py의 목록/상세 해석 코드(parse_bid_table, get_last_page_number,
+crawl_detail_page)를 아래에 그대로 옮겨 두고, LxmlParser와 SummaryCrawler의 호환용 메서드가 같은 결과를 내는지 확인합니다.
+기준 코드는 비교 기준이므로 고치지 않습니다. (요청 부분만 HTML을 받도록 바꿨습니다)
+
+실행: python -m unittest discover tests (또는 python -m pytest tests)
+"""
+import os
+import re
+import sys
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.join(REPO_ROOT, "benchmarks"))
+
+from bs4 import BeautifulSoup
+from crawler import SummaryCrawler
+from parsers import LxmlParser, detail_schema
+from mock_server import MockKaptServer, LISTING_PATHS, DETAIL_PATHS
+from test_parsers import page, pair_table, common_table, listing_table, COMMON_VALUES
+
+# --- 기준 코드 (수정 금지) ---
+
+def baseline_last_page_number(soup: BeautifulSoup) -> int:
+    pagination_div = soup.find("div", class_="pagination")
+    if not pagination_div:
+        return 1
+
+    last_link = pagination_div.find("a", class_="last")
+    if last_link and last_link.get("href"):
+        match = re.search(r"goList\((\d+)\)", last_link["href"])
+        if match:
+            return int(match.group(1))
+
+    page_links = pagination_div.find_all("a", class_="page")
+    page_numbers = []
+    for link in page_links:
+        href_val = link.get("href", "")
+        match = re.search(r"goList\((\d+)\)", href_val)
+        if match:
+            page_numbers.append(int(match.group(1)))
+    return max(page_numbers) if page_numbers else 1
+
+def baseline_bid_table(soup: BeautifulSoup, page_type_index: int) -> list:
+    data_list = []
+    if page_type_index == 0:
+        table = soup.find("table", {"class": "contTbl txtC"})
+    else:
+        table = soup.find("table", id="tblBidList")
+    if not table:
+        return data_list
+
+    tbody = table.find("tbody")
+    if not tbody:
+        return data_list
+
+    rows = tbody.find_all("tr")
+    for row in rows:
+        tds = row.find_all("td")
+        if page_type_index == 0:
+            if len(tds) < 7:
+                continue
+            seq = tds[0].get_text(strip=True)
+            apt_name = tds[1].get_text(strip=True)
+            contract_company = tds[2].get_text(strip=True)
+            contract_name = tds[3].get_text(strip=True)
+            contract_date = tds[4].get_text(strip=True)
+            contract_amount = tds[5].get_text(strip=True)
+            contract_period = tds[6].get_text(strip=True)
+            detail_link = ""
+            onclick_attr = tds[0].get("onclick", "")
+            match = re.search(r"goView\('(.+?)'\)", onclick_attr)
+            detail_id = match.group(1) if match else ""
+            if detail_id:
+                detail_link = f"https://www.k-apt.go.kr/bid/privateContractDetail.do?pcNum={detail_id}"
+            data_list.append({
+                "순번": seq,
+                "단지명": apt_name,
+                "계약업체": contract_company,
+                "계약명": contract_name,
+                "계약일": contract_date,
+                "계약금액": contract_amount,
+                "계약기간": contract_period,
+                "상세정보링크": detail_link
+            })
+        else:
+            if len(tds) < 8:
+                continue
+            seq = tds[0].get_text(strip=True)
+            bid_type = tds[1].get_text(strip=True)
+            award_method = tds[2].get_text(strip=True)
+            bid_title = tds[3].get_text(strip=True)
+            bid_deadline = tds[4].get_text(strip=True)
+            status = tds[5].get_text(strip=True)
+            apt_name = tds[6].get_text(strip=True)
+            reg_date = tds[7].get_text(strip=True)
+            onclick_attr = tds[0].get("onclick", "")
+            match = re.search(r"goView\('(.+?)'\)", onclick_attr)
+            detail_id = match.group(1) if match else ""
+            detail_link = f"https://www.k-apt.go.kr/bid/bidDetail.do?bidNum={detail_id}"
+            data_list.append({
+                "순번": seq,
+                "종류": bid_type,
+                "낙찰방법": award_method,
+                "입찰공고명": bid_title,
+                "입찰마감일": bid_deadline,
+                "상태": status,
+                "단지명": apt_name,
+                "공고일": reg_date,
+                "상세정보링크": detail_link
+            })
+    return data_list
+
+def baseline_detail_page(html: str, page_type_index: int) -> dict:
+    soup = BeautifulSoup(html, "lxml")
+    if page_type_index == 0:
+        data = {
+            '주택관리업자': '', '아파트명': '', '관리사무소 주소': '', '전화번호': '', '팩스번호': '',
+            '동수': '', '세대수': '', '계약번호': '', '계약명': '', '계약업체명': '',
+            '업체대표자명': '', '업체전화번호': '', '사업자등록번호': '', '업체주소': '',
+            '계약(예정)일': '', '계약금액': '', '계약기간': '', '등록일': '', '분류': '',
+            '수의계약 체결사유': ''
+        }
+        mapping = {
+            "주택관리업자": "주택관리업자",
+            "아파트명": "아파트명",
+            "단지명": "아파트명",
+            "관리사무소 주소": "관리사무소 주소",
+            "전화번호": "전화번호",
+            "팩스번호": "팩스번호",
+            "동수": "동수",
+            "세대수": "세대수",
+            "계약번호": "계약번호",
+            "계약명": "계약명",
+            "계약업체명": "계약업체명",
+            "업체대표자명": "업체대표자명",
+            "업체전화번호": "업체전화번호",
+            "사업자등록번호": "사업자등록번호",
+            "업체주소": "업체주소",
+            "계약(예정)일": "계약(예정)일",
+            "계약금액": "계약금액",
+            "계약기간": "계약기간",
+            "등록일": "등록일",
+            "분 류": "분류",
+            "분류": "분류",
+            "수의계약 체결사유": "수의계약 체결사유"
+        }
+        table_common = soup.find("table", class_="contTbl txtC")
+        if table_common:
+            tbody = table_common.find("tbody")
+            if tbody:
+                row = tbody.find("tr")
+                if row:
+                    cells = row.find_all("td")
+                    if len(cells) >= 7:
+                        data['주택관리업자'] = cells[0].get_text(strip=True)
+                        data['아파트명'] = cells[1].get_text(strip=True)
+                        data['관리사무소 주소'] = cells[2].get_text(strip=True)
+                        data['전화번호'] = cells[3].get_text(strip=True)
+                        data['팩스번호'] = cells[4].get_text(strip=True)
+                        data['동수'] = cells[5].get_text(strip=True)
+                        data['세대수'] = cells[6].get_text(strip=True)
+        table_contract = None
+        tables = soup.find_all("table", class_="contTbl")
+        for t in tables:
+            if "txtC" not in t.get("class", []):
+                table_contract = t
+                break
+        if table_contract:
+            tbody = table_contract.find("tbody")
+            if tbody:
+                rows = tbody.find_all("tr")
+                for row in rows:
+                    cells = row.find_all(["th", "td"])
+                    if len(cells) < 2:
+                        continue
+                    for i in range(0, len(cells) - 1, 2):
+                        key_text = re.sub(r'\s+', ' ', cells[i].get_text(strip=True))
+                        val_text = cells[i+1].get_text(strip=True)
+                        if key_text in mapping:
+                            data[mapping[key_text]] = val_text
+        return data
+    else:
+        data = {
+            '주택관리업자': '', '단지명': '', '관리사무소 주소': '', '전화번호': '', '팩스번호': '',
+            '동수': '', '세대수': '', '입찰번호': '', '입찰방법': '', '입찰서 제출 마감일': '',
+            '입찰제목': '', '긴급입찰여부': '', '입찰종류': '', '낙찰방법': '', '입찰분류': '',
+            '신용평가등급확인서 제출여부': '', '현장설명': '', '관리(공사용역) 실적증명서 제출여부': '',
+            '현장설명일시': '', '현장설명장소': '', '서류제출마감일': '', '입찰보증금': '',
+            '지급조건': '', '내용': '', '계약번호': '', '계약명': '', '계약업체명': '',
+            '업체대표자명': '', '업체전화번호': '', '사업자등록번호': '', '업체주소': '',
+            '계약(예정)일': '', '계약기간': '', '계약금액': '', '등록일': '', '분류': '',
+            '수의계약 체결사유': ''
+        }
+        tables = soup.find_all("table", class_="contTbl")
+        for table in tables:
+            tbody = table.find("tbody")
+            if not tbody:
+                continue
+            rows = tbody.find_all("tr")
+            for row in rows:
+                cells = row.find_all(["th", "td"])
+                if len(cells) < 2:
+                    continue
+                for i in range(0, len(cells) - 1, 2):
+                    key_text = cells[i].get_text(strip=True)
+                    val_text = cells[i+1].get_text(strip=True)
+                    if key_text == '파일첨부':
+                        continue
+                    if key_text in data:
+                        data[key_text] = val_text
+        return data
+
+# --- 비교 ---
+
+def baseline_listing(html: str, page_type_index: int) -> tuple:
+    soup = BeautifulSoup(html, "lxml")
+    return baseline_last_page_number(soup), baseline_bid_table(soup, page_type_index)
+
+# 상세 페이지 마크업 변형 (test_parsers의 경계 사례와 같은 종류)
+EDGE_DETAIL_PAGES = [
+    page(pair_table([[("<span>계약<b>명</b></span>", "<p> 승강기 <em>유지</em> 보수 </p>"),
+                      ("계약금액", "<div><span>1,000</span><span>원</span></div>")]])),
+    page(pair_table([[("계약명", "청소<script>var x = '숨김';</script>용역"), ("내용", "<!-- 주석 -->본문")]])),
+    page('<table class="contTbl"><tr><th>계약명</th><td>값</td></tr></table>'),
+    page(common_table(COMMON_VALUES), pair_table([[("분\n   류", "용역"), ("계약명", "청소")]])),
+    page(common_table(COMMON_VALUES),
+         pair_table([[("아파트명", "첫째"), ("단지명", "둘째")], [("계약명", "A"), ("계약명", "B")]]),
+         pair_table([[("계약명", "다른 표")]])),
+    page(common_table(COMMON_VALUES[:5]), pair_table([[("파일첨부", "a.pdf"), ("입찰번호", "B1")]])),
+    "", "<html>", "<table class='contTbl'><tbody><tr><th>계약명", "텍스트만",
+]
+
+class BaselineParityTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.servers = [MockKaptServer(pages=25, rows=10, last_link=last_link, latency=0).start()
+                       for last_link in (True, False)]
+
+    @classmethod
+    def tearDownClass(cls):
+        for server in cls.servers:
+            server.stop()
+
+    def test_listing_fixtures(self):
+        for server in self.servers:
+            for page_type_index in (0, 1):
+                for page_no in ("1", "13", "25", "26"):
+                    html = server._listing(LISTING_PATHS[page_type_index], {"pageNo": [page_no]})
+                    with self.subTest(page_type=page_type_index, page=page_no, last_link=server.last_link):
+                        self.assertEqual(LxmlParser(page_type_index).parse_listing(html),
+                                         baseline_listing(html, page_type_index))
+
+    def test_listing_edge_cases(self):
+        rows = [["1", "2"], ["<a href='#'><span>한빛</span>아파트</a>"] + [str(i) for i in range(7)]]
+        for page_type_index in (0, 1):
+            for html in (page(listing_table(page_type_index, rows)),
+                         page(listing_table(page_type_index, rows, with_tbody=False)), "", "<html>"):
+                with self.subTest(page_type=page_type_index, html=html):
+                    self.assertEqual(LxmlParser(page_type_index).parse_listing(html),
+                                     baseline_listing(html, page_type_index))
+
+    def test_detail_fixtures_and_edge_cases(self):
+        server = self.servers[0]
+        for page_type_index, key in ((0, "pcNum"), (1, "bidNum")):
+            pages = [server._detail(DETAIL_PATHS[page_type_index], {key: [f"X{n:07d}"]}) for n in (1, 37, 250)]
+            fields = detail_schema(page_type_index).fields
+            for html in pages + EDGE_DETAIL_PAGES:
+                expected = baseline_detail_page(html, page_type_index)
+                for columns in (None, fields[:3], fields[-3:], ["계약명", "분류"]):
+                    with self.subTest(page_type=page_type_index, html=html[:60], columns=columns):
+                        wanted = expected if columns is None else {c: expected[c] for c in fields if c in columns}
+                        self.assertEqual(LxmlParser(page_type_index, columns).parse_detail(html), wanted)
+
+    def test_summary_crawler_soup_methods(self):
+        for server in self.servers:
+            for page_type_index in (0, 1):
+                crawler = SummaryCrawler(server.url + LISTING_PATHS[page_type_index], page_type_index)
+                soup = crawler.get_soup_by_page(crawler.base_url + "?searchYear=2025", page_no=13)
+                with self.subTest(page_type=page_type_index, last_link=server.last_link):
+                    self.assertIsNotNone(soup)
+                    self.assertEqual(crawler.get_last_page_number(soup), baseline_last_page_number(soup))
+                    self.assertEqual(crawler.parse_bid_table(soup), baseline_bid_table(soup, page_type_index))
+                    self.assertEqual(len(crawler.parse_bid_table(soup)), 10)
+
+if __name__ == "__main__":
+    unittest.main()
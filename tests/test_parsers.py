@@ -0,0 +1,219 @@
+"""
+파서 회귀 테스트: SoupParser(기존 방식)와 LxmlParser가 같은 결과를 내는지, 기존 crawl_detail_page와 같은 규칙으로
+값을 고르는지 확인합니다. 목록/상세 페이지는 benchmarks/fixtures를 로컬 K-apt 서버와 같은 방식으로 채워 씁니다.
+
+실행: python -m unittest discover tests (또는 python -m pytest tests)
+"""
+import os
+import sys
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.join(REPO_ROOT, "benchmarks"))
+
+from parsers import SoupParser, LxmlParser, detail_schema
+from mock_server import MockKaptServer, LISTING_PATHS, DETAIL_PATHS
+
+def parse_both(method: str, html: str, page_type_index: int = 0, columns: list = None) -> tuple:
+    soup_result = getattr(SoupParser(page_type_index, columns), method)(html)
+    lxml_result = getattr(LxmlParser(page_type_index, columns), method)(html)
+    return soup_result, lxml_result
+
+def page(*tables: str) -> str:
+    return "<html><body>" + "".join(tables) + "</body></html>"
+
+def pair_table(rows: list, classes: str = "contTbl") -> str:
+    """
+    항목명/값 셀이 번갈아 나오는 상세 페이지 표를 만듭니다. rows: [[(항목명, 값), ...], ...]
+    """
+    body = "".join("<tr>" + "".join(f"<th>{k}</th><td>{v}</td>" for k, v in row) + "</tr>" for row in rows)
+    return f'<table class="{classes}"><tbody>{body}</tbody></table>'
+
+def common_table(values: list) -> str:
+    cells = "".join(f"<td>{v}</td>" for v in values)
+    return f'<table class="contTbl txtC"><tbody><tr>{cells}</tr></tbody></table>'
+
+COMMON_VALUES = ["관리업자", "공통아파트", "서울시", "02-1", "02-2", "3", "100"]
+
+def listing_table(page_type_index: int, rows: list, with_tbody: bool = True) -> str:
+    """
+    목록 표를 만듭니다. rows: [[셀 HTML, ...], ...] (첫 셀에 goView onclick을 붙입니다)
+    """
+    body = "".join("<tr>" + "".join(f"<td onclick=\"goView('X{i}')\">{c}</td>" if j == 0 else f"<td>{c}</td>"
+                                    for j, c in enumerate(cells)) + "</tr>" for i, cells in enumerate(rows))
+    if with_tbody:
+        body = f"<tbody>{body}</tbody>"
+    if page_type_index == 0:
+        return f'<table class="contTbl txtC">{body}</table>'
+    return f'<table id="tblBidList">{body}</table>'
+
+class FixtureParityTest(unittest.TestCase):
+    """
+    기록해 둔 목록/상세 페이지에서 두 파서의 결과가 같아야 합니다.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockKaptServer(pages=25, rows=10, last_link=True).start()
+        cls.server_without_last = MockKaptServer(pages=25, rows=10, last_link=False).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        cls.server_without_last.stop()
+
+    def test_listing_pages(self):
+        for server in (self.server, self.server_without_last):
+            for page_type_index, path in ((0, LISTING_PATHS[0]), (1, LISTING_PATHS[1])):
+                for page_no in ("1", "13", "25", "26"):
+                    html = server._listing(path, {"pageNo": [page_no]})
+                    with self.subTest(path=path, page=page_no, last_link=server.last_link):
+                        soup_result, lxml_result = parse_both("parse_listing", html, page_type_index)
+                        self.assertEqual(soup_result, lxml_result)
+                        # 마지막 페이지 링크가 없으면 지금 보이는 페이지 링크 묶음(10개)의 끝까지만 알 수 있습니다.
+                        block_end = min(25, ((int(page_no) - 1) // 10 + 1) * 10)
+                        self.assertEqual(soup_result[0], 25 if server.last_link else block_end)
+
+    def test_detail_pages(self):
+        for page_type_index, path, key in ((0, DETAIL_PATHS[0], "pcNum"), (1, DETAIL_PATHS[1], "bidNum")):
+            fields = detail_schema(page_type_index).fields
+            for n in (1, 37, 250):
+                html = self.server._detail(path, {key: [f"X{n:07d}"]})
+                for columns in (None, fields[:3], fields[-3:], ["계약명", "분류"]):
+                    with self.subTest(path=path, n=n, columns=columns):
+                        soup_result, lxml_result = parse_both("parse_detail", html, page_type_index, columns)
+                        self.assertEqual(soup_result, lxml_result)
+                        self.assertTrue(any(soup_result.values()))
+
+class EdgeCaseParityTest(unittest.TestCase):
+    """
+    실제 페이지에서 나올 수 있는 마크업 변형에서도 두 파서의 결과가 같아야 합니다.
+    """
+    def assert_same(self, method: str, html: str, page_type_index: int, columns: list = None) -> dict:
+        soup_result, lxml_result = parse_both(method, html, page_type_index, columns)
+        self.assertEqual(soup_result, lxml_result)
+        return soup_result
+
+    def test_nested_tags(self):
+        html = page(pair_table([[("<span>계약<b>명</b></span>", "<p> 승강기 <em>유지</em> 보수 </p>"),
+                                 ("계약금액", "<div><span>1,000</span><span>원</span></div>")]]))
+        result = self.assert_same("parse_detail", html, 1)
+        self.assertEqual(result["계약명"], "승강기유지보수")
+        self.assertEqual(result["계약금액"], "1,000원")
+        rows = [["1", "<a href='#'><span>한빛</span>아파트</a>", "업체", "<b>계약</b>", "2025", "1", "기간"]]
+        _, data = self.assert_same("parse_listing", page(listing_table(0, rows)), 0)
+        self.assertEqual(data[0]["단지명"], "한빛아파트")
+
+    def test_script_and_style_are_ignored(self):
+        html = page(pair_table([[("계약명", "청소<script>var x = '숨김';</script><style>.a{}</style>용역"),
+                                 ("내용", "<!-- 주석 -->본문")]]))
+        result = self.assert_same("parse_detail", html, 1)
+        self.assertEqual(result["계약명"], "청소용역")
+        self.assertEqual(result["내용"], "본문")
+
+    def test_missing_tbody(self):
+        detail = page('<table class="contTbl"><tr><th>계약명</th><td>값</td></tr></table>')
+        self.assertEqual(self.assert_same("parse_detail", detail, 1)["계약명"], "")
+        rows = [[str(i) for i in range(8)]]
+        for page_type_index in (0, 1):
+            listing = page(listing_table(page_type_index, rows, with_tbody=False))
+            self.assertEqual(self.assert_same("parse_listing", listing, page_type_index), (1, []))
+
+    def test_header_with_internal_whitespace(self):
+        for header in ("분 류", "분  류", "분\n   류", "분류"):
+            html = page(common_table(COMMON_VALUES), pair_table([[(header, "용역"), ("계약명", "청소")]]))
+            with self.subTest(header=header):
+                self.assertEqual(self.assert_same("parse_detail", html, 0)["분류"], "용역")
+                self.assertEqual(self.assert_same("parse_detail", html, 0, ["분류"])["분류"], "용역")
+
+    def test_duplicated_headers(self):
+        html = page(common_table(COMMON_VALUES),
+                    pair_table([[("아파트명", "첫째"), ("단지명", "둘째")], [("계약명", "A"), ("계약명", "B")]]),
+                    pair_table([[("계약명", "다른 표")]]))
+        result = self.assert_same("parse_detail", html, 0)
+        self.assertEqual((result["아파트명"], result["계약명"]), ("둘째", "B"))
+        result = self.assert_same("parse_detail", html, 1)
+        self.assertEqual(result["계약명"], "다른 표")
+
+    def test_short_rows_and_broken_markup(self):
+        rows = [["1", "2"], [str(i) for i in range(7)]]
+        _, data = self.assert_same("parse_listing", page(listing_table(0, rows)), 0)
+        self.assertEqual(len(data), 1)
+        for html in ("", "<html>", "<table class='contTbl'><tbody><tr><th>계약명", "텍스트만"):
+            with self.subTest(html=html):
+                self.assert_same("parse_listing", html, 0)
+                self.assert_same("parse_detail", html, 0)
+                self.assert_same("parse_detail", html, 1)
+
+class DuplicatedHeaderTest(unittest.TestCase):
+    """
+    같은 항목명이 여러 번 나오면 기존 crawl_detail_page처럼 마지막 값을 사용해야 합니다.
+    """
+    def test_bid_detail_uses_last_table(self):
+        html = page(pair_table([[("계약명", "공고상 계약명"), ("입찰번호", "B1")]]),
+                    pair_table([[("계약명", "최종 계약명")]]))
+        for columns in (None, ["계약명"], ["계약명", "입찰번호"]):
+            soup_result, lxml_result = parse_both("parse_detail", html, 1, columns)
+            self.assertEqual(soup_result["계약명"], "최종 계약명")
+            self.assertEqual(soup_result, lxml_result)
+
+    def test_private_contract_table_overrides_common_table(self):
+        html = page(common_table(COMMON_VALUES),
+                    pair_table([[("아파트명", "계약표아파트"), ("계약명", "청소")]]))
+        for columns in (None, ["아파트명"], ["아파트명", "계약명"]):
+            soup_result, lxml_result = parse_both("parse_detail", html, 0, columns)
+            self.assertEqual(soup_result["아파트명"], "계약표아파트")
+            self.assertEqual(soup_result, lxml_result)
+
+    def test_duplicated_header_in_one_row(self):
+        html = page(pair_table([[("계약명", "첫째"), ("계약명", "둘째")], [("계약명", "셋째")]]))
+        soup_result, lxml_result = parse_both("parse_detail", html, 1)
+        self.assertEqual(soup_result["계약명"], "셋째")
+        self.assertEqual(soup_result, lxml_result)
+
+class EarlyExitTest(unittest.TestCase):
+    """
+    상세 페이지는 뒤쪽 표부터 읽어, 추출할 컬럼을 모두 찾으면 앞쪽 표는 읽지 않아야 합니다. (마지막 값 규칙은 유지)
+    """
+    def parse_counting(self, parser_class, html: str, page_type_index: int, columns: list) -> tuple:
+        parser = parser_class(page_type_index, columns)
+        visited = []
+        read_pair_table = parser._read_pair_table
+
+        def counting(table, data, remaining):
+            visited.append(table)
+            read_pair_table(table, data, remaining)
+
+        parser._read_pair_table = counting
+        return parser.parse_detail(html), len(visited)
+
+    def test_stops_after_last_tables_with_wanted_headers(self):
+        html = page(pair_table([[("계약명", "첫째"), ("입찰번호", "B1")]]),
+                    pair_table([[("내용", "본문")]]),
+                    pair_table([[("계약명", "최종"), ("분류", "용역")]]))
+        cases = ((["계약명"], 1, {"계약명": "최종"}),
+                 (["계약명", "분류"], 1, {"계약명": "최종", "분류": "용역"}),
+                 (["내용", "계약명"], 2, {"내용": "본문", "계약명": "최종"}),
+                 (["입찰번호"], 3, {"입찰번호": "B1"}),
+                 (["업체주소"], 3, {"업체주소": ""}))
+        for parser_class in (SoupParser, LxmlParser):
+            for columns, tables, expected in cases:
+                with self.subTest(parser=parser_class.name, columns=columns):
+                    self.assertEqual(self.parse_counting(parser_class, html, 1, columns), (expected, tables))
+
+    def test_common_table_is_skipped_when_pair_table_has_all_columns(self):
+        html = page(common_table(COMMON_VALUES), pair_table([[("아파트명", "계약표아파트"), ("계약명", "청소")]]))
+        for parser_class in (SoupParser, LxmlParser):
+            with self.subTest(parser=parser_class.name):
+                result, tables = self.parse_counting(parser_class, html, 0, ["아파트명", "세대수"])
+                self.assertEqual((result, tables), ({"아파트명": "계약표아파트", "세대수": "100"}, 1))
+
+    def test_summary_columns_are_not_extracted(self):
+        from excel_handler import summary_columns
+        for page_type_index in (0, 1):
+            schema = detail_schema(page_type_index)
+            columns = schema.needed_columns(["업체주소"], summary_columns(page_type_index))
+            self.assertEqual(schema.select(columns).fields, ["업체주소"])
+
+if __name__ == "__main__":
+    unittest.main()
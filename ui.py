@@ -5,32 +5,79 @@ import sys
 from datetime import datetime
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QPushButton, QTextEdit, QRadioButton, QButtonGroup,
+    QLabel, QLineEdit, QPushButton, QPlainTextEdit, QRadioButton, QButtonGroup,
     QFileDialog, QCheckBox, QGroupBox, QGridLayout, QMessageBox, QComboBox, QSpinBox,
-    QFormLayout, QDialog, QProgressBar
+    QFormLayout, QDialog, QProgressBar, QInputDialog
 )
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QObject
-from PyQt5.QtGui import QTextCursor
-from worker import CrawlerWorker, MultiCrawlerWorker
+from worker import CrawlerWorker
+from events import EventLog
+from progress import format_progress
+from run_control import RunControl
+from batch import BatchRunner, list_job_files, DEFAULT_PARALLEL_JOBS
 from utils import read_json_with_encoding
 
+# GUI 위젯으로 편집하는 설정 키
+GUI_SETTING_KEYS = {"url", "extraction_count", "concurrency", "mode", "page_type_index",
+                    "selected_excel_path", "selected_detail_columns", "auto_exit"}
+# 로그 창에 남겨 두는 최대 줄 수 (넘으면 오래된 줄부터 지웁니다)
+LOG_MAX_LINES = 5000
+
 class WorkerWrapper(QObject):
-    log_signal = pyqtSignal(str)
+    """
+    CrawlerWorker를 작업 스레드에서 실행합니다.
+    로그는 EventLog로 모아 flush 간격마다 log_signal(이벤트 목록)로 한 번에 보냅니다.
+    설정의 log_file을 지정하면 로그를 JSONL 파일에도 기록합니다.
+    진행 상황(ProgressUpdate)은 progress_signal로 보냅니다.
+    control(RunControl)로 실행 중인 작업을 취소하거나 일시정지합니다.
+    """
+    log_signal = pyqtSignal(list)
+    progress_signal = pyqtSignal(object)
     finished_signal = pyqtSignal(str)
     
-    def __init__(self, mode: int, url_text: str, excel_path: str,
-                 selected_columns: list, extraction_count: int, page_type_index: int = 0):
+    def __init__(self, settings: dict, control: RunControl = None):
         super().__init__()
-        self.worker = CrawlerWorker(mode, url_text, excel_path, selected_columns,
-                                    extraction_count, page_type_index)
-        self.worker.log_callback = self.log_signal.emit
+        self.log_file = settings.get("log_file") or None
+        self.worker = CrawlerWorker.from_settings(settings, progress_callback=self.progress_signal.emit,
+                                                  control=control)
 
     def run(self) -> None:
-        try:
-            result = self.worker.run()
-            self.finished_signal.emit(result)
-        except Exception as e:
-            self.finished_signal.emit(f"ERROR: {e}")
+        with EventLog([self.log_signal.emit], jsonl_path=self.log_file) as events:
+            self.worker.log_callback = events.emit
+            try:
+                result = self.worker.run()
+            except Exception as e:
+                result = f"ERROR: {e}"
+        self.finished_signal.emit(result)
+
+class MultiCrawlerWorker(QObject):
+    """
+    폴더 내 다수의 JSON 설정 파일을 읽어 크롤링 작업을 실행합니다.
+    parallel_jobs개의 작업을 동시에 실행하며, 실제 실행은 batch.BatchRunner가 맡습니다.
+    control(RunControl)은 모든 작업이 공유하므로, 취소하면 실행 중인 작업과 남은 작업이 모두 멈춥니다.
+    (Qt 없이 실행하려면 main.py의 batch/daemon 명령을 사용합니다.)
+    """
+    log_signal = pyqtSignal(list)
+    finished_signal = pyqtSignal(str)
+
+    def __init__(self, folder_path: str, parallel_jobs: int = 1, control: RunControl = None):
+        super().__init__()
+        self.folder_path = folder_path
+        self.parallel_jobs = parallel_jobs
+        self.control = control
+
+    def run(self) -> None:
+        json_files = list_job_files(self.folder_path)
+        with EventLog([self.log_signal.emit]) as events:
+            if not json_files:
+                events.emit("선택한 폴더에 JSON 파일이 없습니다.")
+                result = "실행된 크롤링 없음"
+            else:
+                runner = BatchRunner(json_files, log_callback=events.emit, parallel_jobs=self.parallel_jobs,
+                                     control=self.control)
+                runner.run()
+                result = "크롤링 작업 취소됨" if runner.control.cancelled else "모든 크롤링 작업 완료"
+        self.finished_signal.emit(result)
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -44,7 +91,11 @@ class MainWindow(QMainWindow):
 
         self.thread = None
         self.worker_wrapper = None
+        # 실행 중인 작업(단일 크롤링, 폴더 크롤링)의 취소/일시정지 토큰
+        self.active_controls = []
         self.selected_excel_path = ""
+        # GUI에 입력 위젯이 없는 설정(rate_limit, incremental 등)은 불러온 값을 그대로 유지합니다.
+        self.extra_settings = {}
 
         self.radio_summary_detail.toggled.connect(self.update_ui_state)
         self.radio_summary_only.toggled.connect(self.update_ui_state)
@@ -95,8 +146,13 @@ class MainWindow(QMainWindow):
         self.count_spin.setMinimum(1)
         self.count_spin.setMaximum(10000)
         self.count_spin.setValue(50)
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setMinimum(1)
+        self.concurrency_spin.setMaximum(16)
+        self.concurrency_spin.setValue(1)
         layout.addRow("크롤링할 URL:", self.url_edit)
         layout.addRow("추출 갯수:", self.count_spin)
+        layout.addRow("동시 요청 수:", self.concurrency_spin)
         self.main_layout.addWidget(self.crawl_setting_group)
 
     def _create_mode_selection_group(self):
@@ -168,13 +224,14 @@ class MainWindow(QMainWindow):
 
     def _create_progress_bar(self):
         self.progress_bar = QProgressBar()
-        self.progress_bar.setRange(0, 0)  # 처리 중에는 진행률 미정으로 표시
+        self.progress_bar.setRange(0, 0)  # 전체 건수를 알기 전에는 진행률 미정으로 표시
         self.progress_bar.setVisible(False)
         self.main_layout.addWidget(self.progress_bar)
 
     def _create_log_view(self):
-        self.log_edit = QTextEdit()
+        self.log_edit = QPlainTextEdit()
         self.log_edit.setReadOnly(True)
+        self.log_edit.setMaximumBlockCount(LOG_MAX_LINES)
         self.log_edit.setStyleSheet("background-color: #F0F0F0;")
         self.main_layout.addWidget(self.log_edit)
 
@@ -185,12 +242,20 @@ class MainWindow(QMainWindow):
         self.run_button.setStyleSheet("font-size: 18pt; font-weight: bold;")
         self.run_button.clicked.connect(self.on_run_clicked)
         button_layout.addWidget(self.run_button)
+        self.pause_button = QPushButton("일시정지")
+        self.pause_button.clicked.connect(self.on_pause_clicked)
+        button_layout.addWidget(self.pause_button)
+        self.stop_button = QPushButton("중지")
+        self.stop_button.clicked.connect(self.on_stop_clicked)
+        button_layout.addWidget(self.stop_button)
         button_layout.addStretch()
+        self._update_control_buttons()
         self.main_layout.addLayout(button_layout)
 
     def apply_settings(self, settings: dict) -> None:
         self.url_edit.setText(settings.get("url", ""))
         self.count_spin.setValue(settings.get("extraction_count", 50))
+        self.concurrency_spin.setValue(settings.get("concurrency", 1))
         mode = settings.get("mode", 1)
         if mode == 1:
             self.radio_summary_detail.setChecked(True)
@@ -206,6 +271,21 @@ class MainWindow(QMainWindow):
         for cb in self.checkboxes:
             cb.setChecked(cb.text() in stored_cols)
         self.auto_exit = settings.get("auto_exit", False)
+        self.extra_settings = {k: v for k, v in settings.items() if k not in GUI_SETTING_KEYS}
+
+    def current_settings(self) -> dict:
+        settings = dict(self.extra_settings)
+        settings.update({
+            "url": self.url_edit.text(),
+            "extraction_count": self.count_spin.value(),
+            "concurrency": self.concurrency_spin.value(),
+            "mode": self.radio_group.checkedId(),
+            "page_type_index": self.page_type_combo.currentIndex(),
+            "selected_excel_path": self.selected_excel_path,
+            "selected_detail_columns": [cb.text() for cb in self.checkboxes if cb.isChecked()],
+            "auto_exit": self.auto_exit
+        })
+        return settings
 
     def update_detail_checkboxes(self) -> None:
         page_type_index = self.page_type_combo.currentIndex()
@@ -250,7 +330,9 @@ class MainWindow(QMainWindow):
             self.detail_grid.addWidget(cb, row_pos, col_pos)
 
     def select_excel_file(self) -> None:
-        fname, _ = QFileDialog.getOpenFileName(self, "엑셀 파일 선택", "", "Excel Files (*.xlsx *.xls)")
+        fname, _ = QFileDialog.getOpenFileName(
+            self, "엑셀 파일 선택", "",
+            "결과 파일 (*.xlsx *.xls *.parquet *.csv.gz *.csv *.jsonl);;Excel Files (*.xlsx *.xls)")
         if fname:
             self.file_label.setText(os.path.basename(fname))
             self.selected_excel_path = fname
@@ -277,33 +359,91 @@ class MainWindow(QMainWindow):
                 cb.setEnabled(True)
 
     def log(self, msg: str) -> None:
-        self.log_edit.append(msg)
-        self.log_edit.moveCursor(QTextCursor.End)
-        QApplication.processEvents()
+        self.log_edit.appendPlainText(msg)
+
+    def log_events(self, events: list) -> None:
+        """
+        작업 스레드의 EventLog가 보낸 이벤트 묶음을 한 번에 로그 창에 붙입니다.
+        """
+        self.log_edit.appendPlainText("\n".join(event.message for event in events))
+
+    def update_progress(self, update) -> None:
+        """
+        작업 스레드가 보낸 진행 상황(ProgressUpdate)을 진행 막대에 표시합니다.
+        """
+        if update.total:
+            self.progress_bar.setRange(0, update.total)
+            self.progress_bar.setValue(min(update.done, update.total))
+        else:
+            self.progress_bar.setRange(0, 0)
+        self.progress_bar.setFormat(format_progress(update))
+
+    def _start_control(self) -> RunControl:
+        control = RunControl()
+        self.active_controls.append(control)
+        self._update_control_buttons()
+        return control
+
+    def _finish_control(self, control: RunControl) -> None:
+        if control in self.active_controls:
+            self.active_controls.remove(control)
+        self._update_control_buttons()
+
+    def _update_control_buttons(self) -> None:
+        running = bool(self.active_controls)
+        self.pause_button.setEnabled(running and not any(c.cancelled for c in self.active_controls))
+        self.stop_button.setEnabled(running and not all(c.cancelled for c in self.active_controls))
+        paused = running and all(c.paused for c in self.active_controls)
+        self.pause_button.setText("재개" if paused else "일시정지")
+
+    def on_pause_clicked(self) -> None:
+        if all(c.paused for c in self.active_controls):
+            for control in self.active_controls:
+                control.resume()
+            self.log("작업을 재개합니다.")
+        else:
+            for control in self.active_controls:
+                control.pause()
+            self.log("작업을 일시정지합니다. 진행 중인 요청은 마저 받습니다.")
+        self._update_control_buttons()
+
+    def on_stop_clicked(self) -> None:
+        for control in self.active_controls:
+            control.cancel()
+        self.log("작업 중지를 요청했습니다. 진행 중인 요청을 마친 뒤 지금까지의 결과를 저장합니다.")
+        self._update_control_buttons()
 
     def on_run_clicked(self) -> None:
-        mode_id = self.radio_group.checkedId()
-        url_text = self.url_edit.text().strip()
-        excel_path = self.selected_excel_path
-        selected_cols = [cb.text() for cb in self.checkboxes if cb.isChecked()]
-        page_type_index = self.page_type_combo.currentIndex()
-        extraction_count = self.count_spin.value()
+        settings = self.current_settings()
+        settings["url"] = settings["url"].strip()
 
         if self.thread is not None and self.thread.isRunning():
             QMessageBox.warning(self, "안내", "이미 크롤링 작업이 진행 중입니다.")
             return
 
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setFormat("")
         self.progress_bar.setVisible(True)
+        self.run_control = self._start_control()
+        try:
+            self.worker_wrapper = WorkerWrapper(settings, control=self.run_control)
+        except (ValueError, ImportError) as e:
+            # 잘못된 설정(결과 파일 형식 등)이나 설치되지 않은 선택 패키지(pyarrow)는 시작하기 전에 알립니다.
+            self._finish_control(self.run_control)
+            self.progress_bar.setVisible(False)
+            QMessageBox.warning(self, "설정 오류", str(e))
+            return
         self.thread = QThread(self)
-        self.worker_wrapper = WorkerWrapper(mode_id, url_text, excel_path, selected_cols, extraction_count, page_type_index)
         self.worker_wrapper.moveToThread(self.thread)
         self.thread.started.connect(self.worker_wrapper.run)
-        self.worker_wrapper.log_signal.connect(self.log)
+        self.worker_wrapper.log_signal.connect(self.log_events)
+        self.worker_wrapper.progress_signal.connect(self.update_progress)
         self.worker_wrapper.finished_signal.connect(self.on_crawl_finished)
         self.worker_wrapper.finished_signal.connect(self.thread.quit)
         self.thread.start()
 
     def on_crawl_finished(self, result: str) -> None:
+        self._finish_control(self.run_control)
         self.progress_bar.setVisible(False)
         if result.startswith("ERROR:"):
             QMessageBox.warning(self, "에러 발생", result)
@@ -315,15 +455,7 @@ class MainWindow(QMainWindow):
                 QMessageBox.information(self, "작업 완료", f"크롤링이 종료되었습니다.\n결과: {result}")
 
     def save_favorites(self) -> None:
-        settings = {
-            "url": self.url_edit.text(),
-            "extraction_count": self.count_spin.value(),
-            "mode": self.radio_group.checkedId(),
-            "page_type_index": self.page_type_combo.currentIndex(),
-            "selected_excel_path": self.selected_excel_path,
-            "selected_detail_columns": [cb.text() for cb in self.checkboxes if cb.isChecked()],
-            "auto_exit": self.auto_exit
-        }
+        settings = self.current_settings()
         favorites_folder = "favorites"
         os.makedirs(favorites_folder, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -392,7 +524,8 @@ class MainWindow(QMainWindow):
             "[6] 설정 저장 및 불러오기\n"
             "  - 현재 설정(URL, 추출 건수, 모드, 페이지 유형, 선택한 상세 컬럼, 자동 종료)을 favorites 폴더에 저장하고, 불러올 수 있습니다.\n\n"
             "[7] 크롤링 시작\n"
-            "  - 모든 설정 후 하단의 '크롤링 시작' 버튼을 클릭하면 작업이 실행되며, 진행 상황은 로그 창에 표시됩니다.\n\n"
+            "  - 모든 설정 후 하단의 '크롤링 시작' 버튼을 클릭하면 작업이 실행되며, 진행 상황은 로그 창에 표시됩니다.\n"
+            "  - '일시정지'는 새 요청을 멈추고 '재개'로 이어 가며, '중지'는 지금까지의 결과를 저장하고 작업을 끝냅니다.\n\n"
             "※ URL과 선택한 페이지 유형이 일치해야 정상 작동합니다.\n"
         )
         QMessageBox.information(self, "도움말", help_text)
@@ -402,16 +535,22 @@ class MainWindow(QMainWindow):
         if not folder_path:
             QMessageBox.warning(self, "폴더 선택", "폴더를 선택하지 않았습니다.")
             return
+        parallel_jobs, ok = QInputDialog.getInt(self, "동시 작업 수", "동시에 실행할 설정 파일 수:",
+                                                DEFAULT_PARALLEL_JOBS, 1, 8)
+        if not ok:
+            return
         self.multi_thread = QThread(self)
-        self.multi_worker = MultiCrawlerWorker(folder_path)
+        self.multi_control = self._start_control()
+        self.multi_worker = MultiCrawlerWorker(folder_path, parallel_jobs=parallel_jobs, control=self.multi_control)
         self.multi_worker.moveToThread(self.multi_thread)
         self.multi_thread.started.connect(self.multi_worker.run)
-        self.multi_worker.log_signal.connect(self.log)
+        self.multi_worker.log_signal.connect(self.log_events)
         self.multi_worker.finished_signal.connect(self.on_multi_crawl_finished)
         self.multi_worker.finished_signal.connect(self.multi_thread.quit)
         self.multi_thread.start()
 
     def on_multi_crawl_finished(self, result: str) -> None:
+        self._finish_control(self.multi_control)
         if self.auto_exit:
             QMessageBox.information(self, "폴더 크롤링 완료", f"{result}\n프로그램을 종료합니다.")
             QApplication.quit()
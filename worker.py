@@ -1,10 +1,31 @@
 import os
 import json
+from collections import namedtuple
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 from urllib.parse import urlparse, parse_qs
-from PyQt5.QtCore import QObject, pyqtSignal
-from crawler import SummaryCrawler, DetailCrawler
-from excel_handler import make_unique_filename, save_to_excel, crawl_detail_info_from_excel
-from utils import read_json_with_encoding
+from crawler import SummaryCrawler, DetailCrawler, row_id, DEFAULT_PAGE_DISCOVERY
+from http_session import PooledSession, DEFAULT_POOL_SIZE, stats_delta, format_stats
+from scheduler import RequestScheduler, DEFAULT_RATE_LIMIT, DEFAULT_MAX_RETRIES, check_max_retries
+from cache import (ResponseCache, RecordIndex, DEFAULT_CACHE_PATH, DEFAULT_TTL_DAYS, DEFAULT_MAX_MB,
+                   DEFAULT_RECORD_INDEX_PATH, DEFAULT_RECORD_FRESH_HOURS)
+from crawl_state import CrawlState, state_key, DEFAULT_STATE_PATH
+from checkpoint import DetailJournal, checkpoint_path, DEFAULT_CHECKPOINT_EVERY
+from parsers import DEFAULT_PARSER, DEFAULT_SITE, detail_schema
+from excel_handler import (make_unique_filename, save_to_excel, crawl_detail_info_from_excel,
+                           crawl_detail_info_from_rows, summary_columns, summary_sheet_title)
+from output_formats import open_writer, output_extension, check_output_format, DEFAULT_OUTPUT_FORMAT
+from metrics import RunMetrics, format_stage_summary, write_report, start_metrics_server
+from progress import ProgressTracker, DEFAULT_PROGRESS_INTERVAL
+from run_control import RunControl, CrawlCancelled
+
+# 여러 작업이 함께 쓰는 자원 묶음 (일괄 실행기가 작업마다 만들어 넘깁니다):
+#   session: 연결 풀 (thread 백엔드에서만 사용), scheduler: 전체 동시 요청 한도 (rate_limit/max_retries 대신 사용),
+#   cache: 응답 캐시 (cache_path/cache_max_mb 대신 사용), record_index: 상세 레코드 색인 (record_index_path 대신 사용),
+#   metrics: 작업별 실행 지표 (RunMetrics)
+# 넘긴 자원은 만든 쪽이 닫습니다. 작업은 None인 자원만 직접 만들고, 실행이 끝나면 그것만 닫습니다.
+SharedResources = namedtuple("SharedResources", ["session", "scheduler", "cache", "record_index", "metrics"],
+                             defaults=(None, None, None, None, None))
 
 class CrawlerWorker:
     """
@@ -13,7 +34,21 @@ class CrawlerWorker:
     """
     def __init__(self, mode: int, url_text: str, excel_path: str,
                  selected_columns: list, extraction_count: int, page_type_index: int = 0,
-                 log_callback=None):
+                 log_callback=None, concurrency: int = 1, pool_size: int = DEFAULT_POOL_SIZE,
+                 keep_alive: bool = True, backend: str = "thread",
+                 rate_limit: float = DEFAULT_RATE_LIMIT, max_retries: int = DEFAULT_MAX_RETRIES,
+                 use_cache: bool = True, cache_path: str = DEFAULT_CACHE_PATH,
+                 cache_ttl_days: float = DEFAULT_TTL_DAYS, cache_max_mb: int = DEFAULT_MAX_MB,
+                 incremental: bool = False, state_path: str = DEFAULT_STATE_PATH,
+                 resume: bool = False, checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+                 parser: str = DEFAULT_PARSER, parse_workers: int = 0,
+                 use_record_index: bool = True, record_index_path: str = DEFAULT_RECORD_INDEX_PATH,
+                 record_fresh_hours: float = DEFAULT_RECORD_FRESH_HOURS,
+                 page_discovery: str = DEFAULT_PAGE_DISCOVERY,
+                 output_format: str = DEFAULT_OUTPUT_FORMAT, metrics_report: bool = True,
+                 metrics_port: int = 0, shared: SharedResources = None, progress_callback=None,
+                 progress_interval: float = DEFAULT_PROGRESS_INTERVAL, control: RunControl = None,
+                 site: str = DEFAULT_SITE):
         self.mode = mode
         self.url_text = url_text
         self.excel_path = excel_path
@@ -21,10 +56,117 @@ class CrawlerWorker:
         self.page_type_index = page_type_index
         self.extraction_count = extraction_count
         self.log_callback = log_callback
+        self.concurrency = concurrency
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        # "thread": requests + 스레드 풀, "asyncio": aiohttp 이벤트 루프
+        self.backend = backend
+        # 호스트별 초당 요청 수 (0이면 제한 없음)와 요청당 최대 시도 횟수(1 이상, 첫 요청 포함)
+        self.shared = shared if shared is not None else SharedResources()
+        if self.shared.scheduler is None:
+            check_max_retries(max_retries)
+        self.rate_limit = rate_limit
+        self.max_retries = max_retries
+        # 상세 페이지 응답 캐시 (pcNum/bidNum 단위)
+        self.use_cache = use_cache
+        self.cache_path = cache_path
+        self.cache_ttl_days = cache_ttl_days
+        self.cache_max_mb = cache_max_mb
+        # 증분 모드: 이전 실행에서 수집한 항목에 도달하면 목록 탐색을 멈춥니다.
+        self.incremental = incremental
+        self.state_path = state_path
+        # 상세정보 체크포인트: resume이면 이전에 중단된 같은 작업의 저널부터 이어서 실행합니다.
+        self.resume = resume
+        self.checkpoint_every = checkpoint_every
+        # HTML 파서: "lxml"(기본) 또는 "bs4"
+        self.parser = parser
+        # 파서 프로세스 수 (0이면 요청을 처리한 스레드에서 바로 파싱)
+        self.parse_workers = parse_workers
+        # 목록의 마지막 페이지 확인 방식: "pagination"(기본) 또는 "probe"(빈 페이지 탐색)
+        self.page_discovery = page_discovery
+        # 결과 파일 형식: "xlsx"(기본), "parquet", "csv.gz", "jsonl" (parquet은 pyarrow가 없으면 여기서 알립니다)
+        check_output_format(output_format)
+        self.output_format = output_format
+        # 상세 레코드 색인: 최근(record_fresh_hours 이내)에 파싱한 상세 레코드를 재사용합니다.
+        self.use_record_index = use_record_index
+        self.record_index_path = record_index_path
+        self.record_fresh_hours = record_fresh_hours
+        # 실행 지표: 끝날 때 단계별 시간/응답 시간 분포/재시도를 JSON 보고서로 저장하고(metrics_report),
+        # metrics_port가 0이 아니면 실행 중 http://127.0.0.1:<port>/metrics 로 보여 줍니다.
+        self.metrics_report = metrics_report
+        self.metrics_port = metrics_port
+        # 진행 상황(ProgressUpdate: 처리/전체 행 수, 행/초, 요청 중인 수, 남은 시간)을
+        # progress_callback으로 최소 progress_interval초 간격으로 보냅니다.
+        self.progress_callback = progress_callback
+        self.progress_interval = progress_interval
+        # 취소/일시정지 토큰: cancel()하면 목록 페이지/상세 요청 사이에서 멈추고, 그때까지의 결과를 파일로 남깁니다.
+        # 취소된 작업의 상세정보 체크포인트는 지우지 않으므로 resume으로 이어서 실행할 수 있습니다.
+        self.control = control if control is not None else RunControl()
+        # 상세정보 링크를 만들 사이트 (로컬 서버로 측정하는 벤치마크만 바꿉니다)
+        self.site = site
+        self.cancelled = False
+        self.connection_stats = None
+        self.run_report = None
+        self.run_report_path = None
+        self._run_session = None
+        self._run_scheduler = None
+        self._run_cache = None
+        self._run_parse_pool = None
+        self._run_record_index = None
+        self._run_metrics = None
+        self._run_progress = None
+
+    @classmethod
+    def from_settings(cls, settings: dict, log_callback=None, shared: SharedResources = None, progress_callback=None,
+                      progress_interval: float = DEFAULT_PROGRESS_INTERVAL,
+                      control: RunControl = None) -> "CrawlerWorker":
+        """
+        JSON 설정(dict)으로 CrawlerWorker를 생성합니다.
+        shared의 세션은 thread 백엔드에서만 사용하며, asyncio 백엔드는 자체 클라이언트를 씁니다.
+        응답 캐시와 레코드 색인은 use_cache/use_record_index가 false이면 쓰지 않습니다.
+        """
+        backend = settings.get("backend", "thread")
+        if backend != "thread" and shared is not None:
+            shared = shared._replace(session=None)
+        return cls(settings.get("mode", 1),
+                   settings.get("url", ""),
+                   settings.get("selected_excel_path", ""),
+                   settings.get("selected_detail_columns", []),
+                   settings.get("extraction_count", 50),
+                   settings.get("page_type_index", 0),
+                   log_callback=log_callback,
+                   concurrency=settings.get("concurrency", 1),
+                   pool_size=settings.get("pool_size", DEFAULT_POOL_SIZE),
+                   keep_alive=settings.get("keep_alive", True),
+                   backend=backend,
+                   rate_limit=settings.get("rate_limit", DEFAULT_RATE_LIMIT),
+                   max_retries=settings.get("max_retries", DEFAULT_MAX_RETRIES),
+                   use_cache=settings.get("use_cache", True),
+                   cache_path=settings.get("cache_path", DEFAULT_CACHE_PATH),
+                   cache_ttl_days=settings.get("cache_ttl_days", DEFAULT_TTL_DAYS),
+                   cache_max_mb=settings.get("cache_max_mb", DEFAULT_MAX_MB),
+                   incremental=settings.get("incremental", False),
+                   state_path=settings.get("state_path", DEFAULT_STATE_PATH),
+                   resume=settings.get("resume", False),
+                   checkpoint_every=settings.get("checkpoint_every", DEFAULT_CHECKPOINT_EVERY),
+                   parser=settings.get("parser", DEFAULT_PARSER),
+                   parse_workers=settings.get("parse_workers", 0),
+                   use_record_index=settings.get("use_record_index", True),
+                   record_index_path=settings.get("record_index_path", DEFAULT_RECORD_INDEX_PATH),
+                   record_fresh_hours=settings.get("record_fresh_hours", DEFAULT_RECORD_FRESH_HOURS),
+                   page_discovery=settings.get("page_discovery", DEFAULT_PAGE_DISCOVERY),
+                   output_format=settings.get("output_format", DEFAULT_OUTPUT_FORMAT),
+                   metrics_report=settings.get("metrics_report", True),
+                   metrics_port=settings.get("metrics_port", 0),
+                   shared=shared,
+                   progress_callback=progress_callback,
+                   progress_interval=progress_interval,
+                   control=control,
+                   site=settings.get("site", DEFAULT_SITE))
 
-    def _log(self, msg: str) -> None:
+    def _log(self, msg: str, level: str = "info") -> None:
         if self.log_callback:
-            self.log_callback(msg)
+            self.log_callback(msg, level)
 
     def _make_auto_url(self) -> str:
         base = "https://www.k-apt.go.kr"
@@ -64,6 +206,166 @@ class CrawlerWorker:
                 return False
 
     def run(self) -> str:
+        shared = self.shared
+        owns_session = shared.session is None
+        if owns_session:
+            self._run_session = self._make_session()
+        else:
+            self._run_session = shared.session
+        owns_scheduler = shared.scheduler is None
+        if not owns_scheduler:
+            self._run_scheduler = shared.scheduler
+        else:
+            self._run_scheduler = RequestScheduler(rate_limit=self.rate_limit, max_retries=self.max_retries,
+                                                   max_concurrency=self.concurrency, log_callback=self._log)
+        owns_cache = self.use_cache and shared.cache is None
+        if owns_cache:
+            self._run_cache = ResponseCache(self.cache_path, ttl_seconds=self.cache_ttl_days * 86400,
+                                            max_bytes=self.cache_max_mb * 1024 * 1024)
+        elif self.use_cache:
+            self._run_cache = shared.cache
+        if self.parse_workers > 0:
+            workers = min(self.parse_workers, os.cpu_count() or 1)
+            self._run_parse_pool = ProcessPoolExecutor(max_workers=workers)
+            self._log(f"파서 프로세스 수: {workers}")
+        owns_record_index = self.use_record_index and shared.record_index is None
+        if owns_record_index:
+            self._run_record_index = RecordIndex(self.record_index_path,
+                                                 fresh_seconds=self.record_fresh_hours * 3600)
+        elif self.use_record_index:
+            self._run_record_index = shared.record_index
+        self._run_metrics = shared.metrics if shared.metrics is not None else RunMetrics()
+        run_metrics = self._run_metrics
+        self._run_progress = ProgressTracker(self.progress_callback, self.progress_interval,
+                                             in_flight=lambda: run_metrics.in_flight)
+        metrics_server = start_metrics_server(self.metrics_port, self.live_snapshot, self._log)
+        index_before = self._run_record_index.stats() if self._run_record_index else None
+        stats_before = self._run_session.stats()
+        report = {}
+        try:
+            report["result"] = self._run_mode()
+            return report["result"]
+        except CrawlCancelled as e:
+            self.cancelled = True
+            report["cancelled"] = True
+            report["result"] = e.output_path
+            self._log("작업이 취소되었습니다.")
+            return f"취소됨: {e.output_path}" if e.output_path else "취소됨"
+        except Exception as e:
+            report["error"] = str(e)
+            raise
+        finally:
+            self._run_progress.finish()
+            self._run_progress = None
+            self.connection_stats = stats_delta(stats_before, self._run_session.stats())
+            if owns_scheduler:
+                self.connection_stats.update(self._run_scheduler.stats())
+                self._log(f"연결 통계: {format_stats(self.connection_stats)}, "
+                          f"재시도 {self.connection_stats['retries']}회")
+            else:
+                # 공유 스케줄러의 재시도 횟수는 작업별로 나눌 수 없어 일괄 실행 통계에서만 보고합니다.
+                self._log(f"연결 통계: {format_stats(self.connection_stats)}")
+            report["connections"] = self.connection_stats
+            if self._run_cache:
+                cache_stats = self._run_cache.stats()
+                self._log(f"캐시: 적중 {cache_stats['hits']}건, 미적중 {cache_stats['misses']}건")
+                report["cache"] = {"hits": cache_stats["hits"], "misses": cache_stats["misses"]}
+                if owns_cache:
+                    self._run_cache.close()
+                self._run_cache = None
+            if self._run_record_index:
+                index_stats = self._run_record_index.stats()
+                report["record_index"] = {"hits": index_stats["hits"] - index_before["hits"],
+                                          "misses": index_stats["misses"] - index_before["misses"]}
+                self._log(f"레코드 색인: 재사용 {report['record_index']['hits']}건, "
+                          f"새로 수집 {report['record_index']['misses']}건")
+                if owns_record_index:
+                    self._run_record_index.close()
+                self._run_record_index = None
+            if owns_session:
+                self._run_session.close()
+            if self._run_parse_pool:
+                self._run_parse_pool.shutdown(cancel_futures=True)
+                self._run_parse_pool = None
+            if metrics_server:
+                metrics_server.stop()
+            self._finish_report(report)
+
+    def live_snapshot(self) -> dict:
+        """
+        실행 중 지표 엔드포인트 응답: 실행 지표에 현재 진행 상황("progress")을 더합니다. (실행 중이 아니면 빈 dict)
+        """
+        metrics, progress = self._run_metrics, self._run_progress
+        snapshot = metrics.snapshot() if metrics else {}
+        if progress:
+            snapshot["progress"] = progress.snapshot()._asdict()
+        return snapshot
+
+    def _finish_report(self, report: dict) -> None:
+        """
+        실행 지표를 모아 run_report에 남기고, metrics_report가 켜져 있으면 JSON 보고서로 저장합니다.
+        """
+        snapshot = self._run_metrics.snapshot()
+        self._log(f"단계별 시간: {format_stage_summary(snapshot)}")
+        self.run_report = {
+            "job": {"mode": self.mode, "page_type_index": self.page_type_index, "url": self.url_text,
+                    "backend": self.backend, "parser": self.parser, "concurrency": self.concurrency,
+                    "output_format": self.output_format},
+            "started_at": snapshot["started_at"],
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+            "elapsed_seconds": snapshot["elapsed_seconds"],
+            **report,
+            "stages": snapshot["stages"],
+            "requests": snapshot["requests"],
+        }
+        self._run_metrics = None
+        if not self.metrics_report:
+            return
+        self.run_report_path = make_unique_filename("실행지표", "실행지표", ".json")
+        try:
+            write_report(self.run_report_path, self.run_report)
+            self._log(f"실행 지표 저장: {self.run_report_path}")
+        except OSError as e:
+            self._log(f"실행 지표 저장 실패: {e}", "error")
+
+    def _make_session(self):
+        if self.backend == "asyncio":
+            from async_crawler import AsyncHttpClient
+            return AsyncHttpClient(max_in_flight=max(self.pool_size, self.concurrency), keep_alive=self.keep_alive)
+        if self.backend != "thread":
+            raise ValueError(f"지원되지 않는 백엔드: {self.backend}")
+        return PooledSession(pool_size=max(self.pool_size, self.concurrency), keep_alive=self.keep_alive)
+
+    def _make_summary_crawler(self, final_url: str) -> SummaryCrawler:
+        if self.backend == "asyncio":
+            from async_crawler import AsyncSummaryCrawler
+            return AsyncSummaryCrawler(final_url, page_type_index=self.page_type_index, client=self._run_session,
+                                       scheduler=self._run_scheduler, parser=self.parser,
+                                       parse_pool=self._run_parse_pool, page_discovery=self.page_discovery,
+                                       metrics=self._run_metrics, control=self.control, site=self.site)
+        return SummaryCrawler(final_url, page_type_index=self.page_type_index, session=self._run_session,
+                              scheduler=self._run_scheduler, parser=self.parser, parse_pool=self._run_parse_pool,
+                              page_discovery=self.page_discovery, metrics=self._run_metrics,
+                              control=self.control, site=self.site)
+
+    def _make_detail_crawler(self) -> DetailCrawler:
+        # 선택한 상세 컬럼(과 결과 행에서 목록 값을 덮어쓰는 컬럼)만 상세 페이지에서 추출합니다.
+        columns = detail_schema(self.page_type_index).needed_columns(self.selected_columns,
+                                                                     summary_columns(self.page_type_index))
+        if self.backend == "asyncio":
+            from async_crawler import AsyncDetailCrawler
+            return AsyncDetailCrawler(page_type_index=self.page_type_index, client=self._run_session,
+                                      scheduler=self._run_scheduler, cache=self._run_cache,
+                                      parser=self.parser, parse_pool=self._run_parse_pool, columns=columns,
+                                      record_index=self._run_record_index, metrics=self._run_metrics,
+                                      control=self.control)
+        return DetailCrawler(page_type_index=self.page_type_index, session=self._run_session,
+                             scheduler=self._run_scheduler, cache=self._run_cache, parser=self.parser,
+                             parse_pool=self._run_parse_pool, columns=columns,
+                             record_index=self._run_record_index, metrics=self._run_metrics,
+                             control=self.control)
+
+    def _run_mode(self) -> str:
         if self.mode == 1:
             return self._run_summary_plus_detail()
         elif self.mode == 2:
@@ -71,101 +373,153 @@ class CrawlerWorker:
         elif self.mode == 3:
             return self._run_detail_only()
         else:
-            self._log(f"지원되지 않는 모드: {self.mode}")
+            self._log(f"지원되지 않는 모드: {self.mode}", "error")
             raise ValueError(f"지원되지 않는 모드: {self.mode}")
 
+    def _iter_summary(self, final_url: str):
+        stop_ids = None
+        if self.incremental:
+            stop_ids = CrawlState(self.state_path).seen_ids(state_key(self.page_type_index, final_url, self.mode))
+            self._log(f"증분 모드: 이전 수집 기록 {len(stop_ids)}건 기준으로 새 항목만 수집합니다.")
+        summary_crawler = self._make_summary_crawler(final_url)
+        return summary_crawler.iter_rows(final_url, log_callback=self._log, max_items=self.extraction_count,
+                                         max_workers=self.concurrency, stop_ids=stop_ids,
+                                         progress=self._run_progress)
+
+    def _open_journal(self, source: str) -> DetailJournal:
+        identity = {"mode": self.mode, "source": source, "page_type_index": self.page_type_index,
+                    "selected_columns": self.selected_columns, "extraction_count": self.extraction_count}
+        journal = DetailJournal(checkpoint_path(identity), resume=self.resume, every=self.checkpoint_every)
+        if self.resume:
+            self._log(f"체크포인트에서 완료된 상세정보 {len(journal)}건을 불러왔습니다.")
+        return journal
+
+    def _close_journal(self, journal: DetailJournal, completed: bool) -> None:
+        """
+        결과 파일까지 저장되면 저널을 지우고, 아니면 다음 실행에서 이어갈 수 있도록 남겨 둡니다.
+        """
+        if completed:
+            journal.discard()
+        else:
+            journal.close()
+            self._log(f"체크포인트 저장됨: {journal.path} (resume 옵션으로 이어서 실행할 수 있습니다)")
+
+    def _save_state(self, final_url: str, new_ids: list, failed_ids: set = ()) -> None:
+        """
+        증분 모드에서 결과 저장까지 끝난 경우에만 수집 기록을 갱신합니다.
+        new_ids는 최신순이므로, 상세정보가 실패한 항목이 있으면 가장 오래된 실패 항목보다 오래된 ID만 기록합니다.
+        다음 실행은 그 지점까지 다시 내려가 실패한 항목(과 그보다 최신 항목)을 다시 수집합니다.
+        """
+        if not self.incremental:
+            return
+        failed_positions = [i for i, row_key in enumerate(new_ids) if row_key in failed_ids]
+        if failed_positions:
+            new_ids = new_ids[failed_positions[-1] + 1:]
+            self._log(f"상세정보 실패 {len(failed_positions)}건은 다음 증분 실행에서 다시 수집합니다.")
+        CrawlState(self.state_path).update(state_key(self.page_type_index, final_url, self.mode), new_ids)
+
+    def _summary_filename(self) -> str:
+        return make_unique_filename(extension=output_extension(self.output_format))
+
     def _run_summary_plus_detail(self) -> str:
         final_url = self._get_final_url()
         if not final_url:
-            self._log("URL이 없습니다.")
+            self._log("URL이 없습니다.", "error")
             raise ValueError("URL이 비어있음.")
         self._log("[전체 페이지 + 상세정보] 크롤링을 시작합니다...")
-        summary_crawler = SummaryCrawler(final_url, page_type_index=self.page_type_index)
-        all_data = summary_crawler.crawl_all_pages(final_url, log_callback=self._log, max_items=self.extraction_count)
-        if not all_data:
+        # 목록 행이 나오는 즉시 상세 요청을 시작하고, 목록 데이터는 지나가는 길에 목록 파일에 기록합니다.
+        summary_filename = self._summary_filename()
+        summary_writer = open_writer(summary_filename, summary_columns(self.page_type_index),
+                                     sheet_title=summary_sheet_title(self.page_type_index),
+                                     metrics=self._run_metrics)
+        new_ids = []
+
+        def _collect(rows):
+            for row in rows:
+                summary_writer.write_row(row)
+                new_ids.append(row_id(row))
+                yield row
+
+        detail_crawler = self._make_detail_crawler()
+        journal = self._open_journal(final_url)
+        detail_output_path = None
+        failed_rows = []
+        self._log("목록 수집과 동시에 상세정보 크롤링을 진행합니다...")
+        try:
+            detail_output_path = crawl_detail_info_from_rows(_collect(self._iter_summary(final_url)),
+                                                             self.selected_columns, detail_crawler,
+                                                             log_callback=self._log,
+                                                             page_type_index=self.page_type_index,
+                                                             max_workers=self.concurrency, journal=journal,
+                                                             output_format=self.output_format,
+                                                             metrics=self._run_metrics,
+                                                             progress=self._run_progress, failed_rows=failed_rows)
+        except CrawlCancelled:
+            if summary_writer.rows_written:
+                self._log(f"취소 전까지의 목록 {summary_writer.rows_written}건을 저장했습니다: {summary_filename}")
+            raise
+        finally:
+            # 취소된 경우에도 지금까지 수집한 목록은 파일로 남깁니다.
+            summary_writer.close()
+            if not summary_writer.rows_written:
+                os.remove(summary_filename)
+            self._close_journal(journal, completed=bool(detail_output_path))
+        if not summary_writer.rows_written:
             self._log("크롤링할 데이터가 없습니다.")
             return "완료: 데이터 없음"
-        summary_filename = make_unique_filename()
-        save_to_excel(all_data, summary_filename, page_type_index=self.page_type_index)
         self._log(f"전체 페이지 크롤링 완료. 파일 저장: {summary_filename}")
-        detail_crawler = DetailCrawler(page_type_index=self.page_type_index)
-        detail_output_path = crawl_detail_info_from_excel(summary_filename, self.selected_columns, 
-                                                          detail_crawler, log_callback=self._log, 
-                                                          page_type_index=self.page_type_index)
         if detail_output_path:
             self._log(f"상세 정보 크롤링 완료. 결과 파일: {detail_output_path}")
+            self._save_state(final_url, new_ids, {row_id(row) for row in failed_rows})
         return detail_output_path if detail_output_path else "상세 정보 없음"
 
     def _run_summary_only(self) -> str:
         final_url = self._get_final_url()
         if not final_url:
-            self._log("URL이 없습니다.")
+            self._log("URL이 없습니다.", "error")
             raise ValueError("URL이 비어있음.")
         self._log("[전체 페이지만] 크롤링을 시작합니다...")
-        summary_crawler = SummaryCrawler(final_url, page_type_index=self.page_type_index)
-        all_data = summary_crawler.crawl_all_pages(final_url, log_callback=self._log, max_items=self.extraction_count)
+        all_data = []
+        try:
+            for row in self._iter_summary(final_url):
+                all_data.append(row)
+        except CrawlCancelled as e:
+            # 취소 전까지 수집한 목록을 저장합니다. (증분 수집 기록은 갱신하지 않습니다)
+            if all_data:
+                e.output_path = self._summary_filename()
+                save_to_excel(all_data, e.output_path, page_type_index=self.page_type_index,
+                              metrics=self._run_metrics)
+                self._log(f"취소 전까지의 목록 {len(all_data)}건을 저장했습니다: {e.output_path}")
+            raise
         if not all_data:
             self._log("크롤링할 데이터가 없습니다.")
             return "완료: 데이터 없음"
-        summary_filename = make_unique_filename()
-        save_to_excel(all_data, summary_filename, page_type_index=self.page_type_index)
+        summary_filename = self._summary_filename()
+        save_to_excel(all_data, summary_filename, page_type_index=self.page_type_index, metrics=self._run_metrics)
         self._log(f"전체 페이지 크롤링 완료. 파일 저장: {summary_filename}")
+        self._save_state(final_url, [row_id(row) for row in all_data])
         return summary_filename
 
     def _run_detail_only(self) -> str:
         if not self.excel_path or not os.path.exists(self.excel_path):
-            self._log(f"엑셀 파일이 존재하지 않습니다: {self.excel_path}")
-            raise ValueError("엑셀 파일 경로 문제")
+            self._log(f"입력 파일이 존재하지 않습니다: {self.excel_path}", "error")
+            raise ValueError("입력 파일 경로 문제")
         self._log("[기존 엑셀 -> 상세정보] 크롤링을 시작합니다...")
-        detail_crawler = DetailCrawler(page_type_index=self.page_type_index)
-        detail_output_path = crawl_detail_info_from_excel(self.excel_path, self.selected_columns, 
-                                                          detail_crawler, log_callback=self._log, 
-                                                          page_type_index=self.page_type_index)
+        detail_crawler = self._make_detail_crawler()
+        journal = self._open_journal(os.path.abspath(self.excel_path))
+        detail_output_path = None
+        try:
+            detail_output_path = crawl_detail_info_from_excel(self.excel_path, self.selected_columns,
+                                                              detail_crawler, log_callback=self._log,
+                                                              page_type_index=self.page_type_index,
+                                                              max_workers=self.concurrency, journal=journal,
+                                                              output_format=self.output_format,
+                                                              metrics=self._run_metrics,
+                                                              progress=self._run_progress)
+        finally:
+            self._close_journal(journal, completed=bool(detail_output_path))
         if detail_output_path:
             self._log(f"상세 정보 크롤링 완료. 결과 파일: {detail_output_path}")
             return detail_output_path
         else:
             return "상세정보 크롤링 실패 또는 데이터 없음"
-
-class MultiCrawlerWorker(QObject):
-    """
-    폴더 내 다수의 JSON 설정 파일을 읽어 순차적으로 크롤링 작업을 실행합니다.
-    """
-    log_signal = pyqtSignal(str)
-    finished_signal = pyqtSignal(str)
-
-    def __init__(self, folder_path: str):
-        super().__init__()
-        self.folder_path = folder_path
-
-    def _log(self, msg: str) -> None:
-        self.log_signal.emit(msg)
-
-    def run(self) -> None:
-        results = {}
-        json_files = [os.path.join(self.folder_path, f) for f in os.listdir(self.folder_path) if f.endswith('.json')]
-        if not json_files:
-            self._log("선택한 폴더에 JSON 파일이 없습니다.")
-            self.finished_signal.emit("실행된 크롤링 없음")
-            return
-        for json_file in json_files:
-            try:
-                settings = read_json_with_encoding(json_file)
-            except Exception as e:
-                self._log(f"파일 {json_file} 읽기 실패: {e}")
-                continue
-            self._log(f"설정 파일 처리 중: {os.path.basename(json_file)}")
-            mode = settings.get("mode", 1)
-            url_text = settings.get("url", "")
-            excel_path = settings.get("selected_excel_path", "")
-            selected_columns = settings.get("selected_detail_columns", [])
-            extraction_count = settings.get("extraction_count", 50)
-            page_type_index = settings.get("page_type_index", 0)
-            worker = CrawlerWorker(mode, url_text, excel_path, selected_columns, extraction_count, page_type_index, log_callback=self._log)
-            try:
-                result = worker.run()
-                self._log(f"크롤링 완료 ({os.path.basename(json_file)}): 결과 파일 -> {result}")
-                results[os.path.basename(json_file)] = result
-            except Exception as e:
-                self._log(f"크롤링 실패 ({os.path.basename(json_file)}): {e}")
-        self.finished_signal.emit("모든 크롤링 작업 완료")